@@ -0,0 +1,287 @@
+"""Benchmark the CDC merge engines on synthetic data, without SQL Server.
+
+Generates a current-state table with a composite primary key and CDC batches with a configurable
+insert / update / delete mix and hot-key skew, then runs every engine on it and reports its
+wall time and peak RSS, and whether its output matches a reference implementation:
+
+- lazy: `apply_cdc_batches` over a scan of the current state (`process_cdc_changes`, collected with the streaming engine)
+- merge: `merge_cdc_batches` into a Delta table (`merge_cdc_changes`, a Delta Lake MERGE of the collapsed changes)
+- spill: `spill_merge_cdc_batches` into a Delta table, out of core within `--spill-memory-mb`
+
+```bash
+uv run python benchmarks/bench_process_cdc_changes.py --rows 1000000 --change-ratio 0.01 --mix 0.2 0.7 0.1
+uv run python benchmarks/bench_process_cdc_changes.py --rows 100000000 --batches 10 --hot-fraction 0.001 --hot-share 0.8 --no-check
+uv run python benchmarks/bench_process_cdc_changes.py --rows 10000000 --change-ratio 0.2 --batches 20 --engines spill --spill-memory-mb 256
+```
+
+Every engine runs in its own process, so the peak RSS of one does not hide the other.
+The synthetic data is written to a temporary directory first and is not part of the measurements.
+"""
+
+import argparse
+import multiprocessing
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import polars as pl
+
+INDICES = ["region_id", "order_id"]
+NUM_REGIONS = 16
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process (ru_maxrss is in KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def generate_rows(keys: pl.DataFrame, seed: int) -> pl.DataFrame:
+    """Generate the value columns of the rows with the given keys."""
+    n = len(keys)
+    return keys.with_columns(
+        amount=(pl.int_range(n) * 7919 + seed).mod(100_000).cast(pl.Float64) / 100,
+        status=pl.lit("status-")
+        + (pl.int_range(n) + seed).mod(5).cast(pl.String),
+        updated_at=pl.lit(1_700_000_000_000_000 + seed).cast(pl.Datetime("us")),
+    )
+
+
+def generate_current(rows: int) -> pl.DataFrame:
+    """Generate the current state of the table."""
+    ids = pl.int_range(rows, eager=True)
+    keys = pl.DataFrame(
+        {"region_id": (ids % NUM_REGIONS).cast(pl.Int32), "order_id": ids // NUM_REGIONS}
+    )
+    return generate_rows(keys, seed=0)
+
+
+def sample_existing_keys(
+    current: pl.DataFrame, n: int, hot_fraction: float, hot_share: float, seed: int
+) -> pl.DataFrame:
+    """Sample `n` keys of existing rows, `hot_share` of them from the `hot_fraction` hottest keys."""
+    n_hot = int(n * hot_share)
+    hot_keys = current.select(INDICES).head(max(int(len(current) * hot_fraction), 1))
+
+    return pl.concat(
+        [
+            hot_keys.sample(n_hot, with_replacement=True, seed=seed),
+            current.select(INDICES).sample(n - n_hot, with_replacement=True, seed=seed + 1),
+        ]
+    )
+
+
+def generate_batches(
+    current: pl.DataFrame,
+    change_ratio: float,
+    mix: tuple[float, float, float],
+    batches: int,
+    hot_fraction: float,
+    hot_share: float,
+    seed: int,
+) -> list[pl.DataFrame]:
+    """Generate CDC batches in LSN order, with an insert / update / delete mix over the batches."""
+    changes_per_batch = max(int(len(current) * change_ratio / batches), 1)
+    next_order_id = current["order_id"].max() + 1
+
+    cdc_batches = []
+    lsn = 0
+    for batch in range(batches):
+        batch_seed = seed + batch * 10
+        n_inserts = int(changes_per_batch * mix[0])
+        n_updates = int(changes_per_batch * mix[1])
+        n_deletes = changes_per_batch - n_inserts - n_updates
+
+        inserted = pl.DataFrame(
+            {
+                "region_id": (pl.int_range(n_inserts, eager=True) % NUM_REGIONS).cast(pl.Int32),
+                "order_id": pl.int_range(next_order_id, next_order_id + n_inserts, eager=True),
+            }
+        )
+        next_order_id += n_inserts
+
+        changes = pl.concat(
+            [
+                generate_rows(inserted, batch_seed).with_columns(
+                    pl.lit(2, pl.Int32).alias("__$operation")
+                ),
+                generate_rows(
+                    sample_existing_keys(current, n_updates, hot_fraction, hot_share, batch_seed),
+                    batch_seed + 1,
+                ).with_columns(pl.lit(4, pl.Int32).alias("__$operation")),
+                generate_rows(
+                    sample_existing_keys(current, n_deletes, hot_fraction, hot_share, batch_seed + 2),
+                    batch_seed + 2,
+                ).with_columns(pl.lit(1, pl.Int32).alias("__$operation")),
+            ]
+        ).sample(fraction=1.0, shuffle=True, seed=batch_seed)
+
+        # Several changes share a transaction (start LSN), ordered within it by their sequence value
+        changes = changes.with_columns(
+            (pl.int_range(pl.len()) // 8 + lsn).alias("__$start_lsn"),
+            pl.int_range(pl.len()).alias("__$seqval"),
+        )
+        lsn += len(changes)
+
+        cdc_batches.append(
+            changes.select("__$start_lsn", "__$seqval", "__$operation", *current.columns)
+        )
+
+    return cdc_batches
+
+
+def reference_final_rows(cdc_batches: list[pl.DataFrame]) -> dict:
+    """The final row of every changed key (None when deleted), applying the changes one by one."""
+    final = {}
+    for cdc_df in cdc_batches:
+        for row in cdc_df.sort("__$start_lsn", "__$seqval", maintain_order=True).iter_rows(
+            named=True
+        ):
+            key = tuple(row[col] for col in INDICES)
+            operation = row.pop("__$operation")
+            row.pop("__$start_lsn")
+            row.pop("__$seqval")
+
+            final[key] = None if operation == 1 else row
+
+    return final
+
+
+def check_output(
+    current: pl.DataFrame, cdc_batches: list[pl.DataFrame], result: pl.DataFrame
+) -> str:
+    """Compare the output of an engine with the reference implementation."""
+    final = reference_final_rows(cdc_batches)
+    changed_keys = pl.DataFrame(
+        [list(key) for key in final], schema=current.select(INDICES).schema, orient="row"
+    )
+
+    expected_changed = pl.DataFrame(
+        [row for row in final.values() if row is not None], schema=current.schema, orient="row"
+    ).sort(INDICES)
+    expected_unchanged = current.join(changed_keys, on=INDICES, how="anti").sort(INDICES)
+
+    result = result.select(current.columns)
+    actual_changed = result.join(changed_keys, on=INDICES, how="semi").sort(INDICES)
+    actual_unchanged = result.join(changed_keys, on=INDICES, how="anti").sort(INDICES)
+
+    if result.select(INDICES).is_duplicated().any():
+        return "FAIL (duplicate keys)"
+    if not actual_changed.equals(expected_changed):
+        return "FAIL (changed rows differ)"
+    if not actual_unchanged.equals(expected_unchanged):
+        return "FAIL (unchanged rows differ)"
+
+    return "ok"
+
+
+def run_engine(engine: str, workdir: str, num_batches: int, spill_memory_mb: int, queue):
+    from cdc_dagster.assets.delta_assets import apply_cdc_batches, merge_cdc_batches
+    from cdc_dagster.utils.spill import spill_merge_cdc_batches
+
+    cdc_batches = [
+        pl.read_parquet(Path(workdir) / f"changes_{batch}.parquet")
+        for batch in range(num_batches)
+    ]
+
+    start = time.perf_counter()
+    if engine == "lazy":
+        result, _ = apply_cdc_batches(
+            pl.scan_parquet(Path(workdir) / "current.parquet"), cdc_batches, INDICES
+        )
+        elapsed = time.perf_counter() - start
+        result.write_parquet(Path(workdir) / "result_lazy.parquet")
+    elif engine == "merge":
+        merge_cdc_batches(str(Path(workdir) / "delta_merge"), cdc_batches, INDICES)
+        elapsed = time.perf_counter() - start
+    else:
+        spill_merge_cdc_batches(
+            str(Path(workdir) / "delta_spill"), cdc_batches, INDICES, spill_memory_mb
+        )
+        elapsed = time.perf_counter() - start
+
+    queue.put((elapsed, peak_rss_mb()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--change-ratio", type=float, default=0.01)
+    parser.add_argument(
+        "--mix",
+        type=float,
+        nargs=3,
+        default=[0.2, 0.7, 0.1],
+        metavar=("INSERT", "UPDATE", "DELETE"),
+    )
+    parser.add_argument("--batches", type=int, default=1)
+    parser.add_argument("--hot-fraction", type=float, default=0.01)
+    parser.add_argument("--hot-share", type=float, default=0.5)
+    parser.add_argument(
+        "--engines", nargs="+", default=["lazy", "merge", "spill"], choices=["lazy", "merge", "spill"]
+    )
+    parser.add_argument("--spill-memory-mb", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--check", action=argparse.BooleanOptionalAction, default=True)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_cdc_")
+    try:
+        current = generate_current(args.rows)
+        cdc_batches = generate_batches(
+            current,
+            args.change_ratio,
+            tuple(args.mix),
+            args.batches,
+            args.hot_fraction,
+            args.hot_share,
+            args.seed,
+        )
+
+        current.write_parquet(Path(workdir) / "current.parquet")
+        for batch, cdc_df in enumerate(cdc_batches):
+            cdc_df.write_parquet(Path(workdir) / f"changes_{batch}.parquet")
+        for engine in ["merge", "spill"]:
+            if engine in args.engines:
+                current.write_delta(Path(workdir) / f"delta_{engine}")
+
+        num_changes = sum(len(cdc_df) for cdc_df in cdc_batches)
+        print(
+            f"{args.rows} rows, {num_changes} changes in {args.batches} batches (mix {args.mix}, "
+            f"{args.hot_share:.0%} on {args.hot_fraction:.1%} hot keys)"
+        )
+        print(f"{'engine':<8}{'wall (s)':>10}{'changes/s':>14}{'peak RSS (MB)':>16}  check")
+
+        context = multiprocessing.get_context("spawn")
+        for engine in args.engines:
+            queue = context.Queue()
+            process = context.Process(
+                target=run_engine,
+                args=(engine, workdir, args.batches, args.spill_memory_mb, queue),
+            )
+            process.start()
+            process.join()
+            if process.exitcode != 0:
+                print(f"{engine:<8}failed with exit code {process.exitcode}")
+                continue
+            elapsed, peak = queue.get()
+
+            check = "skipped"
+            if args.check:
+                result = (
+                    pl.read_parquet(Path(workdir) / "result_lazy.parquet")
+                    if engine == "lazy"
+                    else pl.read_delta(str(Path(workdir) / f"delta_{engine}"))
+                )
+                check = check_output(current, cdc_batches, result)
+
+            print(f"{engine:<8}{elapsed:>10.2f}{num_changes / elapsed:>14.0f}{peak:>16.0f}  {check}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
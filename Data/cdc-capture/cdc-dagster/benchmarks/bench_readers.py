@@ -0,0 +1,87 @@
+"""Benchmark the SQL Server reader backends of the SQLServerCDCResource.
+
+Runs the full table read (`get_full_table_data`) and the CDC read (`iter_table_changes`,
+from the minimum LSN of the capture instance) with every reader backend and reports the
+wall time, throughput and peak RSS of each run.
+
+Run it against a local SQL Server container, seeded with the scripts in `../*.sql`:
+
+```bash
+docker run -e ACCEPT_EULA=Y -e MSSQL_SA_PASSWORD='<password>' -p 1433:1433 -d mcr.microsoft.com/mssql/server:2022-latest
+
+export SQL_SERVER_HOST=localhost SQL_SERVER_USER=sa SQL_SERVER_PASSWORD='<password>' SQL_SERVER_DATABASE=main
+uv run --extra arrow python benchmarks/bench_readers.py --table Orders --repeat 3
+```
+
+Every backend runs in its own process, so the peak RSS of one does not hide the other.
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+
+from cdc_dagster.resources.readers import READER_BACKENDS
+from cdc_dagster.resources.sql_server_cdc import SQLServerCDCConfig, SQLServerCDCResource
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process (ru_maxrss is in KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(backend: str, case: str, table_name: str, batch_size: int, queue):
+    sql_server_cdc = SQLServerCDCResource(SQLServerCDCConfig(reader_backend=backend))
+
+    start = time.perf_counter()
+    if case == "full":
+        num_rows = len(sql_server_cdc.get_full_table_data(table_name))
+    else:
+        min_lsn = sql_server_cdc.get_min_lsn(
+            sql_server_cdc.get_capture_instance_name("dbo", table_name)
+        )
+        batches, _ = sql_server_cdc.iter_table_changes(
+            table_name, sql_server_cdc.lsn_to_hex_string(min_lsn), chunksize=batch_size
+        )
+        num_rows = sum(len(batch) for batch in batches)
+
+    queue.put((num_rows, time.perf_counter() - start, peak_rss_mb()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--table", default="Orders")
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--backends", nargs="+", default=list(READER_BACKENDS), choices=list(READER_BACKENDS)
+    )
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'case':<8}{'backend':<12}{'rows':>12}{'best (s)':>12}{'rows/s':>14}{'peak RSS (MB)':>16}")
+
+    for case in ["full", "changes"]:
+        for backend in args.backends:
+            results = []
+            for _ in range(args.repeat):
+                queue = context.Queue()
+                process = context.Process(
+                    target=run_case,
+                    args=(backend, case, args.table, args.batch_size, queue),
+                )
+                process.start()
+                results.append(queue.get())
+                process.join()
+
+            num_rows, best, _ = min(results, key=lambda result: result[1])
+            peak = max(result[2] for result in results)
+            print(
+                f"{case:<8}{backend:<12}{num_rows:>12}{best:>12.2f}{num_rows / best:>14.0f}{peak:>16.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,24 @@ from dagster import asset, AssetExecutionContext
 import polars as pl
 import os
 from cdc_dagster.constants import PATH_DELTA, LSN_DEFAULT
+from cdc_dagster.resources.projection import ColumnProjection
 from cdc_dagster.resources.sql_server_cdc import SQLServerCDCResource
-from cdc_dagster.utils.delta_helpers import process_cdc_changes
+from cdc_dagster.utils.delta_helpers import (
+    collapse_cdc_changes,
+    merge_cdc_changes,
+    process_cdc_changes,
+)
+from cdc_dagster.utils.checkpoints import CheckpointStore
+from cdc_dagster.utils.metrics import CDCRunMetrics, emit_metrics
+from cdc_dagster.utils.partitioning import DeltaPartitionSpec
+from cdc_dagster.utils.schema_evolution import SchemaChanges, evolve_delta_schema
+from cdc_dagster.utils.spill import spill_merge_cdc_batches
 import dagster as dg
 from dagster_delta import MergeType
-from typing import List
+from deltalake import DeltaTable
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 class BaseDeltaAsset:
@@ -19,15 +32,7 @@ class BaseDeltaAsset:
 
     def get_last_lsn(self, context: AssetExecutionContext):
         """Get the last processed LSN from metadata."""
-        try:
-            # Try to get the dynamic partition using the current API
-            partition_key = f"{context.asset_key.path[-1]}_lsn"
-            partitions = context.instance.get_dynamic_partitions(partition_key)
-            return partitions[0] if partitions else LSN_DEFAULT
-        except TypeError:
-            # Fallback for older Dagster versions
-            context.log.warning("Using fallback method for LSN tracking")
-            return LSN_DEFAULT
+        return get_last_lsn(context)
 
     def extract_row(self, change):
         """Extract relevant columns from the change DataFrame."""
@@ -36,25 +41,144 @@ class BaseDeltaAsset:
     # Remove the get_primary_key method as it's no longer needed
 
 
+# LSN checkpoints of all the assets
+checkpoint_store = CheckpointStore()
+
+
+def get_asset_name(table_name) -> str:
+    """Get the name of the Delta asset of a table."""
+    return f"{table_name.lower()}_delta"
+
+
+def get_delta_path(table_name) -> str:
+    """Get the path of the Delta table of a table."""
+    return f"{PATH_DELTA}/public/{get_asset_name(table_name)}"
+
+
+def write_delta(
+    df: pl.DataFrame,
+    delta_path,
+    mode: str,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+):
+    """Write to the Delta table of a table, partitioned by the partition spec if any."""
+    df.write_delta(
+        delta_path,
+        mode=mode,
+        delta_write_options={"partition_by": [partition_spec.partition_column]}
+        if partition_spec
+        else None,
+    )
+
+
+def resolve_partition_spec(
+    log,
+    partition_spec: Optional[DeltaPartitionSpec],
+    table_name,
+    delta_path,
+) -> Optional[DeltaPartitionSpec]:
+    """Get the partition spec the Delta table of a table is written with.
+    Delta cannot change the partitioning of an existing table, so a table created before its
+    partition spec was set is written without it (with a warning) until it is recreated."""
+    if not partition_spec or not os.path.exists(delta_path):
+        return partition_spec
+
+    partition_columns = DeltaTable(delta_path).metadata().partition_columns
+    if partition_spec.matches(partition_columns):
+        return partition_spec
+
+    log.warning(
+        f"The Delta table of `dbo.{table_name}` is partitioned on {partition_columns} instead of "
+        f"['{partition_spec.partition_column}'], ignoring its partition spec: remove the Delta table "
+        "to recreate it partitioned with a full load"
+    )
+    return None
+
+
+def get_last_lsn(context: AssetExecutionContext, asset_name=None):
+    """Get the last processed LSN of an asset from the checkpoint store.
+    Assets checkpointed before the store existed are migrated from their `<asset>_lsn` dynamic partition."""
+    asset_name = asset_name or context.asset_key.path[-1]
+    delta_path = f"{PATH_DELTA}/public/{asset_name}"
+
+    lsn = checkpoint_store.resolve(asset_name, delta_path)
+    if lsn is not None:
+        return lsn
+
+    # The newest LSN of the partition, LSN hex strings of the same length sort in LSN order
+    partitions = context.instance.get_dynamic_partitions(f"{asset_name}_lsn")
+    if not partitions:
+        return LSN_DEFAULT
+
+    lsn = max(partitions)
+    context.log.info(f"Migrating the LSN checkpoint of {asset_name} from its dynamic partition ({lsn})")
+    checkpoint_store.commit(asset_name, lsn, delta_path)
+
+    return lsn
+
+
+def store_lsn(context: AssetExecutionContext, lsn: str, delta_path, asset_name=None):
+    """Checkpoint the last processed LSN of an asset, once the Delta commit holding its changes landed."""
+    checkpoint_store.commit(asset_name or context.asset_key.path[-1], lsn, delta_path)
+
+
+def stage_lsn(context: AssetExecutionContext, lsn: str, delta_path, asset_name=None):
+    """Stage the last processed LSN of an asset whose changes are written by the IO Manager,
+    it is committed by the next `get_last_lsn` of the asset once the write landed on the Delta table."""
+    checkpoint_store.stage(asset_name or context.asset_key.path[-1], lsn, delta_path)
+
+
+def evolve_schema(
+    log,
+    sql_server_cdc: SQLServerCDCResource,
+    table_name,
+    delta_path,
+    projection: Optional[ColumnProjection] = None,
+) -> SchemaChanges:
+    """Evolve the Delta table of a table to its projected columns (see `evolve_delta_schema`),
+    so a new or widened column is merged incrementally instead of requiring a full reload."""
+    changes = evolve_delta_schema(
+        delta_path, sql_server_cdc.get_projected_columns(table_name, projection)
+    )
+
+    if changes.added:
+        log.info(f"Added the columns {list(changes.added)} to the Delta table of `dbo.{table_name}`")
+    if changes.widened:
+        # delta-rs cannot widen a column in place, the whole table was rewritten
+        log.warning(
+            f"Widened the columns {list(changes.widened)} of the Delta table of `dbo.{table_name}` "
+            f"by rewriting the full table ({changes.rewritten_rows} rows, {changes.rewritten_bytes} bytes)"
+        )
+    for column, (delta_type, sql_type) in changes.incompatible.items():
+        log.warning(
+            f"Column `{column}` of `dbo.{table_name}` changed to '{sql_type}', which does not widen {delta_type}: "
+            "reload the table with a full load"
+        )
+
+    return changes
+
+
 def delta_load_full(
     context: AssetExecutionContext,
     sql_server_cdc: SQLServerCDCResource,
     table_name,
     delta_path,
     last_lsn,
+    run_metrics: Optional[CDCRunMetrics] = None,
+    projection: Optional[ColumnProjection] = None,
 ):
     """Load the full table from SQL Server into Delta Lake."""
-    full_df = sql_server_cdc.get_full_table_data(table_name)
+    run_metrics = run_metrics or CDCRunMetrics(table_name)
+
+    with run_metrics.timer("extract"):
+        full_df = sql_server_cdc.get_full_table_data(table_name, projection)
+    run_metrics.track_frame(full_df)
 
     # Get the current LSN after the full load
     current_lsn = sql_server_cdc.lsn_to_hex_string(sql_server_cdc.get_current_lsn())
 
-    # Store the LSN with the correct partition key
-    partition_key = f"{context.asset_key.path[-1]}_lsn"
-    try:
-        context.instance.add_dynamic_partitions(partition_key, [str(current_lsn)])
-    except Exception as e:
-        context.log.warning(f"Failed to store LSN: {e}")
+    # The IO Manager writes the data after the asset returned
+    stage_lsn(context, current_lsn, delta_path)
 
     # # Convert timestamp columns to compatible format for Delta Lake
     # for col in full_df.select_dtypes(include=["datetime64[ns]"]).columns:
@@ -65,6 +189,174 @@ def delta_load_full(
     return full_df
 
 
+def delta_load_full_partitioned(
+    context: AssetExecutionContext,
+    sql_server_cdc: SQLServerCDCResource,
+    table_name,
+    delta_path,
+    snapshot_partitions: int,
+    snapshot_workers: int = 4,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+    run_metrics: Optional[CDCRunMetrics] = None,
+    projection: Optional[ColumnProjection] = None,
+) -> int:
+    """Load the full table from SQL Server into Delta Lake as primary key ranges read in parallel.
+    Every range is appended to Delta as it arrives, so the table never has to fit in memory.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    # Get the current LSN before the snapshot, changes made while reading are replayed by the next upsert
+    current_lsn = sql_server_cdc.lsn_to_hex_string(sql_server_cdc.get_current_lsn())
+
+    run_metrics = run_metrics or CDCRunMetrics(table_name)
+
+    num_rows = 0
+    mode = "overwrite"
+    for range_df in run_metrics.track_batches(
+        sql_server_cdc.iter_full_table_data(
+            table_name,
+            snapshot_partitions,
+            max_workers=snapshot_workers,
+            projection=projection,
+        )
+    ):
+        if partition_spec:
+            range_df = partition_spec.with_partition_column(range_df)
+
+        with run_metrics.timer("write"):
+            write_delta(range_df, delta_path, mode, partition_spec)
+        mode = "append"
+        num_rows += len(range_df)
+        context.log.debug(f"Loaded {len(range_df)} rows of {table_name} ({num_rows} total)")
+
+    # Only checkpoint once every range is committed, a failed load starts over with an overwrite
+    store_lsn(context, current_lsn, delta_path)
+
+    context.log.info(f"Initial load complete for {table_name} with {num_rows} rows")
+
+    return num_rows
+
+
+def read_cdc_batches(
+    sql_server_cdc: SQLServerCDCResource,
+    table_name,
+    from_lsn,
+    to_lsn=None,
+    batch_size: Optional[int] = None,
+    net_changes: bool = False,
+    run_metrics: Optional[CDCRunMetrics] = None,
+    projection: Optional[ColumnProjection] = None,
+) -> tuple[Iterable[pl.DataFrame], str]:
+    """Read the CDC changes of a table, streamed in batches when a batch size is configured
+    so that only `batch_size` CDC rows are kept in memory at a time."""
+    run_metrics = run_metrics or CDCRunMetrics(table_name)
+
+    if batch_size:
+        with run_metrics.timer("extract"):
+            cdc_batches, current_lsn = sql_server_cdc.iter_table_changes(
+                table_name,
+                from_lsn,
+                chunksize=batch_size,
+                to_lsn=to_lsn,
+                net_changes=net_changes,
+                projection=projection,
+            )
+        return run_metrics.track_batches(cdc_batches), current_lsn
+
+    with run_metrics.timer("extract"):
+        cdc_df, current_lsn = sql_server_cdc.get_table_changes(
+            table_name,
+            from_lsn,
+            to_lsn=to_lsn,
+            net_changes=net_changes,
+            projection=projection,
+        )
+    run_metrics.track_frame(cdc_df)
+
+    return [cdc_df], current_lsn
+
+
+def iter_non_empty_batches(cdc_batches: Iterable[pl.DataFrame]) -> Iterator[pl.DataFrame]:
+    """Skip the CDC batches without changes."""
+    for cdc_df in cdc_batches:
+        if not cdc_df.is_empty() and "__$operation" in cdc_df.columns:
+            yield cdc_df
+
+
+def collapse_cdc_batches(
+    cdc_batches: Iterable[pl.DataFrame], indices: List[str]
+) -> Optional[pl.DataFrame]:
+    """Reduce the CDC batches (in LSN order) to the last change per key, one batch at a time,
+    so only the collapsed changes are kept in memory (see `collapse_cdc_changes`).
+
+    Returns:
+        pl.DataFrame: The collapsed changes, None when there were no changes.
+    """
+    changes = None
+    for cdc_df in iter_non_empty_batches(cdc_batches):
+        cdc_df = collapse_cdc_changes(cdc_df, indices)
+        changes = (
+            cdc_df
+            if changes is None
+            else collapse_cdc_changes(
+                pl.concat([changes, cdc_df], how="diagonal_relaxed"), indices
+            )
+        )
+
+    return changes
+
+
+def apply_cdc_batches(
+    current_data: Union[pl.DataFrame, pl.LazyFrame],
+    cdc_batches: Iterable[pl.DataFrame],
+    indices: List[str],
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+) -> tuple[pl.DataFrame, bool]:
+    """Apply the CDC batches in order onto the current data (e.g. `pl.scan_delta(delta_path)`).
+    The batches are collapsed first (see `collapse_cdc_batches`), then applied in a single lazy query
+    collected with the streaming engine, so the current data is scanned once whatever the number of batches.
+    The scan covers the whole table and the full new table is returned in memory, to be rewritten in full,
+    see `merge_cdc_batches` to only touch the files of the changed keys.
+    With a partition spec, the partition column is derived for the changed rows.
+
+    Returns:
+        tuple: The new data and whether any change was applied.
+    """
+    current_data = current_data.lazy()
+
+    changes = collapse_cdc_batches(cdc_batches, indices)
+    if changes is None:
+        return current_data.collect(engine="streaming"), False
+
+    if partition_spec:
+        changes = partition_spec.with_partition_column(changes)
+
+    return (
+        process_cdc_changes(current_data, changes, indices).collect(engine="streaming"),
+        True,
+    )
+
+
+def merge_cdc_batches(
+    delta_path,
+    cdc_batches: Iterable[pl.DataFrame],
+    indices: List[str],
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+) -> Optional[dict]:
+    """Reduce the CDC batches to the last change per key and merge them into Delta in a single MERGE,
+    so only the changed rows are sent to Delta and only the files holding them are rewritten.
+
+    Returns:
+        dict: The metrics of the merge, None when there were no changes.
+    """
+    changes = collapse_cdc_batches(cdc_batches, indices)
+    if changes is None:
+        return None
+
+    return merge_cdc_changes(delta_path, changes, indices, partition_spec)
+
+
 def delta_load_upsert(
     context: AssetExecutionContext,
     sql_server_cdc: SQLServerCDCResource,
@@ -72,48 +364,262 @@ def delta_load_upsert(
     delta_path,
     last_lsn,
     indices: List[str],
-) -> pl.DataFrame:
-    # Load the existing data
-    current_data = pl.read_delta(delta_path)
+    batch_size: Optional[int] = None,
+    net_changes: bool = False,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+    run_metrics: Optional[CDCRunMetrics] = None,
+    projection: Optional[ColumnProjection] = None,
+) -> Optional[pl.DataFrame]:
+    """Apply the changes since the last LSN onto the Delta table in memory,
+    the IO Manager then merges the full result into Delta.
 
-    # Only get changes if we have an existing delta file
-    cdc_df, current_lsn = sql_server_cdc.get_table_changes(table_name, last_lsn)
+    Returns:
+        pl.DataFrame: The new data, None when there were no changes (nothing has to be written).
+    """
+    run_metrics = run_metrics or CDCRunMetrics(table_name)
+    cdc_batches, current_lsn = read_cdc_batches(
+        sql_server_cdc,
+        table_name,
+        last_lsn,
+        batch_size=batch_size,
+        net_changes=net_changes,
+        run_metrics=run_metrics,
+        projection=projection,
+    )
 
-    # If no changes, skip and just return the existing data
-    if cdc_df.is_empty():
+    # Only load the existing data once we know there are changes to apply
+    cdc_batches = iter_non_empty_batches(cdc_batches)
+    first_batch = next(cdc_batches, None)
+    if first_batch is None:
         context.log.info(f"No changes found for {table_name}")
-        return pl.read_delta(delta_path)
+        return None
 
-    if "__$operation" not in cdc_df.columns:
-        context.log.info(f"No changes found for {table_name}")
-        return pl.read_delta(delta_path)
+    evolve_schema(context.log, sql_server_cdc, table_name, delta_path, projection)
 
     # Process CDC changes, create a new DF of changes and merge them into the delta file.
     # this merge operation happens through the IO Manager, thus we just return the DF with our changes.
-    # @todo: what about DELETE operations here? This is practically an UPSERT
-    new_data = process_cdc_changes(current_data, cdc_df, indices)
+    with run_metrics.timer("merge"):
+        current_data, _ = apply_cdc_batches(
+            pl.scan_delta(delta_path),
+            chain([first_batch], cdc_batches),
+            indices,
+            partition_spec,
+        )
+
+    # The IO Manager writes the data after the asset returned
+    stage_lsn(context, current_lsn, delta_path)
+
+    return current_data
+
+
+def delta_load_merge(
+    context: AssetExecutionContext,
+    sql_server_cdc: SQLServerCDCResource,
+    table_name,
+    delta_path,
+    last_lsn,
+    indices: List[str],
+    batch_size: Optional[int] = None,
+    net_changes: bool = False,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+    run_metrics: Optional[CDCRunMetrics] = None,
+    projection: Optional[ColumnProjection] = None,
+) -> Optional[dict]:
+    """Merge the changes since the last LSN into Delta incrementally,
+    without reading the Delta table, the I/O scales with the amount of changes.
 
-    # Update the last processed LSN
-    context.instance.add_dynamic_partitions(
-        partition_key="last_lsn",
-        partitions=[str(current_lsn)],
+    Returns:
+        dict: The metrics of the merge, None when there were no changes.
+    """
+    run_metrics = run_metrics or CDCRunMetrics(table_name)
+    cdc_batches, current_lsn = read_cdc_batches(
+        sql_server_cdc,
+        table_name,
+        last_lsn,
+        batch_size=batch_size,
+        net_changes=net_changes,
+        run_metrics=run_metrics,
+        projection=projection,
     )
 
-    # Store the updated LSN with the correct partition key
-    partition_key = f"{context.asset_key.path[-1]}_lsn"
-    try:
-        context.instance.add_dynamic_partitions(partition_key, [str(current_lsn)])
-    except Exception as e:
-        context.log.warning(f"Failed to store LSN: {e}")
+    evolve_schema(context.log, sql_server_cdc, table_name, delta_path, projection)
+
+    # The MERGE reads and writes the touched files in one go
+    with run_metrics.timer("merge"):
+        metrics = merge_cdc_batches(delta_path, cdc_batches, indices, partition_spec)
 
-    return new_data
+    if metrics is None:
+        context.log.info(f"No changes found for {table_name}")
+        return metrics
 
+    # The merge is committed, checkpoint its LSN
+    store_lsn(context, current_lsn, delta_path)
 
-def create_delta_asset(table_name):
-    """Factory function to create delta assets for different tables."""
+    return metrics
+
+
+def delta_load_spill(
+    context: AssetExecutionContext,
+    sql_server_cdc: SQLServerCDCResource,
+    table_name,
+    delta_path,
+    last_lsn,
+    indices: List[str],
+    spill_memory_mb: int,
+    batch_size: Optional[int] = None,
+    net_changes: bool = False,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+    run_metrics: Optional[CDCRunMetrics] = None,
+    projection: Optional[ColumnProjection] = None,
+) -> Optional[dict]:
+    """Apply the changes since the last LSN out of core (see `spill_merge_cdc_batches`),
+    for change windows larger than memory, the merge stays within about `spill_memory_mb`.
+
+    Returns:
+        dict: The metrics of the merge, None when there were no changes.
+    """
+    run_metrics = run_metrics or CDCRunMetrics(table_name)
+    cdc_batches, current_lsn = read_cdc_batches(
+        sql_server_cdc,
+        table_name,
+        last_lsn,
+        batch_size=batch_size,
+        net_changes=net_changes,
+        run_metrics=run_metrics,
+        projection=projection,
+    )
+
+    evolve_schema(context.log, sql_server_cdc, table_name, delta_path, projection)
+
+    with run_metrics.timer("merge"):
+        metrics = spill_merge_cdc_batches(
+            delta_path, cdc_batches, indices, spill_memory_mb, partition_spec
+        )
+
+    if metrics is None:
+        context.log.info(f"No changes found for {table_name}")
+        return metrics
+
+    # The overwrite is committed, checkpoint its LSN
+    store_lsn(context, current_lsn, delta_path)
+
+    return metrics
+
+
+def delta_load_windowed(
+    context: AssetExecutionContext,
+    sql_server_cdc: SQLServerCDCResource,
+    table_name,
+    delta_path,
+    last_lsn,
+    indices: List[str],
+    window_rows: int,
+    batch_size: Optional[int] = None,
+    net_changes: bool = False,
+    incremental_merge: bool = False,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+    run_metrics: Optional[CDCRunMetrics] = None,
+    spill_memory_mb: Optional[int] = None,
+    projection: Optional[ColumnProjection] = None,
+) -> List[tuple[str, str]]:
+    """Apply the changes since the last LSN in bounded LSN windows.
+    Every window is committed to Delta and checkpointed before the next one is read,
+    so a failed run resumes from the last committed window.
+
+    Returns:
+        list: The (from_lsn, to_lsn) windows that were committed.
+    """
+    run_metrics = run_metrics or CDCRunMetrics(table_name)
+
+    # Fix the upper bound up front, so changes arriving during the run are left for the next one
+    to_lsn = sql_server_cdc.lsn_to_hex_string(sql_server_cdc.get_current_lsn())
+    windows = sql_server_cdc.get_lsn_windows(table_name, last_lsn, to_lsn, window_rows)
+
+    if not windows:
+        context.log.info(f"No changes found for {table_name}")
+        return windows
+
+    evolve_schema(context.log, sql_server_cdc, table_name, delta_path, projection)
+
+    # The changes are read after the last applied LSN, i.e. the end of the previous window
+    from_lsn = last_lsn
+    for i, (window_start, window_end) in enumerate(windows, start=1):
+        context.log.info(
+            f"Applying window {i}/{len(windows)} of `dbo.{table_name}` ({window_start} - {window_end})"
+        )
+
+        cdc_batches, _ = read_cdc_batches(
+            sql_server_cdc,
+            table_name,
+            from_lsn,
+            window_end,
+            batch_size,
+            net_changes,
+            run_metrics,
+            projection,
+        )
+
+        # Commit the window before checkpointing its LSN
+        if spill_memory_mb:
+            with run_metrics.timer("merge"):
+                spill_merge_cdc_batches(
+                    delta_path, cdc_batches, indices, spill_memory_mb, partition_spec
+                )
+        elif incremental_merge:
+            with run_metrics.timer("merge"):
+                merge_cdc_batches(delta_path, cdc_batches, indices, partition_spec)
+        else:
+            with run_metrics.timer("merge"):
+                new_data, _ = apply_cdc_batches(
+                    pl.scan_delta(delta_path), cdc_batches, indices, partition_spec
+                )
+            with run_metrics.timer("write"):
+                write_delta(new_data, delta_path, "overwrite", partition_spec)
+
+        store_lsn(context, window_end, delta_path)
+        from_lsn = window_end
+
+    return windows
+
+
+def create_delta_asset(
+    table_name,
+    batch_size: Optional[int] = None,
+    window_rows: Optional[int] = None,
+    net_changes: bool = False,
+    snapshot_partitions: Optional[int] = None,
+    snapshot_workers: int = 4,
+    incremental_merge: bool = False,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+    spill_memory_mb: Optional[int] = None,
+    column_projection: Optional[ColumnProjection] = None,
+):
+    """Factory function to create delta assets for different tables.
+
+    Args:
+        table_name (str): The name of the SQL Server table to track.
+        batch_size (int, optional): Stream the CDC changes in batches of this many rows
+            instead of loading them all at once. Defaults to None (no streaming).
+        window_rows (int, optional): Apply the changes in LSN windows of about this many rows,
+            each committed to Delta and checkpointed on its own. Defaults to None (single window).
+        net_changes (bool, optional): Read only the net change per row through fn_cdc_get_net_changes
+            when the capture instance supports it. Defaults to False (all changes).
+        snapshot_partitions (int, optional): Perform the initial load as this many primary key ranges,
+            read in parallel and written to Delta as they arrive. Defaults to None (single query).
+        snapshot_workers (int, optional): Number of ranges read concurrently during the initial load. Defaults to 4.
+        incremental_merge (bool, optional): Send only the changed rows to a Delta MERGE (deletes included),
+            instead of rewriting the full table. Defaults to False (full rewrite through the IO Manager).
+        partition_spec (DeltaPartitionSpec, optional): Partition the Delta table on a column derived from
+            a date or key column, merges then only rewrite the partitions the changes touch. Defaults to None.
+        spill_memory_mb (int, optional): Apply the changes out of core, spilling them and the rows they affect
+            to local files and merging them by key hash buckets within about this many MB. Combine with
+            `batch_size`. Defaults to None (in memory).
+        column_projection (ColumnProjection, optional): The columns read from SQL Server and their server-side
+            casts, e.g. to skip LOB columns. Defaults to None (all captured columns, without casts).
+    """
 
     @asset(
-        name=f"{table_name.lower()}_delta",
+        name=get_asset_name(table_name),
         group_name="cdc",
         io_manager_key="delta_io_manager",
         required_resource_keys={"sql_server_cdc"},
@@ -124,32 +630,199 @@ def create_delta_asset(table_name):
         sql_server_cdc: SQLServerCDCResource = context.resources.sql_server_cdc
         delta_asset = BaseDeltaAsset(table_name, sql_server_cdc)
 
-        indices = sql_server_cdc.get_primary_key_columns(table_name)
+        # The primary keys are resolved once (and cached) by the base asset
+        indices = delta_asset.primary_key_columns
 
         last_lsn = delta_asset.get_last_lsn(context)
         context.log.info(f"Processing changes for {table_name} since LSN: {last_lsn}")
 
+        use_net_changes = net_changes and sql_server_cdc.supports_net_changes(
+            table_name, last_lsn=last_lsn
+        )
+        if net_changes and not use_net_changes:
+            context.log.warning(
+                f"Capture instance of `dbo.{table_name}` does not support net changes, reading all changes"
+            )
+
+        run_metrics = CDCRunMetrics(table_name)
+        if last_lsn != LSN_DEFAULT:
+            run_metrics.lsn_lag_seconds, run_metrics.lsn_lag_bytes = (
+                sql_server_cdc.get_lsn_lag(last_lsn)
+            )
+
+        def materialize_result(metadata: dict) -> dg.MaterializeResult:
+            """Bypass the IO Manager, reporting the run metrics along with the metadata."""
+            emit_metrics(run_metrics)
+            return dg.MaterializeResult(metadata={**metadata, **run_metrics.to_metadata()})
+
         res = pl.DataFrame()
 
         try:
-            delta_path = f"{PATH_DELTA}/public/{table_name.lower()}_delta"
+            delta_path = get_delta_path(table_name)
+            table_partition_spec = resolve_partition_spec(
+                context.log, partition_spec, table_name, delta_path
+            )
 
             # If the table is empty or the Delta table doesn't exist, perform an initial load
-            if last_lsn == LSN_DEFAULT or not os.path.exists(delta_path):
+            if snapshot_partitions and (
+                last_lsn == LSN_DEFAULT or not os.path.exists(delta_path)
+            ):
+                context.log.info(
+                    f"Performing partitioned full copy of `dbo.{table_name}` in {snapshot_partitions} ranges (last_lsn='{last_lsn}', delta_path='{delta_path}')"
+                )
+                num_rows = delta_load_full_partitioned(
+                    context,
+                    sql_server_cdc,
+                    table_name,
+                    delta_path,
+                    snapshot_partitions,
+                    snapshot_workers,
+                    table_partition_spec,
+                    run_metrics,
+                    projection=column_projection,
+                )
+
+                # The ranges are committed to Delta already, so we bypass the IO Manager
+                return materialize_result(metadata={"num_rows": num_rows})
+            elif last_lsn == LSN_DEFAULT or not os.path.exists(delta_path):
                 context.log.info(
                     f"Performing full copy of `dbo.{table_name}` (last_lsn='{last_lsn}', delta_path='{delta_path}')"
                 )
                 res = delta_load_full(
-                    context, sql_server_cdc, table_name, delta_path, last_lsn
+                    context,
+                    sql_server_cdc,
+                    table_name,
+                    delta_path,
+                    last_lsn,
+                    run_metrics,
+                    projection=column_projection,
+                )
+
+                if table_partition_spec:
+                    # The IO Manager does not partition on columns, so the partitioned table is created here
+                    with run_metrics.timer("write"):
+                        write_delta(
+                            table_partition_spec.with_partition_column(res),
+                            delta_path,
+                            "overwrite",
+                            table_partition_spec,
+                        )
+                    return materialize_result(metadata={"num_rows": len(res)})
+            elif not sql_server_cdc.has_changes_since(table_name, last_lsn):
+                context.log.info(
+                    f"No changes found for `dbo.{table_name}` since LSN {last_lsn}, skipping the materialization"
+                )
+
+                # Nothing to read or write, bypass the IO Manager so the Delta table is not rewritten
+                return materialize_result(
+                    metadata={"last_lsn": last_lsn, "num_changes": 0}
+                )
+            elif window_rows:
+                context.log.info(
+                    f"Upserting changes of `dbo.{table_name}` into delta_path='{delta_path}' in windows of {window_rows} rows (last_lsn='{last_lsn}')"
+                )
+                windows = delta_load_windowed(
+                    context,
+                    sql_server_cdc,
+                    table_name,
+                    delta_path,
+                    last_lsn,
+                    indices,
+                    window_rows,
+                    batch_size=batch_size,
+                    net_changes=use_net_changes,
+                    incremental_merge=incremental_merge,
+                    partition_spec=table_partition_spec,
+                    run_metrics=run_metrics,
+                    spill_memory_mb=spill_memory_mb,
+                    projection=column_projection,
+                )
+
+                # The windows are committed to Delta already, so we bypass the IO Manager
+                return materialize_result(
+                    metadata={
+                        "lsn_windows": len(windows),
+                        "last_lsn": windows[-1][1] if windows else last_lsn,
+                    }
+                )
+            elif spill_memory_mb:
+                context.log.info(
+                    f"Merging changes of `dbo.{table_name}` into delta_path='{delta_path}' out of core within {spill_memory_mb} MB (last_lsn='{last_lsn}')"
+                )
+                metrics = delta_load_spill(
+                    context,
+                    sql_server_cdc,
+                    table_name,
+                    delta_path,
+                    last_lsn,
+                    indices,
+                    spill_memory_mb,
+                    batch_size=batch_size,
+                    net_changes=use_net_changes,
+                    partition_spec=table_partition_spec,
+                    run_metrics=run_metrics,
+                    projection=column_projection,
+                )
+
+                # The changes are committed to Delta already, so we bypass the IO Manager
+                return materialize_result(metadata=metrics or {"num_source_rows": 0})
+            elif incremental_merge:
+                context.log.info(
+                    f"Merging changes of `dbo.{table_name}` into delta_path='{delta_path}' (last_lsn='{last_lsn}')"
+                )
+                metrics = delta_load_merge(
+                    context,
+                    sql_server_cdc,
+                    table_name,
+                    delta_path,
+                    last_lsn,
+                    indices,
+                    batch_size=batch_size,
+                    net_changes=use_net_changes,
+                    partition_spec=table_partition_spec,
+                    run_metrics=run_metrics,
+                    projection=column_projection,
+                )
+
+                # The merge is committed to Delta already, so we bypass the IO Manager
+                return materialize_result(
+                    metadata={
+                        key: metrics[key]
+                        for key in [
+                            "num_source_rows",
+                            "num_target_rows_inserted",
+                            "num_target_rows_updated",
+                            "num_target_rows_deleted",
+                            "num_target_files_added",
+                            "num_target_files_removed",
+                        ]
+                    }
+                    if metrics
+                    else {"num_source_rows": 0}
                 )
             else:
                 context.log.info(
                     f"Upserting changes of `dbo.{table_name}` into delta_path='{delta_path}' (last_lsn='{last_lsn}')"
                 )
                 res = delta_load_upsert(
-                    context, sql_server_cdc, table_name, delta_path, last_lsn, indices
+                    context,
+                    sql_server_cdc,
+                    table_name,
+                    delta_path,
+                    last_lsn,
+                    indices,
+                    batch_size=batch_size,
+                    net_changes=use_net_changes,
+                    partition_spec=table_partition_spec,
+                    run_metrics=run_metrics,
+                    projection=column_projection,
                 )
 
+                if res is None:
+                    return materialize_result(
+                        metadata={"last_lsn": last_lsn, "num_changes": 0}
+                    )
+
         except Exception as e:
             raise e
 
@@ -158,11 +831,16 @@ def create_delta_asset(table_name):
         # we merge the indices by s.INDICE1 = t.INDICE1 AND s.INDICE2 = t.INDICE2, ...
 
         indices_predicate = " AND ".join([f"s.{col} = t.{col}" for col in indices])
-        print("MY INDICES: ", indices_predicate)
-        print(res)
+        if table_partition_spec:
+            # Matching rows always live in the same partition
+            indices_predicate += f" AND s.{table_partition_spec.partition_column} = t.{table_partition_spec.partition_column}"
+        context.log.debug(f"Merging {len(res)} rows on {indices_predicate}")
 
+        # The write by the IO Manager happens after the asset returned and is not timed
+        emit_metrics(run_metrics)
         context.add_output_metadata(
             {
+                **run_metrics.to_metadata(),
                 "merge_predicate": indices_predicate,
                 "merge_config": {
                     "merge_type": MergeType.replace_delete_unmatched,
@@ -178,6 +856,191 @@ def create_delta_asset(table_name):
     return delta_asset
 
 
+def sync_table(
+    sql_server_cdc: SQLServerCDCResource,
+    table_name,
+    last_lsn,
+    to_lsn,
+    batch_size: Optional[int] = None,
+    net_changes: bool = False,
+    incremental_merge: bool = False,
+    run_metrics: Optional[CDCRunMetrics] = None,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+    projection: Optional[ColumnProjection] = None,
+) -> tuple[int, str]:
+    """Bring the Delta table of a table up to `to_lsn`, writing it directly to Delta.
+    Performs the initial load when no LSN was processed yet. Safe to run in a thread.
+    The table is partitioned and projected as by `create_delta_asset`.
+
+    Returns:
+        tuple: The number of rows of the Delta table after the sync (or the number of changed rows
+            with `incremental_merge`), and the LSN the table was synced up to, which is `last_lsn`
+            when the table was already past `to_lsn`.
+    """
+    delta_path = get_delta_path(table_name)
+    run_metrics = run_metrics or CDCRunMetrics(table_name)
+    partition_spec = resolve_partition_spec(
+        dg.get_dagster_logger(), partition_spec, table_name, delta_path
+    )
+
+    if last_lsn == LSN_DEFAULT or not os.path.exists(delta_path):
+        # The snapshot is taken after `to_lsn`, changes in between are replayed by the next sync
+        with run_metrics.timer("extract"):
+            new_data = sql_server_cdc.get_full_table_data(table_name, projection)
+        run_metrics.track_frame(new_data)
+
+        if partition_spec:
+            new_data = partition_spec.with_partition_column(new_data)
+
+        with run_metrics.timer("write"):
+            write_delta(new_data, delta_path, "overwrite", partition_spec)
+        return len(new_data), to_lsn
+
+    # A checkpoint past the snapshot (e.g. from a later single-table run) must not move backwards
+    if last_lsn >= to_lsn:
+        return pl.scan_delta(delta_path).select(pl.len()).collect().item(), last_lsn
+
+    if not sql_server_cdc.has_changes_since(table_name, last_lsn):
+        return pl.scan_delta(delta_path).select(pl.len()).collect().item(), to_lsn
+
+    indices = sql_server_cdc.get_primary_key_columns(table_name)
+    net_changes = net_changes and sql_server_cdc.supports_net_changes(
+        table_name, last_lsn=last_lsn
+    )
+    evolve_schema(dg.get_dagster_logger(), sql_server_cdc, table_name, delta_path, projection)
+
+    cdc_batches, _ = read_cdc_batches(
+        sql_server_cdc,
+        table_name,
+        last_lsn,
+        to_lsn,
+        batch_size,
+        net_changes,
+        run_metrics,
+        projection,
+    )
+
+    if incremental_merge:
+        with run_metrics.timer("merge"):
+            metrics = merge_cdc_batches(delta_path, cdc_batches, indices, partition_spec)
+        return (metrics["num_source_rows"] if metrics else 0), to_lsn
+
+    with run_metrics.timer("merge"):
+        new_data, has_changes = apply_cdc_batches(
+            pl.scan_delta(delta_path), cdc_batches, indices, partition_spec
+        )
+
+    if has_changes:
+        with run_metrics.timer("write"):
+            write_delta(new_data, delta_path, "overwrite", partition_spec)
+
+    return len(new_data), to_lsn
+
+
+def create_cdc_multi_asset(
+    table_names: List[str],
+    name="cdc_tables_delta",
+    max_workers: int = 8,
+    batch_size: Optional[int] = None,
+    net_changes: bool = False,
+    incremental_merge: bool = False,
+    partition_specs: Optional[dict[str, DeltaPartitionSpec]] = None,
+    column_projections: Optional[dict[str, ColumnProjection]] = None,
+):
+    """Factory function to create a multi asset that syncs many tables in a single run.
+    The tables are extracted concurrently over the shared connection pool of the resource
+    (size it through `SQLServerCDCConfig.pool_size`) and all read up to the same
+    `fn_cdc_get_max_lsn` snapshot, so the Delta tables are consistent with each other.
+
+    Args:
+        table_names (list): The names of the SQL Server tables to track.
+        name (str, optional): The name of the multi asset. Defaults to 'cdc_tables_delta'.
+        max_workers (int, optional): Number of tables extracted concurrently. Defaults to 8.
+        batch_size (int, optional): Stream the CDC changes in batches of this many rows. Defaults to None.
+        net_changes (bool, optional): Read only the net change per row when supported. Defaults to False.
+        incremental_merge (bool, optional): Send only the changed rows to a Delta MERGE. Defaults to False.
+        partition_specs (dict, optional): The partition spec per table name, see `create_delta_asset`. Defaults to None.
+        column_projections (dict, optional): The column projection per table name, see `create_delta_asset`.
+            Defaults to None (all captured columns, without casts).
+    """
+    partition_specs = partition_specs or {}
+    column_projections = column_projections or {}
+    asset_names = {table_name: get_asset_name(table_name) for table_name in table_names}
+
+    @dg.multi_asset(
+        name=name,
+        specs=[
+            dg.AssetSpec(asset_name, group_name="cdc")
+            for asset_name in asset_names.values()
+        ],
+        can_subset=True,
+        required_resource_keys={"sql_server_cdc"},
+    )
+    def cdc_tables_delta(context: AssetExecutionContext):
+        """Multi asset that tracks changes to many tables and writes them to Delta Lake."""
+        sql_server_cdc: SQLServerCDCResource = context.resources.sql_server_cdc
+        selected_tables = [
+            table_name
+            for table_name, asset_name in asset_names.items()
+            if dg.AssetKey(asset_name) in context.selected_asset_keys
+        ]
+
+        # A single snapshot of the maximum LSN for all the tables
+        to_lsn = sql_server_cdc.lsn_to_hex_string(sql_server_cdc.get_current_lsn())
+        context.log.info(
+            f"Syncing {len(selected_tables)} tables up to LSN {to_lsn} with {max_workers} workers"
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            run_metrics = {}
+            for table_name in selected_tables:
+                last_lsn = get_last_lsn(context, asset_names[table_name])
+                run_metrics[table_name] = CDCRunMetrics(table_name)
+                future = executor.submit(
+                    sync_table,
+                    sql_server_cdc,
+                    table_name,
+                    last_lsn,
+                    to_lsn,
+                    batch_size,
+                    net_changes,
+                    incremental_merge,
+                    run_metrics[table_name],
+                    partition_specs.get(table_name),
+                    column_projections.get(table_name),
+                )
+                futures[future] = table_name
+
+            # Checkpoints are stored from this thread, as soon as a table is committed to Delta
+            for future in as_completed(futures):
+                table_name = futures[future]
+                num_rows, synced_lsn = future.result()
+                store_lsn(
+                    context, synced_lsn, get_delta_path(table_name), asset_names[table_name]
+                )
+
+                emit_metrics(run_metrics[table_name])
+                yield dg.MaterializeResult(
+                    asset_key=asset_names[table_name],
+                    metadata={
+                        "last_lsn": synced_lsn,
+                        "num_rows": num_rows,
+                        **run_metrics[table_name].to_metadata(),
+                    },
+                )
+
+    return cdc_tables_delta
+
+
 # Create assets with their primary keys
 CustomersDelta = create_delta_asset("Customers")
-OrdersDelta = create_delta_asset("Orders")
+OrdersDelta = create_delta_asset(
+    "Orders",
+    batch_size=50_000,
+    window_rows=1_000_000,
+    net_changes=True,
+    snapshot_partitions=64,
+    incremental_merge=True,
+    partition_spec=DeltaPartitionSpec("OrderDate", "month"),
+)
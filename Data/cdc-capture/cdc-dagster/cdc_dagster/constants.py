@@ -1,2 +1,3 @@
 PATH_DELTA = "/tmp/io_manager_storage/delta"
 LSN_DEFAULT = "0x00000000000000000000"
+PATH_CHECKPOINTS = "/tmp/io_manager_storage/cdc_checkpoints.sqlite"
@@ -7,15 +7,24 @@ from dagster_delta import (
     DeltaLakePolarsIOManager,
 )
 from cdc_dagster.assets.delta_assets import CustomersDelta, OrdersDelta
+from cdc_dagster.jobs.maintenance import create_maintenance_job
+from cdc_dagster.sensors.cdc_sensor import create_cdc_sensor
 from cdc_dagster.resources.sql_server_cdc import (
     SQLServerCDCResource,
     SQLServerCDCConfig,
 )
 from cdc_dagster.constants import PATH_DELTA
 
+maintenance_job, maintenance_schedule = create_maintenance_job(["Customers", "Orders"])
+cdc_sensor = create_cdc_sensor(["Customers", "Orders"])
 
 defs = Definitions(
+    # To sync the tables in a single run, replace them by a multi asset with the same asset keys:
+    # create_cdc_multi_asset(["Customers", "Orders"], ...), see the README
     assets=[CustomersDelta, OrdersDelta],
+    jobs=[maintenance_job],
+    schedules=[maintenance_schedule],
+    sensors=[cdc_sensor],
     resources={
         "sql_server_cdc": SQLServerCDCResource(SQLServerCDCConfig()),
         "delta_io_manager": DeltaLakePolarsIOManager(
@@ -0,0 +1 @@
+# This file initializes the jobs subpackage.
\ No newline at end of file
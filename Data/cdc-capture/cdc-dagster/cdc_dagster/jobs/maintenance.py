@@ -0,0 +1,108 @@
+import os
+import dagster as dg
+import polars as pl
+from deltalake import DeltaTable
+from typing import List, Optional
+
+from cdc_dagster.assets.delta_assets import get_delta_path
+from cdc_dagster.resources.sql_server_cdc import SQLServerCDCResource
+
+
+class DeltaMaintenanceConfig(dg.Config):
+    """Thresholds of the Delta maintenance job."""
+
+    # Only optimize tables with at least this many files...
+    min_files: int = 32
+    # ... of which at least this fraction is smaller than `small_file_bytes`
+    small_file_ratio: float = 0.25
+    small_file_bytes: int = 16 * 1024 * 1024
+    # Size of the files written by the optimization
+    target_file_bytes: int = 128 * 1024 * 1024
+    # Z-order on the primary keys instead of a plain bin-packing compaction
+    z_order: bool = True
+    # Files no longer referenced for this long are removed by VACUUM, None applies the retention of the
+    # table (`delta.deletedFileRetentionDuration`, 7 days by default), a shorter one is rejected
+    vacuum_retention_hours: Optional[int] = None
+
+
+def get_file_stats(dt: DeltaTable, small_file_bytes: int) -> tuple[int, float]:
+    """Get the number of files of a Delta table and the fraction of them smaller than `small_file_bytes`."""
+    sizes = pl.from_arrow(dt.get_add_actions(flatten=True).column("size_bytes"))
+    if sizes.is_empty():
+        return 0, 0.0
+
+    return len(sizes), (sizes < small_file_bytes).sum() / len(sizes)
+
+
+def optimize_table(
+    context: dg.OpExecutionContext,
+    sql_server_cdc: SQLServerCDCResource,
+    table_name: str,
+    config: DeltaMaintenanceConfig,
+):
+    """Compact (or Z-order) and vacuum the Delta table of a table when it crossed the thresholds."""
+    delta_path = get_delta_path(table_name)
+    if not os.path.exists(delta_path):
+        context.log.info(f"No Delta table for `dbo.{table_name}` yet, skipping")
+        return
+
+    dt = DeltaTable(delta_path)
+    num_files, small_ratio = get_file_stats(dt, config.small_file_bytes)
+
+    if num_files >= config.min_files and small_ratio >= config.small_file_ratio:
+        if config.z_order:
+            indices = sql_server_cdc.get_primary_key_columns(table_name)
+            metrics = dt.optimize.z_order(
+                indices, target_size=config.target_file_bytes
+            )
+        else:
+            metrics = dt.optimize.compact(target_size=config.target_file_bytes)
+
+        context.log.info(
+            f"Optimized `dbo.{table_name}`: {metrics['numFilesRemoved']} files rewritten into {metrics['numFilesAdded']}"
+        )
+    else:
+        context.log.info(
+            f"`dbo.{table_name}` has {num_files} files ({small_ratio:.0%} small), below the thresholds"
+        )
+
+    removed = dt.vacuum(retention_hours=config.vacuum_retention_hours, dry_run=False)
+    context.log.info(f"Vacuumed {len(removed)} files of `dbo.{table_name}`")
+
+
+def create_maintenance_job(
+    table_names: List[str], name="cdc_delta_maintenance", cron_schedule="0 3 * * *"
+):
+    """Factory function to create the maintenance job of the Delta tables, with its schedule.
+
+    Frequent small CDC merges leave many small files behind. The job bin-packs them
+    (Z-ordered on the primary keys, so the files keep tight key ranges for the merges)
+    once a table crossed the file count and small file thresholds, then vacuums the
+    files no longer referenced.
+
+    Args:
+        table_names (list): The names of the SQL Server tables whose Delta tables are maintained.
+        name (str, optional): The name of the job. Defaults to 'cdc_delta_maintenance'.
+        cron_schedule (str, optional): When the job runs. Defaults to daily at 03:00.
+
+    Returns:
+        tuple: The job and its schedule.
+    """
+
+    @dg.op(name=f"{name}_op", required_resource_keys={"sql_server_cdc"})
+    def optimize_delta_tables(
+        context: dg.OpExecutionContext, config: DeltaMaintenanceConfig
+    ):
+        """Optimize and vacuum the Delta tables."""
+        for table_name in table_names:
+            optimize_table(
+                context, context.resources.sql_server_cdc, table_name, config
+            )
+
+    @dg.job(name=name)
+    def maintenance_job():
+        optimize_delta_tables()
+
+    schedule = dg.ScheduleDefinition(job=maintenance_job, cron_schedule=cron_schedule)
+
+    return maintenance_job, schedule
@@ -0,0 +1,88 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+# CDC columns read along with the captured columns, `__$update_mask` is never used.
+# `__$seqval` is not read either, the changes are ordered on it server side instead.
+CDC_COLUMNS = ("__$start_lsn", "__$operation")
+
+# Collation converting NVARCHAR to UTF-8 VARCHAR (SQL Server 2019+)
+UTF8_COLLATION = "Latin1_General_100_BIN2_UTF8"
+
+
+def quote_name(column: str) -> str:
+    """Quote a column name as a SQL Server identifier."""
+    return "[" + column.replace("]", "]]") + "]"
+
+
+@dataclass(frozen=True)
+class ColumnProjection:
+    """Columns of a table read from SQL Server, and the server-side casts applied to them.
+
+    Only the captured columns of the capture instance are read (the columns CDC keeps up to date),
+    restricted to `columns` and without `exclude` (e.g. LOB columns that are never stored).
+    The primary key columns are always read.
+
+    The casts shrink the bytes on the wire and let the readers produce compact Arrow types:
+
+    - cast_datetime2: DATETIME2(7) to DATETIME2(6), microseconds as stored by Polars and Delta
+    - cast_decimal: DECIMAL / NUMERIC / MONEY to FLOAT, lossy above 15 significant digits, so opt-in
+    - cast_nvarchar: NVARCHAR / NCHAR (UTF-16) to VARCHAR with a UTF-8 collation, about half the bytes
+      for mostly ASCII text and no transcoding in the reader
+    """
+
+    columns: Optional[tuple[str, ...]] = None
+    exclude: tuple[str, ...] = ()
+    cast_datetime2: bool = False
+    cast_decimal: bool = False
+    cast_nvarchar: bool = False
+
+    def project(self, captured_columns: dict[str, str], primary_key_columns: List[str]) -> dict[str, str]:
+        """Get the columns to read and their SQL Server type once cast, in column ordinal order.
+
+        Args:
+            captured_columns (dict): The captured columns and their SQL Server type, see `get_captured_columns`
+            primary_key_columns (list): The primary key columns, always read
+        Returns:
+            dict: The projected columns and their type as read
+        """
+        return {
+            column: self.cast_type(sql_type)
+            for column, sql_type in captured_columns.items()
+            if column in primary_key_columns
+            or (
+                (self.columns is None or column in self.columns)
+                and column not in self.exclude
+            )
+        }
+
+    def cast_type(self, sql_type: str) -> str:
+        """Get the SQL Server type a column of `sql_type` is read as."""
+        base_type = sql_type.split("(")[0]
+
+        if self.cast_datetime2 and sql_type == "datetime2(7)":
+            return "datetime2(6)"
+
+        if self.cast_decimal and base_type in ("decimal", "numeric", "money", "smallmoney"):
+            return "float"
+
+        if self.cast_nvarchar and base_type in ("nchar", "nvarchar"):
+            # A UTF-16 code unit takes up to 3 bytes in UTF-8
+            match = re.fullmatch(r"n?(?:var)?char\((\d+)\)", sql_type)
+            length = int(match.group(1)) * 3 if match else None
+            return f"varchar({length if length and length <= 8000 else 'max'})"
+
+        return sql_type
+
+    def select_expression(self, column: str, sql_type: str) -> str:
+        """Get the select list expression of a column of `sql_type`."""
+        name = quote_name(column)
+        cast_type = self.cast_type(sql_type)
+
+        if cast_type == sql_type:
+            return name
+
+        if cast_type.startswith("varchar"):
+            return f"CAST({name} COLLATE {UTF8_COLLATION} AS {cast_type.upper()}) AS {name}"
+
+        return f"CAST({name} AS {cast_type.upper()}) AS {name}"
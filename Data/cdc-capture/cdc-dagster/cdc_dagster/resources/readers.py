@@ -0,0 +1,120 @@
+import polars as pl
+import sqlalchemy as sa
+from abc import ABC, abstractmethod
+from sqlalchemy.dialects.mssql import pyodbc as mssql_pyodbc
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from cdc_dagster.resources.sql_server_cdc import SQLServerCDCResource
+
+
+class SQLServerReader(ABC):
+    """Base class for the backends reading SQL Server query results into Polars DataFrames."""
+
+    def __init__(self, sql_server_cdc: "SQLServerCDCResource"):
+        self.sql_server_cdc = sql_server_cdc
+
+    @abstractmethod
+    def read(self, query: sa.TextClause, parameters: Optional[dict] = None) -> pl.DataFrame:
+        """Read the full result of a query."""
+
+    @abstractmethod
+    def iter_batches(
+        self, query: sa.TextClause, parameters: Optional[dict] = None, batch_size=10000
+    ) -> Iterator[pl.DataFrame]:
+        """Read the result of a query in batches of `batch_size` rows."""
+
+
+class SQLAlchemyReader(SQLServerReader):
+    """Reads through the pooled SQLAlchemy + pyodbc connections of the resource.
+    pyodbc materializes Python row objects, which Polars then converts into columns."""
+
+    def read(self, query, parameters=None):
+        with self.sql_server_cdc.get_connection() as connection:
+            return pl.read_database(
+                query,
+                connection,
+                execute_options={"parameters": parameters or {}},
+            )
+
+    def iter_batches(self, query, parameters=None, batch_size=10000):
+        with self.sql_server_cdc.get_connection() as connection:
+            yield from pl.read_database(
+                query,
+                connection,
+                iter_batches=True,
+                batch_size=batch_size,
+                execute_options={"parameters": parameters or {}},
+            )
+
+
+class ArrowODBCReader(SQLServerReader):
+    """Reads columnar Arrow batches straight from the ODBC driver through arrow-odbc,
+    without going through Python row objects. Install with the `arrow` extra."""
+
+    def __init__(self, sql_server_cdc: "SQLServerCDCResource"):
+        super().__init__(sql_server_cdc)
+
+        try:
+            import arrow_odbc
+        except ImportError as e:
+            raise ImportError(
+                "The 'arrow-odbc' reader backend requires the arrow-odbc package, install it with `uv sync --extra arrow`"
+            ) from e
+
+        self._arrow_odbc = arrow_odbc
+
+    def _to_positional(self, query: sa.TextClause, parameters: Optional[dict]):
+        """ODBC only supports positional (?) parameters, which are passed as strings."""
+        compiled = query.compile(dialect=mssql_pyodbc.dialect(paramstyle="qmark"))
+        positional = [
+            None if parameters[name] is None else str(parameters[name])
+            for name in compiled.positiontup or []
+        ]
+
+        # SET and DECLARE statements should not report row counts as result sets
+        return f"SET NOCOUNT ON;\n{compiled}", positional
+
+    def _read_batches(self, query, parameters, batch_size):
+        config = self.sql_server_cdc.config
+        sql, positional = self._to_positional(query, parameters or {})
+
+        return self._arrow_odbc.read_arrow_batches_from_odbc(
+            query=sql,
+            connection_string=config.get_odbc_connection_string(),
+            user=config.user.get_value(),
+            password=config.password.get_value(),
+            parameters=positional,
+            batch_size=batch_size,
+            fetch_concurrently=True,
+        )
+
+    def read(self, query, parameters=None):
+        try:
+            reader = self._read_batches(query, parameters, batch_size=100_000)
+            return pl.from_arrow(reader.into_pyarrow_record_batch_reader().read_all())
+        except self._arrow_odbc.Error as e:
+            raise RuntimeError(f"ODBC error when reading from SQL Server: {str(e)}") from e
+
+    def iter_batches(self, query, parameters=None, batch_size=10000):
+        try:
+            for batch in self._read_batches(query, parameters, batch_size):
+                yield pl.from_arrow(batch)
+        except self._arrow_odbc.Error as e:
+            raise RuntimeError(f"ODBC error when reading from SQL Server: {str(e)}") from e
+
+
+READER_BACKENDS = {
+    "sqlalchemy": SQLAlchemyReader,
+    "arrow-odbc": ArrowODBCReader,
+}
+
+
+def create_reader(backend: str, sql_server_cdc: "SQLServerCDCResource") -> SQLServerReader:
+    """Create the reader for one of the `READER_BACKENDS`."""
+    if backend not in READER_BACKENDS:
+        raise ValueError(
+            f"Unknown reader backend '{backend}', expected one of {list(READER_BACKENDS)}"
+        )
+
+    return READER_BACKENDS[backend](sql_server_cdc)
@@ -4,8 +4,15 @@ import sqlalchemy as sa
 from sqlalchemy.exc import SQLAlchemyError
 from urllib.parse import quote_plus
 from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from cdc_dagster.constants import LSN_DEFAULT
-from typing import List
+from cdc_dagster.resources.projection import CDC_COLUMNS, ColumnProjection, quote_name
+from cdc_dagster.resources.readers import create_reader
+from typing import Iterator, List, Optional
+import threading
+import time
 
 
 class SQLServerCDCConfig(Config):
@@ -19,6 +26,17 @@ class SQLServerCDCConfig(Config):
 
     last_lsn: str = LSN_DEFAULT
 
+    # Seconds the CDC metadata of a table (primary keys, capture instance, flags) is cached
+    metadata_cache_ttl: int = 300
+
+    # Connection pool shared by all the assets (and threads) using the resource
+    pool_size: int = 8
+    max_overflow: int = 8
+    pool_recycle: int = 1800
+
+    # Backend reading the query results, one of `READER_BACKENDS` ("sqlalchemy" or "arrow-odbc")
+    reader_backend: str = "sqlalchemy"
+
     def get_connection_string(self):
         """Construct the connection string for SQLAlchemy."""
         pass_escaped = quote_plus(self.password.get_value())
@@ -26,13 +44,79 @@ class SQLServerCDCConfig(Config):
         driver_escaped = quote_plus("ODBC Driver 18 for SQL Server")
         return f"mssql+pyodbc://{user_escaped}:{pass_escaped}@{self.host.get_value()}/{self.database.get_value()}?driver={driver_escaped}"
 
+    def get_odbc_connection_string(self):
+        """Construct the ODBC connection string (without credentials) for the arrow-odbc reader."""
+        return f"Driver={{ODBC Driver 18 for SQL Server}};Server={self.host.get_value()};Database={self.database.get_value()};"
+
+
+@dataclass(frozen=True)
+class CDCTableMetadata:
+    """CDC metadata of a table, as returned by the preflight query."""
+
+    is_cdc_enabled_for_database: bool
+    capture_instance: Optional[str]
+    supports_net_changes: bool
+    primary_key_columns: tuple[str, ...]
+    # Last DDL change captured for the table, used to invalidate cached metadata
+    last_ddl_lsn: Optional[str]
+    # (column name, SQL Server type) of the captured columns, in column ordinal order
+    captured_columns: tuple[tuple[str, str], ...]
+    # LSNs at the moment of the preflight, these are never served from the cache
+    min_lsn: Optional[bytes]
+    max_lsn: Optional[bytes]
+    # The older capture instance while the table has two (after a schema change), see `for_lsn`
+    previous_capture_instance: Optional[str] = None
+    previous_supports_net_changes: bool = False
+    previous_captured_columns: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def is_cdc_enabled_for_table(self) -> bool:
+        return self.capture_instance is not None
+
+    def for_lsn(self, last_lsn: Optional[str]) -> "CDCTableMetadata":
+        """Get the metadata of the capture instance the changes after `last_lsn` are read from.
+
+        A new capture instance only holds the changes since it was created, its change functions
+        reject a `last_lsn` below its min LSN. The older capture instance is read until the
+        checkpoint reached the min LSN of the newest one, which is read from then on.
+        """
+        if (
+            self.previous_capture_instance is None
+            or last_lsn is None
+            or last_lsn == LSN_DEFAULT
+            or self.min_lsn is None
+            or last_lsn >= f"0x{self.min_lsn.hex().upper()}"
+        ):
+            return self
+
+        return replace(
+            self,
+            capture_instance=self.previous_capture_instance,
+            supports_net_changes=self.previous_supports_net_changes,
+            captured_columns=self.previous_captured_columns,
+            previous_capture_instance=None,
+            previous_supports_net_changes=False,
+            previous_captured_columns=(),
+        )
+
 
 class SQLServerCDCResource:
     """Resource to handle SQL Server CDC operations using native CDC functions."""
 
     def __init__(self, config: SQLServerCDCConfig):
         self.config = config
-        self.engine = sa.create_engine(self.config.get_connection_string())
+        self.engine = sa.create_engine(
+            self.config.get_connection_string(),
+            pool_size=self.config.pool_size,
+            max_overflow=self.config.max_overflow,
+            pool_recycle=self.config.pool_recycle,
+            pool_pre_ping=True,
+        )
+        self.reader = create_reader(self.config.reader_backend, self)
+
+        # TTL cache for the CDC metadata of the tables, keyed by (schema_name, table_name)
+        self._metadata_cache: dict[tuple[str, str], tuple[float, CDCTableMetadata]] = {}
+        self._metadata_lock = threading.Lock()
 
     @contextmanager
     def get_connection(self):
@@ -43,20 +127,188 @@ class SQLServerCDCResource:
         finally:
             connection.close()
 
-    def get_primary_key_columns(self, table_name: str) -> List[str]:
-        """Get the primary key columns for a CDC-enabled table."""
-        with self.get_connection() as connection:
-            instance = self.get_capture_instance_name("dbo", table_name)
+    def preflight(self, table_name, schema_name="dbo") -> CDCTableMetadata:
+        """Fetch all the CDC metadata of a table and the current LSNs in a single round-trip.
+        The result refreshes the metadata cache, invalidating it when a DDL change was captured
+        since the cached entry."""
+        # Deferred name resolution allows referencing the cdc schema, which only exists
+        # once CDC is enabled for the database
+        query = sa.text("""
+            IF EXISTS (SELECT 1 FROM sys.databases WHERE name = DB_NAME() AND is_cdc_enabled = 1)
+                SELECT
+                    CAST(1 AS BIT) AS is_cdc_enabled_for_database,
+                    ct.capture_instance,
+                    ct.supports_net_changes,
+                    (
+                        SELECT STRING_AGG(ic.column_name, ',') WITHIN GROUP (ORDER BY ic.index_ordinal)
+                        FROM cdc.index_columns ic
+                        WHERE ic.object_id = ct.object_id
+                    ) AS primary_key_columns,
+                    (
+                        SELECT MAX(dh.ddl_lsn)
+                        FROM cdc.ddl_history dh
+                        WHERE dh.object_id = ct.object_id
+                    ) AS last_ddl_lsn,
+                    (
+                        -- The types of the change table, which follows ALTER COLUMN on the source table
+                        SELECT STRING_AGG(
+                            CAST(cc.column_name + ' ' + cc.column_type AS NVARCHAR(MAX))
+                                + ISNULL(CASE
+                                    WHEN cc.column_type IN ('decimal', 'numeric')
+                                        THEN '(' + CAST(c.precision AS VARCHAR(3)) + ',' + CAST(c.scale AS VARCHAR(3)) + ')'
+                                    WHEN cc.column_type IN ('datetime2', 'datetimeoffset', 'time')
+                                        THEN '(' + CAST(c.scale AS VARCHAR(3)) + ')'
+                                    WHEN cc.column_type IN ('char', 'varchar', 'binary', 'varbinary')
+                                        THEN '(' + IIF(c.max_length = -1, 'max', CAST(c.max_length AS VARCHAR(4))) + ')'
+                                    WHEN cc.column_type IN ('nchar', 'nvarchar')
+                                        THEN '(' + IIF(c.max_length = -1, 'max', CAST(c.max_length / 2 AS VARCHAR(4))) + ')'
+                                END, ''),
+                            ';'
+                        ) WITHIN GROUP (ORDER BY cc.column_ordinal)
+                        FROM cdc.captured_columns cc
+                        LEFT JOIN sys.columns c ON c.object_id = cc.object_id AND c.name = cc.column_name
+                        WHERE cc.object_id = ct.object_id
+                    ) AS captured_columns,
+                    sys.fn_cdc_get_min_lsn(ct.capture_instance) AS min_lsn,
+                    sys.fn_cdc_get_max_lsn() AS max_lsn
+                FROM (SELECT 1 AS one) AS d
+                OUTER APPLY (
+                    -- A table has at most two capture instances, the newest first
+                    SELECT TOP 2 object_id, capture_instance, supports_net_changes, create_date
+                    FROM cdc.change_tables
+                    WHERE source_object_id = OBJECT_ID(QUOTENAME(:schema_name) + '.' + QUOTENAME(:table_name))
+                    ORDER BY create_date DESC
+                ) AS ct
+                ORDER BY ct.create_date DESC
+            ELSE
+                SELECT CAST(0 AS BIT), NULL, NULL, NULL, NULL, NULL, NULL, NULL
+        """)
 
-            query = sa.text("""
-            SELECT column_name FROM cdc.index_columns WHERE object_id = (
-                SELECT object_id FROM cdc.change_tables WHERE capture_instance = :capture_instance_name
+        try:
+            with self.get_connection() as connection:
+                rows = connection.execute(
+                    query, {"schema_name": schema_name, "table_name": table_name}
+                ).all()
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error when getting CDC metadata: {str(e)}"
+            ) from e
+
+        def parse_captured_columns(captured_columns) -> tuple[tuple[str, str], ...]:
+            return (
+                tuple(tuple(column.rsplit(" ", 1)) for column in captured_columns.split(";"))
+                if captured_columns
+                else ()
             )
-            """)
 
-            result = connection.execute(query, {"capture_instance_name": instance})
-            primary_key_columns = [row[0] for row in result]
-            return primary_key_columns
+        row = rows[0]
+        previous = rows[1] if len(rows) > 1 else None
+        metadata = CDCTableMetadata(
+            is_cdc_enabled_for_database=bool(row[0]),
+            capture_instance=row[1],
+            supports_net_changes=bool(row[2]),
+            primary_key_columns=tuple(row[3].split(",")) if row[3] else (),
+            last_ddl_lsn=self.lsn_to_hex_string(row[4]) if row[4] else None,
+            captured_columns=parse_captured_columns(row[5]),
+            min_lsn=row[6],
+            max_lsn=row[7],
+            previous_capture_instance=previous[1] if previous else None,
+            previous_supports_net_changes=bool(previous[2]) if previous else False,
+            previous_captured_columns=parse_captured_columns(previous[5]) if previous else (),
+        )
+
+        key = (schema_name, table_name)
+        with self._metadata_lock:
+            cached = self._metadata_cache.get(key)
+            if cached is not None and (
+                cached[1].last_ddl_lsn != metadata.last_ddl_lsn
+                or cached[1].capture_instance != metadata.capture_instance
+            ):
+                self._invalidate_metadata(schema_name, table_name)
+
+            self._metadata_cache[key] = (
+                time.monotonic() + self.config.metadata_cache_ttl,
+                metadata,
+            )
+
+        return metadata
+
+    def get_table_metadata(
+        self, table_name, schema_name="dbo", last_lsn=None
+    ) -> CDCTableMetadata:
+        """Get the CDC metadata of a table from the cache, running the preflight query when it expired.
+        With `last_lsn`, the metadata of the capture instance its changes are read from (see `CDCTableMetadata.for_lsn`).
+        """
+        with self._metadata_lock:
+            cached = self._metadata_cache.get((schema_name, table_name))
+
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1].for_lsn(last_lsn)
+
+        return self.preflight(table_name, schema_name).for_lsn(last_lsn)
+
+    def invalidate_metadata(self, table_name=None, schema_name="dbo"):
+        """Drop the cached CDC metadata of a table, or of all tables when no table is given."""
+        with self._metadata_lock:
+            if table_name is None:
+                self._metadata_cache.clear()
+            else:
+                self._invalidate_metadata(schema_name, table_name)
+
+    def _invalidate_metadata(self, schema_name, table_name):
+        # Expects the metadata lock to be held
+        self._metadata_cache.pop((schema_name, table_name), None)
+
+    def get_primary_key_columns(self, table_name: str, schema_name="dbo") -> List[str]:
+        """Get the primary key columns for a CDC-enabled table."""
+        return list(self.get_table_metadata(table_name, schema_name).primary_key_columns)
+
+    def get_captured_columns(
+        self, table_name: str, schema_name="dbo", last_lsn=None
+    ) -> dict[str, str]:
+        """Get the captured columns of the capture instance of a table, with their SQL Server type
+        (e.g. `int`, `nvarchar(50)`, `decimal(18,2)`, `datetime2(7)`), in column ordinal order.
+        The newest capture instance, or the one the changes after `last_lsn` are read from."""
+        return dict(
+            self.get_table_metadata(table_name, schema_name, last_lsn).captured_columns
+        )
+
+    def get_projected_columns(
+        self,
+        table_name: str,
+        projection: Optional[ColumnProjection] = None,
+        schema_name="dbo",
+        last_lsn=None,
+    ) -> dict[str, str]:
+        """Get the columns of a table read from SQL Server, with their SQL Server type as read (see `ColumnProjection`)."""
+        return (projection or ColumnProjection()).project(
+            self.get_captured_columns(table_name, schema_name, last_lsn),
+            self.get_primary_key_columns(table_name, schema_name),
+        )
+
+    def get_select_list(
+        self,
+        table_name: str,
+        projection: Optional[ColumnProjection] = None,
+        schema_name="dbo",
+        cdc_columns=(),
+        last_lsn=None,
+    ) -> str:
+        """Build the select list of a table from its projected columns, with the casts of the projection,
+        preceded by `cdc_columns`. `*` when the table has no captured columns.
+        With `last_lsn`, the columns of the capture instance its changes are read from."""
+        projection = projection or ColumnProjection()
+        captured_columns = self.get_captured_columns(table_name, schema_name, last_lsn)
+        if not captured_columns:
+            return "*"
+
+        expressions = [quote_name(column) for column in cdc_columns] + [
+            projection.select_expression(column, captured_columns[column])
+            for column in self.get_projected_columns(
+                table_name, projection, schema_name, last_lsn
+            )
+        ]
+        return ", ".join(expressions)
 
     def is_cdc_enabled_for_database(self):
         """Check if CDC is enabled for the database."""
@@ -73,26 +325,17 @@ class SQLServerCDCResource:
 
     def is_cdc_enabled_for_table(self, schema_name, table_name):
         """Check if CDC is enabled for the specified table."""
-        with self.get_connection() as connection:
-            capture_instance_name = self.get_capture_instance_name(
-                schema_name, table_name
-            )
-
-            query = sa.text(f"""
-                SELECT 1
-                FROM cdc.change_tables
-                WHERE capture_instance = '{capture_instance_name}'
-            """)
-
-            result = connection.execute(
-                query, {"schema_name": schema_name, "table_name": table_name}
-            ).scalar()
+        return self.get_table_metadata(table_name, schema_name).is_cdc_enabled_for_table
 
-            return bool(result)
+    def supports_net_changes(self, table_name, schema_name="dbo", last_lsn=None):
+        """Check if the capture instance of a table supports querying net changes,
+        the one the changes after `last_lsn` are read from when given."""
+        return self.get_table_metadata(table_name, schema_name, last_lsn).supports_net_changes
 
-    def get_capture_instance_name(self, schema_name, table_name):
-        """Get the CDC capture instance name for a table."""
-        return f"dbo_{table_name}"
+    def get_capture_instance_name(self, schema_name, table_name, last_lsn=None):
+        """Get the CDC capture instance name for a table (the most recent one if it has two),
+        or the one the changes after `last_lsn` are read from (see `CDCTableMetadata.for_lsn`)."""
+        return self.get_table_metadata(table_name, schema_name, last_lsn).capture_instance
 
     def get_current_lsn(self):
         """Get the current maximum LSN from SQL Server using native function."""
@@ -108,6 +351,42 @@ class SQLServerCDCResource:
                 query, {"capture_instance": capture_instance}
             ).scalar()
 
+    def get_lsn_lag(self, last_lsn) -> tuple[Optional[float], Optional[int]]:
+        """Get how far `last_lsn` is behind fn_cdc_get_max_lsn.
+
+        Returns:
+            tuple: The lag in seconds (between the commit times of both LSNs), and an estimate
+                of the lag in log bytes. An LSN is (VLF sequence, log block, slot) and log blocks
+                are 512 byte offsets, so the estimate is only available within the same VLF.
+        """
+        query = sa.text("""
+            DECLARE @from_lsn BINARY(10), @to_lsn BINARY(10)
+            SET @from_lsn = CONVERT(BINARY(10), :from_lsn, 1)
+            SET @to_lsn = sys.fn_cdc_get_max_lsn()
+
+            SELECT
+                DATEDIFF_BIG(MILLISECOND, sys.fn_cdc_map_lsn_to_time(@from_lsn), sys.fn_cdc_map_lsn_to_time(@to_lsn)),
+                @to_lsn
+        """)
+
+        try:
+            with self.get_connection() as connection:
+                lag_ms, max_lsn = connection.execute(query, {"from_lsn": last_lsn}).one()
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error when getting the LSN lag: {str(e)}"
+            ) from e
+
+        lag_bytes = None
+        from_lsn = bytes.fromhex(last_lsn[2:])
+        if max_lsn is not None and from_lsn[:4] == max_lsn[:4]:
+            lag_bytes = max(
+                (int.from_bytes(max_lsn[4:8], "big") - int.from_bytes(from_lsn[4:8], "big")) * 512,
+                0,
+            )
+
+        return (lag_ms / 1000 if lag_ms is not None else None), lag_bytes
+
     def hex_string_to_lsn(self, lsn_hex):
         """Convert a hexadecimal LSN string to binary for SQL Server functions."""
         with self.get_connection() as connection:
@@ -135,108 +414,431 @@ class SQLServerCDCResource:
 
         return f"0x{lsn_bytes.hex().upper()}"
 
+    def _prepare_table_changes(
+        self,
+        table_name,
+        last_lsn,
+        schema_name,
+        to_lsn=None,
+        net_changes=False,
+        projection: Optional[ColumnProjection] = None,
+    ):
+        """Validate the CDC set-up of a table and build the query for its changes.
+        The changes are read after `last_lsn` (exclusive) up to `to_lsn` (hex string, inclusive)
+        or the current maximum LSN.
+        With `net_changes`, only the final change per row is read through fn_cdc_get_net_changes.
+        Only the projected columns are read (see `ColumnProjection`), in LSN order.
+
+        Returns:
+            tuple: The query, its parameters and the current LSN as hex string.
+        """
+        # Check if CDC is enabled for the database and table
+        # bounded windows use the cached metadata, otherwise the preflight also returns the current LSN
+        # the capture instance is the one holding the changes after last_lsn
+        metadata = (
+            self.get_table_metadata(table_name, schema_name)
+            if to_lsn is not None
+            else self.preflight(table_name, schema_name)
+        ).for_lsn(last_lsn)
+
+        if not metadata.is_cdc_enabled_for_database:
+            raise ValueError(
+                f"CDC is not enabled for database {self.config.database.get_value()}"
+            )
+
+        if not metadata.is_cdc_enabled_for_table:
+            raise ValueError(f"CDC not enabled for table {schema_name}.{table_name}")
+
+        capture_instance = metadata.capture_instance
+
+        if net_changes and not metadata.supports_net_changes:
+            raise ValueError(
+                f"Net changes are not supported by capture instance {capture_instance}"
+            )
+
+        # Get current maximum LSN, unless we read a bounded window
+        if to_lsn is None:
+            to_lsn = self.lsn_to_hex_string(metadata.max_lsn)
+
+        # If no last_lsn provided, we should first take a first copy of the table
+        if last_lsn is None or last_lsn == LSN_DEFAULT:
+            raise ValueError(
+                f"Initial copy required for table {schema_name}.{table_name}"
+            )
+
+        # Use the native CDC function with parameterized query
+        # net changes return a single row per changed primary key (1=Delete, 2=Insert, 4=Update)
+        cdc_function = "fn_cdc_get_net_changes" if net_changes else "fn_cdc_get_all_changes"
+        select_list = self.get_select_list(
+            table_name, projection, schema_name, cdc_columns=CDC_COLUMNS, last_lsn=last_lsn
+        )
+
+        # The changes within a transaction keep their order without reading __$seqval,
+        # the all changes function reads the clustered index of the change table in this order
+        order_by = "__$start_lsn" if net_changes else "__$start_lsn, __$seqval"
+        # last_lsn was applied already and the CDC functions include their lower bound,
+        # so the changes are read from the next LSN, as in `has_changes_since` and `get_lsn_windows`
+        query = sa.text(f"""
+            DECLARE @from_lsn BINARY(10), @to_lsn BINARY(10), @min_lsn BINARY(10)
+            SET @from_lsn = sys.fn_cdc_increment_lsn(CONVERT(BINARY(10), :from_lsn, 1))
+            SET @to_lsn = CONVERT(BINARY(10), :to_lsn, 1)
+            SET @min_lsn = sys.fn_cdc_get_min_lsn(:capture_instance)
+            IF @from_lsn < @min_lsn SET @from_lsn = @min_lsn
+
+            SELECT {select_list} FROM cdc.{cdc_function}_{capture_instance}(
+                @from_lsn, @to_lsn, 'all'
+            )
+            ORDER BY {order_by}
+        """)
+        parameters = {
+            "from_lsn": last_lsn,
+            "to_lsn": to_lsn,
+            "capture_instance": capture_instance,
+        }
+
+        return query, parameters, to_lsn
+
     def get_table_changes(
-        self, table_name, last_lsn=None, schema_name="dbo", chunksize=10000
+        self,
+        table_name,
+        last_lsn=None,
+        schema_name="dbo",
+        to_lsn=None,
+        net_changes=False,
+        projection: Optional[ColumnProjection] = None,
     ) -> tuple[pl.DataFrame, str]:
         """Get changes from a CDC-enabled table since the last LSN.
         Uses the native SQL Server CDC function fn_cdc_get_all_changes.
 
+        Note: the whole change set is loaded into memory, use `iter_table_changes`
+        for large change sets.
+
         Args:
             table_name (str): The name of the table to query.
-            last_lsn (str, optional): The last processed LSN. If None, a full copy is performed.
+            last_lsn (str, optional): The last processed LSN (exclusive). If None, a full copy is performed.
             schema_name (str, optional): The schema name of the table. Defaults to 'dbo'.
-            chunksize (int, optional): Number of rows to fetch per query. Defaults to 10000.
+            to_lsn (str, optional): The last LSN (inclusive) to read. Defaults to the current maximum LSN.
+            net_changes (bool, optional): Only read the net change per row through fn_cdc_get_net_changes,
+                requires a capture instance with supports_net_changes. Defaults to False.
+            projection (ColumnProjection, optional): The columns to read and their casts. Defaults to all captured columns.
 
         Returns:
             tuple: A tuple containing the DataFrame of changes and the current LSN.
         """
         try:
-            with self.get_connection() as connection:
-                # Check if CDC is enabled for the database and table
-                if not self.is_cdc_enabled_for_database():
-                    raise ValueError(
-                        f"CDC is not enabled for database {self.config.database.get_value()}"
-                    )
+            query, parameters, current_lsn_hex = self._prepare_table_changes(
+                table_name, last_lsn, schema_name, to_lsn, net_changes, projection
+            )
 
-                if not self.is_cdc_enabled_for_table(schema_name, table_name):
-                    raise ValueError(
-                        f"CDC not enabled for table {schema_name}.{table_name}"
-                    )
+            changes_df = self.reader.read(query, parameters)
 
-                # Get the capture instance name
-                capture_instance = self.get_capture_instance_name(
-                    schema_name, table_name
-                )
-                if not capture_instance:
-                    raise ValueError(
-                        f"Could not find CDC capture instance for {schema_name}.{table_name}"
-                    )
+            return changes_df, current_lsn_hex
 
-                # Get current maximum LSN
-                current_lsn = self.get_current_lsn()
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error when getting CDC changes: {str(e)}"
+            ) from e
 
-                # If no last_lsn provided, we should first take a first copy of the table
-                if last_lsn is None or last_lsn == LSN_DEFAULT:
-                    raise ValueError(
-                        f"Initial copy required for table {schema_name}.{table_name}"
-                    )
+    def iter_table_changes(
+        self,
+        table_name,
+        last_lsn=None,
+        schema_name="dbo",
+        chunksize=10000,
+        to_lsn=None,
+        net_changes=False,
+        projection: Optional[ColumnProjection] = None,
+    ) -> tuple[Iterator[pl.DataFrame], str]:
+        """Stream changes from a CDC-enabled table since the last LSN in batches.
+        The connection stays open while the batches are consumed, so only
+        `chunksize` rows are held in memory at a time.
 
-                # Convert LSN hex strings to binary
-                from_lsn_hex = last_lsn
-                to_lsn_hex = f"0x{current_lsn.hex()}"
+        Args:
+            table_name (str): The name of the table to query.
+            last_lsn (str, optional): The last processed LSN (exclusive). If None, a full copy is performed.
+            schema_name (str, optional): The schema name of the table. Defaults to 'dbo'.
+            chunksize (int, optional): Number of rows to fetch per batch. Defaults to 10000.
+            to_lsn (str, optional): The last LSN (inclusive) to read. Defaults to the current maximum LSN.
+            net_changes (bool, optional): Only read the net change per row through fn_cdc_get_net_changes,
+                requires a capture instance with supports_net_changes. Defaults to False.
+            projection (ColumnProjection, optional): The columns to read and their casts. Defaults to all captured columns.
 
-                # Use the native CDC function with parameterized query
-                # Process in chunks to avoid memory issues with large tables
-                query = sa.text(f"""
-                    DECLARE @from_lsn BINARY(10), @to_lsn BINARY(10)
-                    SET @from_lsn = CONVERT(BINARY(10), :from_lsn, 1)
-                    SET @to_lsn = CONVERT(BINARY(10), :to_lsn, 1)
-       
-                    SELECT * FROM cdc.fn_cdc_get_all_changes_{capture_instance}(
-                        @from_lsn, @to_lsn, 'all'
-                    )
-                """)
+        Returns:
+            tuple: A tuple containing an iterator of DataFrame batches (in LSN order) and the current LSN.
+        """
+        try:
+            query, parameters, current_lsn_hex = self._prepare_table_changes(
+                table_name, last_lsn, schema_name, to_lsn, net_changes, projection
+            )
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error when getting CDC changes: {str(e)}"
+            ) from e
 
-                # Use chunksize to process large result sets in batches
-                changes_df = pl.read_database(
-                    query,
-                    connection,
-                    execute_options={
-                        "parameters": {"from_lsn": from_lsn_hex, "to_lsn": to_lsn_hex}
-                    },
-                )
+        def batches() -> Iterator[pl.DataFrame]:
+            try:
+                yield from self.reader.iter_batches(query, parameters, chunksize)
+            except SQLAlchemyError as e:
+                raise RuntimeError(
+                    f"Database error when streaming CDC changes: {str(e)}"
+                ) from e
+
+        return batches(), current_lsn_hex
 
-                # Convert binary LSN to hex string for storage
-                current_lsn_hex = self.lsn_to_hex_string(current_lsn)
+    def has_changes_since(self, table_name, last_lsn, schema_name="dbo") -> bool:
+        """Check whether the change table of a table holds changes after `last_lsn` (exclusive).
+        A single seek on the clustered index of the change table, so it is cheap to run before any read.
+        """
+        capture_instance = self.get_capture_instance_name(schema_name, table_name, last_lsn)
+
+        query = sa.text(f"""
+            DECLARE @from_lsn BINARY(10)
+            SET @from_lsn = CONVERT(BINARY(10), :from_lsn, 1)
 
-                return changes_df, current_lsn_hex
+            SELECT CASE WHEN EXISTS (
+                SELECT 1
+                FROM cdc.[{capture_instance}_CT]
+                WHERE __$start_lsn > @from_lsn AND __$operation <> 3
+            ) THEN 1 ELSE 0 END
+        """)
 
+        try:
+            with self.get_connection() as connection:
+                return bool(
+                    connection.execute(query, {"from_lsn": last_lsn}).scalar()
+                )
         except SQLAlchemyError as e:
             raise RuntimeError(
-                f"Database error when getting CDC changes: {str(e)}"
+                f"Database error when checking for CDC changes: {str(e)}"
             ) from e
 
-    def get_full_table_data(self, table_name):
-        """Get the entire table data (used for initial load) with memory optimization."""
-        schema_name = "dbo"  # Default schema
+    def get_max_lsns(self, table_names: List[str], schema_name="dbo") -> dict[str, str]:
+        """Get the LSN of the last change of every table in a single round-trip,
+        a seek on the clustered index of every change table.
+
+        Returns:
+            dict: The last change LSN per table name, `LSN_DEFAULT` for tables without changes.
+        """
+        if not table_names:
+            return {}
+
+        selects = []
+        for i, table_name in enumerate(table_names):
+            capture_instance = self.get_capture_instance_name(schema_name, table_name)
+            selects.append(
+                f"SELECT {i} AS table_index, MAX(__$start_lsn) AS max_lsn FROM cdc.[{capture_instance}_CT]"
+            )
+
         try:
             with self.get_connection() as connection:
-                # Use chunking to handle large tables
-                query = sa.text(f"SELECT * FROM {schema_name}.{table_name}")
+                result = connection.execute(sa.text(" UNION ALL ".join(selects)))
+                return {
+                    table_names[table_index]: self.lsn_to_hex_string(max_lsn)
+                    for table_index, max_lsn in result
+                }
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error when getting the max LSNs: {str(e)}"
+            ) from e
+
+    def get_lsn_windows(
+        self, table_name, last_lsn, to_lsn, max_rows, schema_name="dbo"
+    ) -> List[tuple[str, str]]:
+        """Split the LSN range (last_lsn, to_lsn] of a table into windows of about `max_rows` changes.
+        The windows are estimated from the row counts per transaction in the change table,
+        a transaction is never split so a window can exceed `max_rows` when a single
+        transaction is larger than that.
+
+        Args:
+            table_name (str): The name of the table to query.
+            last_lsn (str): The last processed LSN (exclusive).
+            to_lsn (str): The last LSN to read (inclusive).
+            max_rows (int): The targeted number of changes per window.
+            schema_name (str, optional): The schema name of the table. Defaults to 'dbo'.
+
+        Returns:
+            list: The (from_lsn, to_lsn) hex string pairs of every window (both inclusive), in LSN order.
+        """
+        capture_instance = self.get_capture_instance_name(schema_name, table_name, last_lsn)
+
+        # Update before images (__$operation = 3) are not returned by fn_cdc_get_all_changes with 'all'
+        query = sa.text(f"""
+            DECLARE @from_lsn BINARY(10), @to_lsn BINARY(10)
+            SET @from_lsn = CONVERT(BINARY(10), :from_lsn, 1)
+            SET @to_lsn = CONVERT(BINARY(10), :to_lsn, 1)
+
+            SELECT MIN(start_lsn) AS window_start, MAX(start_lsn) AS window_end
+            FROM (
+                SELECT
+                    start_lsn,
+                    (SUM(row_count) OVER (ORDER BY start_lsn ROWS UNBOUNDED PRECEDING) - 1) / :max_rows AS window_id
+                FROM (
+                    SELECT __$start_lsn AS start_lsn, COUNT(*) AS row_count
+                    FROM cdc.[{capture_instance}_CT]
+                    WHERE __$start_lsn > @from_lsn AND __$start_lsn <= @to_lsn AND __$operation <> 3
+                    GROUP BY __$start_lsn
+                ) AS transactions
+            ) AS windows
+            GROUP BY window_id
+            ORDER BY window_end
+        """)
 
-                # Read the table
-                full_df = pl.read_database(
+        try:
+            with self.get_connection() as connection:
+                result = connection.execute(
                     query,
-                    connection,
+                    {"from_lsn": last_lsn, "to_lsn": to_lsn, "max_rows": max_rows},
                 )
+                return [
+                    (self.lsn_to_hex_string(start), self.lsn_to_hex_string(end))
+                    for start, end in result
+                ]
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error when getting CDC windows: {str(e)}"
+            ) from e
 
-                return full_df
+    def get_full_table_data(self, table_name, projection: Optional[ColumnProjection] = None):
+        """Get the entire table data (used for initial load) with memory optimization.
+        Only the projected columns are read (see `ColumnProjection`)."""
+        schema_name = "dbo"  # Default schema
+        try:
+            select_list = self.get_select_list(table_name, projection, schema_name)
+            query = sa.text(f"SELECT {select_list} FROM {schema_name}.{table_name}")
+
+            # Read the table
+            full_df = self.reader.read(query)
+
+            return full_df
 
         except SQLAlchemyError as e:
             raise RuntimeError(
                 f"Database error when getting full table data: {str(e)}"
             ) from e
 
+    def get_primary_key_ranges(self, table_name, partitions, schema_name="dbo") -> List[tuple]:
+        """Split a table into about `partitions` ranges of its first primary key column.
+        Integer keys are split into equal-width ranges from their MIN/MAX (two index seeks),
+        other key types into equal-count ranges through NTILE.
+
+        The ranges are half-open, so a key value never falls in two of them, even when the first
+        key column of a composite key repeats across NTILE buckets.
+
+        Returns:
+            list: The (lower, upper) bounds of every range (lower inclusive, upper exclusive,
+                None for the last range which is open-ended), in key order.
+        """
+        key_column = self.get_primary_key_columns(table_name, schema_name)[0]
+
+        try:
+            with self.get_connection() as connection:
+                query = sa.text(f"""
+                    SELECT MIN([{key_column}]), MAX([{key_column}])
+                    FROM {schema_name}.[{table_name}]
+                """)
+                lower, upper = connection.execute(query).one()
+
+                if lower is None:
+                    return []
+
+                if isinstance(lower, int):
+                    step = -(-(upper - lower + 1) // partitions)
+                    lowers = list(range(lower, upper + 1, step))
+                else:
+                    query = sa.text(f"""
+                        SELECT DISTINCT MIN(k)
+                        FROM (
+                            SELECT [{key_column}] AS k, NTILE(:partitions) OVER (ORDER BY [{key_column}]) AS bucket
+                            FROM {schema_name}.[{table_name}]
+                        ) AS buckets
+                        GROUP BY bucket
+                        ORDER BY 1
+                    """)
+                    lowers = list(
+                        connection.execute(query, {"partitions": partitions}).scalars()
+                    )
+
+                return list(zip(lowers, lowers[1:] + [None]))
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error when getting primary key ranges: {str(e)}"
+            ) from e
+
+    def get_table_range(
+        self,
+        table_name,
+        lower,
+        upper,
+        schema_name="dbo",
+        projection: Optional[ColumnProjection] = None,
+    ) -> pl.DataFrame:
+        """Get the rows of a table within a range of its first primary key column,
+        from `lower` (inclusive) to `upper` (exclusive, None for no upper bound)."""
+        key_column = self.get_primary_key_columns(table_name, schema_name)[0]
+
+        try:
+            select_list = self.get_select_list(table_name, projection, schema_name)
+            upper_predicate = f"AND [{key_column}] < :upper" if upper is not None else ""
+            query = sa.text(f"""
+                SELECT {select_list} FROM {schema_name}.[{table_name}]
+                WHERE [{key_column}] >= :lower {upper_predicate}
+            """)
+
+            params = {"lower": lower}
+            if upper is not None:
+                params["upper"] = upper
+            return self.reader.read(query, params)
+
+        except SQLAlchemyError as e:
+            raise RuntimeError(
+                f"Database error when getting table range: {str(e)}"
+            ) from e
+
+    def iter_full_table_data(
+        self,
+        table_name,
+        partitions,
+        max_workers=4,
+        schema_name="dbo",
+        projection: Optional[ColumnProjection] = None,
+    ) -> Iterator[pl.DataFrame]:
+        """Get the entire table data (used for initial load) as primary key ranges read in parallel.
+        The ranges are yielded as they arrive (not in key order) and at most `max_workers`
+        ranges are in flight, bounding the memory to a few ranges instead of the whole table.
+        """
+        ranges = iter(self.get_primary_key_ranges(table_name, partitions, schema_name))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {
+                executor.submit(
+                    self.get_table_range, table_name, lower, upper, schema_name, projection
+                )
+                for lower, upper in islice(ranges, max_workers)
+            }
+
+            # An empty table has no ranges, still return its (empty) data for the schema
+            if not pending:
+                yield self.get_full_table_data(table_name, projection)
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    for lower, upper in islice(ranges, 1):
+                        pending.add(
+                            executor.submit(
+                                self.get_table_range,
+                                table_name,
+                                lower,
+                                upper,
+                                schema_name,
+                                projection,
+                            )
+                        )
+
+                    yield future.result()
+
     # def enable_cdc_for_database(self):
     #     """Enable CDC for the database if not already enabled using native procedure."""
     #     try:
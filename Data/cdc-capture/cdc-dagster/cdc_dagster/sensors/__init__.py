@@ -0,0 +1 @@
+# This file initializes the sensors subpackage.
\ No newline at end of file
@@ -0,0 +1,114 @@
+import json
+import time
+import dagster as dg
+from typing import List
+
+from cdc_dagster.assets.delta_assets import (
+    checkpoint_store,
+    get_asset_name,
+)
+from cdc_dagster.constants import LSN_DEFAULT
+from cdc_dagster.resources.sql_server_cdc import SQLServerCDCResource
+
+
+def create_cdc_sensor(
+    table_names: List[str],
+    name="cdc_changes_sensor",
+    minimum_interval_seconds: int = 15,
+    coalesce_seconds: int = 30,
+    request_timeout_seconds: int = 900,
+):
+    """Factory function to create a sensor materializing the Delta assets of the tables whose changes moved.
+
+    Every evaluation costs a `fn_cdc_get_max_lsn` call, and when that moved, one query for
+    the last change LSN of every capture instance. A table is only materialized once its changes
+    were pending for `coalesce_seconds`, so a burst of changes is applied as one micro-batch,
+    while changes land within about `coalesce_seconds + minimum_interval_seconds`.
+
+    The cursor holds the last seen `fn_cdc_get_max_lsn`, per pending table when its changes
+    were first seen, and per requested table the LSN it was requested up to and when, so it is not
+    requested again while its run is in flight (or until `request_timeout_seconds`, when the run failed).
+
+    Args:
+        table_names (list): The names of the SQL Server tables to watch.
+        name (str, optional): The name of the sensor. Defaults to 'cdc_changes_sensor'.
+        minimum_interval_seconds (int, optional): Time between two polls. Defaults to 15.
+        coalesce_seconds (int, optional): Time changes are left to accumulate before materializing. Defaults to 30.
+        request_timeout_seconds (int, optional): Time after which a table whose checkpoint did not reach
+            the requested LSN is requested again. Defaults to 900.
+    """
+    asset_names = {table_name: get_asset_name(table_name) for table_name in table_names}
+
+    @dg.sensor(
+        name=name,
+        asset_selection=[dg.AssetKey(asset_name) for asset_name in asset_names.values()],
+        minimum_interval_seconds=minimum_interval_seconds,
+        required_resource_keys={"sql_server_cdc"},
+    )
+    def cdc_changes_sensor(context: dg.SensorEvaluationContext):
+        """Sensor polling the max LSN of the capture instances."""
+        sql_server_cdc: SQLServerCDCResource = context.resources.sql_server_cdc
+        cursor = json.loads(context.cursor) if context.cursor else {}
+        pending: dict = cursor.get("pending", {})
+        requested: dict = cursor.get("requested", {})
+
+        current_lsn = sql_server_cdc.lsn_to_hex_string(sql_server_cdc.get_current_lsn())
+        if current_lsn == cursor.get("current_lsn") and not pending and not requested:
+            return dg.SkipReason(f"No changes since LSN {current_lsn}")
+
+        now = time.time()
+        max_lsns = sql_server_cdc.get_max_lsns(table_names)
+
+        for table_name, max_lsn in max_lsns.items():
+            asset_name = asset_names[table_name]
+            # A read of the store only, the LSN staged for a write of the IO Manager is taken as
+            # the upper bound of the progress of the asset, without checking the Delta table
+            checkpoint = checkpoint_store.get(asset_name)
+            last_lsn = (
+                max(checkpoint.lsn or LSN_DEFAULT, checkpoint.pending_lsn or LSN_DEFAULT)
+                if checkpoint
+                else LSN_DEFAULT
+            )
+
+            # Changes up to the requested LSN are being applied by a run already
+            requested_lsn, requested_at = requested.get(table_name, (LSN_DEFAULT, now))
+            if last_lsn >= requested_lsn or now - requested_at >= request_timeout_seconds:
+                requested.pop(table_name, None)
+                requested_lsn = LSN_DEFAULT
+
+            if max_lsn > max(last_lsn, requested_lsn):
+                pending.setdefault(table_name, now)
+            else:
+                pending.pop(table_name, None)
+
+        due_tables = [
+            table_name
+            for table_name, first_seen in pending.items()
+            if now - first_seen >= coalesce_seconds
+        ]
+        for table_name in due_tables:
+            pending.pop(table_name)
+            requested[table_name] = (max_lsns[table_name], now)
+
+        context.update_cursor(
+            json.dumps(
+                {"current_lsn": current_lsn, "pending": pending, "requested": requested}
+            )
+        )
+
+        if not due_tables:
+            return dg.SkipReason(
+                f"Waiting for changes of {sorted(pending)} to coalesce"
+                if pending
+                else f"No changes to apply up to LSN {current_lsn}"
+            )
+
+        context.log.info(f"Changes pending for {due_tables}, materializing")
+
+        # The run key deduplicates requests while a run for the same changes is in flight
+        return dg.RunRequest(
+            run_key=f"{name}:{current_lsn}:{','.join(sorted(due_tables))}",
+            asset_selection=[dg.AssetKey(asset_names[table_name]) for table_name in due_tables],
+        )
+
+    return cdc_changes_sensor
@@ -0,0 +1,162 @@
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from deltalake import DeltaTable
+from deltalake.exceptions import TableNotFoundError
+from typing import Optional
+
+from cdc_dagster.constants import PATH_CHECKPOINTS
+
+# Delta operations that do not change the data, these never commit a staged checkpoint
+MAINTENANCE_OPERATIONS = {"OPTIMIZE", "VACUUM START", "VACUUM END"}
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """The last committed LSN of an asset, and the LSN staged by a write that may not have landed yet."""
+
+    lsn: Optional[str]
+    delta_version: Optional[int]
+    pending_lsn: Optional[str]
+    # The version of the Delta table before the staged write, None when the table did not exist yet
+    pending_base_version: Optional[int]
+
+
+def get_delta_version(delta_path: str) -> Optional[int]:
+    """Get the current version of a Delta table, None when it does not exist."""
+    try:
+        return DeltaTable(delta_path).version()
+    except TableNotFoundError:
+        return None
+
+
+def has_data_commit_since(delta_path: str, base_version: Optional[int]) -> bool:
+    """Check whether a commit changing the data of a Delta table landed after `base_version`."""
+    try:
+        dt = DeltaTable(delta_path)
+    except TableNotFoundError:
+        return False
+
+    if base_version is None:
+        return True
+
+    if dt.version() <= base_version:
+        return False
+
+    return any(
+        commit.get("version", -1) > base_version
+        and commit.get("operation") not in MAINTENANCE_OPERATIONS
+        for commit in dt.history(dt.version() - base_version)
+    )
+
+
+class CheckpointStore:
+    """Durable store of the last processed LSN per asset, a single SQLite row each.
+
+    A checkpoint is either committed right after the Delta commit it belongs to (`commit`,
+    recording the Delta version), or staged before a write done by someone else, e.g. the
+    IO Manager after the asset returned (`stage`). A staged checkpoint counts once a data commit
+    landed on the Delta table after the version it was staged on, so the LSN never runs ahead of
+    the data. Reads (`get`, `get_lsn`) never change the store: the next run of the asset commits
+    the staged checkpoint once it landed (`resolve`), or replaces it with its own `stage`.
+
+    A crash between a Delta commit and its checkpoint replays the changes since the previous
+    checkpoint, which the merges apply idempotently.
+    """
+
+    def __init__(self, path: str = PATH_CHECKPOINTS):
+        self.path = path
+
+    @contextmanager
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        # One connection per call keeps the store safe to use from threads
+        with closing(sqlite3.connect(self.path, timeout=30)) as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    name TEXT PRIMARY KEY,
+                    lsn TEXT,
+                    delta_version INTEGER,
+                    pending_lsn TEXT,
+                    pending_base_version INTEGER,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            with connection:
+                yield connection
+
+    def get(self, name: str) -> Optional[Checkpoint]:
+        """Get the checkpoint of an asset as stored, None when it has none."""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT lsn, delta_version, pending_lsn, pending_base_version FROM checkpoints WHERE name = ?",
+                (name,),
+            ).fetchone()
+
+        return Checkpoint(*row) if row else None
+
+    def get_lsn(self, name: str, delta_path: str) -> Optional[str]:
+        """Get the last LSN of an asset whose changes landed on its Delta table, without changing the store:
+        its staged LSN once a data commit landed after the version it was staged on, its committed LSN otherwise."""
+        checkpoint = self.get(name)
+        if checkpoint is None:
+            return None
+
+        if checkpoint.pending_lsn is not None and has_data_commit_since(
+            delta_path, checkpoint.pending_base_version
+        ):
+            return checkpoint.pending_lsn
+
+        return checkpoint.lsn
+
+    def resolve(self, name: str, delta_path: str) -> Optional[str]:
+        """Get the last LSN of an asset like `get_lsn`, committing its staged LSN once the write landed.
+        Only called by the runs of the asset itself, a staged LSN whose write did not land (yet)
+        is kept until the next `stage` of the asset replaces it."""
+        checkpoint = self.get(name)
+        if checkpoint is None:
+            return None
+
+        if checkpoint.pending_lsn is not None and has_data_commit_since(
+            delta_path, checkpoint.pending_base_version
+        ):
+            self.commit(name, checkpoint.pending_lsn, delta_path)
+            return checkpoint.pending_lsn
+
+        return checkpoint.lsn
+
+    def commit(self, name: str, lsn: str, delta_path: Optional[str] = None):
+        """Commit the LSN of an asset, along with the current version of its Delta table."""
+        delta_version = get_delta_version(delta_path) if delta_path else None
+
+        with self._connect() as connection:
+            connection.execute(
+                """
+                INSERT INTO checkpoints (name, lsn, delta_version, pending_lsn, pending_base_version)
+                VALUES (?, ?, ?, NULL, NULL)
+                ON CONFLICT (name) DO UPDATE SET
+                    lsn = excluded.lsn,
+                    delta_version = excluded.delta_version,
+                    pending_lsn = NULL,
+                    pending_base_version = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (name, str(lsn), delta_version),
+            )
+
+    def stage(self, name: str, lsn: str, delta_path: str):
+        """Stage the LSN of an asset, to be committed once its Delta table received the write."""
+        with self._connect() as connection:
+            connection.execute(
+                """
+                INSERT INTO checkpoints (name, pending_lsn, pending_base_version)
+                VALUES (?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    pending_lsn = excluded.pending_lsn,
+                    pending_base_version = excluded.pending_base_version,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (name, str(lsn), get_delta_version(delta_path)),
+            )
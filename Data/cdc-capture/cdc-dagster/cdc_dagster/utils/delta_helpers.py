@@ -1,8 +1,20 @@
 import polars as pl
-from typing import List
+from deltalake import DeltaTable
+from typing import List, Optional, Union
 
+from cdc_dagster.utils.key_index import (
+    build_key_index,
+    get_candidate_files,
+    key_range_predicate,
+)
+from cdc_dagster.utils.partitioning import DeltaPartitionSpec
 
-def process_cdc_changes(cdc_changes: pl.DataFrame, indices: List[str]) -> pl.DataFrame:
+
+def process_cdc_changes(
+    df_current: Union[pl.DataFrame, pl.LazyFrame],
+    cdc_changes: Union[pl.DataFrame, pl.LazyFrame],
+    indices: List[str],
+) -> pl.LazyFrame:
     """Efficiently process CDC changes and merge them into the Delta file.
     A CDC Change consists of the following operations:
 
@@ -32,69 +44,187 @@ def process_cdc_changes(cdc_changes: pl.DataFrame, indices: List[str]) -> pl.Dat
     ```
 
     We now perform a merge according to the Delta Lake merge operations (https://delta.io/blog/2023-02-14-delta-lake-merge/) to correctly merge those changes
-    into the existing delta lake, reducing the amount of data taken into memory (avoiding a full load of the delta file when possible).
+    into the existing delta lake. The merge is a lazy query plan: pass `pl.scan_delta(...)` as the current state
+    and collect the result with `collect(engine="streaming")`, so no intermediate copies of the current state are made.
+    The whole current state is still scanned (no key or file predicate is pushed down) and the result is the full
+    new table, to be rewritten by the caller; `merge_cdc_changes` only reads and rewrites the files of the changed keys.
+
+    Every key touched by the changes is removed from the current state, then the last change per key
+    is added back unless it is a delete. Updates thus replace the full row (NULL values included),
+    and deletes followed by a re-insert keep the re-inserted row.
+
+    Columns the changes gained (e.g. after the capture instance was recreated with a new column) are
+    kept, NULL for the untouched rows, and columns are cast to the wider type of both sides.
 
     Args:
-        df_current (pl.DataFrame): Current state of Delta data
-        cdc_changes (pl.DataFrame): CDC records with '__$operation' column (1=Delete, 2=Insert, 4=Update)
-        primary_keys: List of column names comprising the primary key
+        df_current (pl.DataFrame | pl.LazyFrame): Current state of Delta data
+        cdc_changes (pl.DataFrame | pl.LazyFrame): CDC records with '__$operation' column (1=Delete, 2=Insert, 4=Update)
+        indices: List of column names comprising the primary key
     Returns:
-        Tuple[pl.DataFrame, pl.DataFrame]: Tuple of DataFrames:
-            - Upserts to be applied to the Delta table (inserts and updates)
-            - Deletes to be applied to the Delta table
+        pl.LazyFrame: The new state of the Delta data
     """
+    df_current = df_current.lazy()
+    current_columns = df_current.collect_schema().names()
+
     # Validate keys exist in both datasets
+    change_columns = cdc_changes.lazy().collect_schema().names()
     missing_keys = [
-        pk
-        for pk in indices
-        if pk not in df_current.columns or pk not in cdc_changes.columns
+        pk for pk in indices if pk not in current_columns or pk not in change_columns
     ]
     if missing_keys:
         raise ValueError(f"Missing primary key columns: {missing_keys}")
 
     # Process latest state per entity (handling multiple operations)
-    latest_changes = cdc_changes.unique(subset=indices, keep="last")
+    latest_changes = collapse_cdc_changes(cdc_changes.lazy(), indices)
+
+    # Remove every touched key, then add back the final state of the rows that were not deleted
+    current_untouched = df_current.join(
+        latest_changes.select(indices), on=indices, how="anti"
+    )
+    upserts = latest_changes.filter(pl.col("_cdc_operation") != 1).drop("_cdc_operation")
+
+    # Columns missing on either side are filled with NULL, new columns come after the current ones
+    return pl.concat([current_untouched, upserts], how="diagonal_relaxed")
+
 
-    # Split operations using efficient filtering
-    delete_mask = pl.col("__$operation") == 1
-    update_mask = pl.col("__$operation") == 4
-    insert_mask = pl.col("__$operation") == 2
+def collapse_cdc_changes(
+    cdc_changes: Union[pl.DataFrame, pl.LazyFrame], indices: List[str]
+) -> Union[pl.DataFrame, pl.LazyFrame]:
+    """Collapse CDC changes to the final state per primary key.
 
-    deletes = latest_changes.filter(delete_mask)
-    updates = latest_changes.filter(update_mask)
-    inserts = latest_changes.filter(insert_mask)
+    Update before images (__$operation = 3) are dropped first, then the changes are stably sorted
+    by `__$start_lsn` (and `__$seqval` when it was read), and the last change of every key is kept
+    in a single group by. `__$seqval` is not read by default: the changes within a transaction come
+    in the order of the server ORDER BY (`__$start_lsn, __$seqval`), which the stable sort and the
+    ordered group by keep. An insert / delete / re-insert sequence thus resolves to the re-insert,
+    and an insert followed by a delete to the delete.
+
+    The operation is renamed to `_cdc_operation` and the other CDC columns (`__$start_lsn`,
+    `__$seqval`, `__$update_mask`) are dropped. Can be applied again on the concatenation of
+    already collapsed batches (in LSN order), which are then kept in their order.
+    """
+    columns = cdc_changes.collect_schema().names()
 
-    # Apply deletions using composite key anti-join
-    current_after_deletes = df_current.join(
-        deletes.select(indices), on=indices, how="anti"
+    if "__$operation" in columns:
+        cdc_changes = cdc_changes.filter(pl.col("__$operation") != 3).rename(
+            {"__$operation": "_cdc_operation"}
+        )
+
+    order_columns = [col for col in ["__$start_lsn", "__$seqval"] if col in columns]
+    if order_columns:
+        cdc_changes = cdc_changes.sort(order_columns, maintain_order=True)
+
+    # The group by moves the keys first, restore the column order of the table
+    output_columns = [
+        col for col in cdc_changes.collect_schema().names() if not col.startswith("__$")
+    ]
+
+    return (
+        cdc_changes.select(output_columns)
+        .group_by(indices, maintain_order=True)
+        .last()
+        .select(output_columns)
     )
 
-    # Process updates through coalesced left join
-    if not updates.is_empty():
-        update_columns = [col for col in df_current.columns if col not in indices]
-        current_after_updates = current_after_deletes.join(
-            updates, on=indices, how="left", suffix="_update"
-        ).select(
+
+def merge_cdc_changes(
+    delta_path: str,
+    cdc_changes: pl.DataFrame,
+    indices: List[str],
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+) -> dict:
+    """Merge CDC changes into the Delta table through a Delta Lake MERGE,
+    only the files containing the changed keys are rewritten.
+
+    The changes are reduced to the last change per key (see `collapse_cdc_changes`), then:
+
+    - Deleted (_cdc_operation = 1) rows are deleted when matched
+    - Inserted (2) and Updated After (4) rows update the matched row (NULL values included) or are inserted
+
+    The key index (see `cdc_dagster.utils.key_index`) narrows the files the MERGE has to scan:
+    when no file can hold any of the changed keys, the rows are appended without a MERGE,
+    otherwise the MERGE predicate is extended with the key range of the changes.
+    With a partition spec, the MERGE is also restricted to the partitions of the changed rows and of their
+    stored version (see `DeltaPartitionSpec.stored_partitions`).
+
+    Args:
+        delta_path (str): Path of the Delta table
+        cdc_changes (pl.DataFrame): CDC records, either raw (`__$operation`) or reduced by `collapse_cdc_changes`
+        indices (List[str]): List of column names comprising the primary key
+        partition_spec (DeltaPartitionSpec, optional): The partitioning of the Delta table
+    Returns:
+        dict: The metrics of the Delta Lake MERGE
+    """
+    source = collapse_cdc_changes(cdc_changes, indices)
+    if partition_spec:
+        source = partition_spec.with_partition_column(source)
+
+    missing_keys = [pk for pk in indices if pk not in source.columns]
+    if missing_keys:
+        raise ValueError(f"Missing primary key columns: {missing_keys}")
+
+    dt = DeltaTable(delta_path)
+
+    # Columns the reader could not type (only NULL values) take the type of the Delta column
+    target_schema = pl.scan_delta(dt).collect_schema()
+    source = source.cast(
+        {
+            col: target_schema[col]
+            for col, dtype in source.schema.items()
+            if dtype == pl.Null and col in target_schema
+        }
+    )
+
+    key_index = build_key_index(dt, indices[0])
+    candidate_files = get_candidate_files(key_index, source[indices[0]])
+
+    if not candidate_files:
+        # None of the keys exist in the table yet, the deletes match nothing
+        inserts = source.filter(pl.col("_cdc_operation") != 1).drop("_cdc_operation")
+        inserts.write_delta(dt, mode="append")
+        return {
+            "num_source_rows": len(source),
+            "num_target_rows_inserted": len(inserts),
+            "num_target_rows_updated": 0,
+            "num_target_rows_deleted": 0,
+            "num_target_files_added": 1 if len(inserts) else 0,
+            "num_target_files_removed": 0,
+        }
+
+    columns = {
+        f'"{col}"': f's."{col}"' for col in source.columns if col != "_cdc_operation"
+    }
+    predicates = [f't."{col}" = s."{col}"' for col in indices]
+
+    # A literal range on the target lets Delta skip the files outside of it
+    range_predicate = key_range_predicate(source[indices[0]], indices[0])
+    if range_predicate:
+        predicates.append(range_predicate)
+
+    # Only the touched partitions are read and rewritten, the rows are matched on their key alone:
+    # an update of the partition source column moves the row out of the partition of its stored version
+    if partition_spec:
+        partitions = pl.concat(
             [
-                *indices,
-                *[
-                    pl.coalesce(pl.col(f"{col}_update"), pl.col(col)).alias(col)
-                    for col in update_columns
-                ],
-            ]
+                source.select(partition_spec.partition_column),
+                partition_spec.stored_partitions(dt, source.select(indices), source[indices[0]]),
+            ],
+            how="vertical_relaxed",
         )
-    else:
-        current_after_updates = current_after_deletes
-
-    # Handle insert candidates (original inserts + unmatched updates)
-    existing_ids = current_after_updates.select(indices)
-    insert_candidates = pl.concat(
-        [
-            inserts.select(df_current.columns),
-            updates.join(existing_ids, on=indices, how="anti").select(
-                df_current.columns
-            ),
-        ]
-    )
+        predicates.append(partition_spec.partition_predicate(partitions))
 
-    return pl.concat([current_after_updates, insert_candidates], how="vertical")
+    return (
+        source.write_delta(
+            dt,
+            mode="merge",
+            delta_merge_options={
+                "predicate": " AND ".join(predicates),
+                "source_alias": "s",
+                "target_alias": "t",
+            },
+        )
+        .when_matched_delete(predicate="s._cdc_operation = 1")
+        .when_matched_update(updates=columns)
+        .when_not_matched_insert(updates=columns, predicate="s._cdc_operation <> 1")
+        .execute()
+    )
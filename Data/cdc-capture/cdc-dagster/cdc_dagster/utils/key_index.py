@@ -0,0 +1,70 @@
+from bisect import bisect_left
+import polars as pl
+from deltalake import DeltaTable
+from typing import List, Optional
+
+
+def build_key_index(dt: DeltaTable, key_column: str) -> dict:
+    """Build the key index of a Delta table from the min/max statistics of the add actions of its
+    loaded snapshot, no data file is read. The index is not stored, as every merge changes the files.
+
+    Returns:
+        dict: The table version, the key column and the [min, max] of the key per file.
+            A file without statistics on the key gets a None range and is always a candidate.
+    """
+    actions = pl.from_arrow(dt.get_add_actions(flatten=True))
+
+    files = {}
+    for row in actions.iter_rows(named=True):
+        key_min = row.get(f"min.{key_column}")
+        key_max = row.get(f"max.{key_column}")
+
+        # Only keys that compare like the changed keys narrow the candidates
+        if isinstance(key_min, (int, float, str)) and isinstance(key_max, (int, float, str)):
+            files[row["path"]] = [key_min, key_max]
+        else:
+            files[row["path"]] = None
+
+    return {"version": dt.version(), "key_column": key_column, "files": files}
+
+
+def get_candidate_files(index: dict, keys: pl.Series) -> List[str]:
+    """Get the files of the index that may contain any of the keys."""
+    keys = keys.drop_nulls().unique().sort().to_list()
+    if not keys:
+        return []
+
+    candidates = []
+    for path, key_range in index["files"].items():
+        if key_range is None:
+            candidates.append(path)
+            continue
+
+        # The first key >= the minimum of the file, it is a candidate when it is <= the maximum
+        position = bisect_left(keys, key_range[0])
+        if position < len(keys) and keys[position] <= key_range[1]:
+            candidates.append(path)
+
+    return candidates
+
+
+def key_range_predicate(
+    keys: pl.Series, column: str, alias: Optional[str] = "t"
+) -> Optional[str]:
+    """Get a `column >= min AND column <= max` predicate over the keys, used by Delta to skip the files
+    that cannot match (delta-rs does not prune files on a BETWEEN). None when the keys cannot be written
+    as a SQL literal. Without alias the column is not qualified."""
+    keys = keys.drop_nulls()
+    if keys.is_empty():
+        return None
+
+    literals = []
+    for value in [keys.min(), keys.max()]:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            return None
+        literals.append(
+            str(value) if isinstance(value, int) else "'" + value.replace("'", "''") + "'"
+        )
+
+    column = f'{alias}."{column}"' if alias else f'"{column}"'
+    return f"{column} >= {literals[0]} AND {column} <= {literals[1]}"
@@ -0,0 +1,111 @@
+import logging
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, List, Optional
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+# Names of the CDC operations (__$operation), update before images are not counted
+CDC_OPERATIONS = {1: "delete", 2: "insert", 4: "update"}
+
+
+@dataclass
+class CDCRunMetrics:
+    """Metrics of a single CDC asset run.
+
+    Timings are exclusive: the time spent extracting from SQL Server while a merge
+    pulls the next CDC batch is counted as `extract`, not as `merge`.
+    """
+
+    table_name: str
+    rows: dict = field(default_factory=lambda: {name: 0 for name in CDC_OPERATIONS.values()})
+    bytes_fetched: int = 0
+    timings: dict = field(default_factory=dict)
+    # How far the table was behind fn_cdc_get_max_lsn when the run started
+    lsn_lag_seconds: Optional[float] = None
+    lsn_lag_bytes: Optional[int] = None
+    _nested: List[float] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Time a stage of the run, excluding the time of the stages timed within it."""
+        start = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed - nested
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def track_batches(self, cdc_batches: Iterable[pl.DataFrame]) -> Iterator[pl.DataFrame]:
+        """Count the rows per operation and the bytes of the CDC batches, timing their extraction."""
+        iterator = iter(cdc_batches)
+        while True:
+            with self.timer("extract"):
+                cdc_df = next(iterator, None)
+
+            if cdc_df is None:
+                return
+
+            self.track_frame(cdc_df)
+            yield cdc_df
+
+    def track_frame(self, df: pl.DataFrame):
+        """Count the rows per operation (all rows as inserts for a snapshot) and the bytes of a frame."""
+        self.bytes_fetched += df.estimated_size()
+
+        if "__$operation" not in df.columns:
+            self.rows["insert"] += len(df)
+            return
+
+        for operation, count in df["__$operation"].value_counts().iter_rows():
+            if operation in CDC_OPERATIONS:
+                self.rows[CDC_OPERATIONS[operation]] += count
+
+    def to_metadata(self) -> dict:
+        """The metrics as Dagster output metadata."""
+        metadata = {
+            **{f"rows_{name}": count for name, count in self.rows.items()},
+            "bytes_fetched": self.bytes_fetched,
+            **{f"{name}_seconds": round(seconds, 3) for name, seconds in self.timings.items()},
+            "peak_rss_mb": round(get_peak_rss_mb(), 1),
+        }
+
+        if self.lsn_lag_seconds is not None:
+            metadata["lsn_lag_seconds"] = self.lsn_lag_seconds
+        if self.lsn_lag_bytes is not None:
+            metadata["lsn_lag_bytes"] = self.lsn_lag_bytes
+
+        return metadata
+
+
+def get_peak_rss_mb() -> float:
+    """Peak resident set size of the process (ru_maxrss is in KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# Hooks called with the metrics of every CDC asset run, e.g. to push them to a monitoring system
+_metrics_hooks: List[Callable[[CDCRunMetrics], None]] = []
+
+
+def register_metrics_hook(hook: Callable[[CDCRunMetrics], None]):
+    """Register a hook called with the metrics of every CDC asset run."""
+    _metrics_hooks.append(hook)
+
+
+def emit_metrics(metrics: CDCRunMetrics):
+    """Call the registered hooks, a failing hook never fails the run."""
+    for hook in _metrics_hooks:
+        try:
+            hook(metrics)
+        except Exception:
+            logger.exception(f"Metrics hook {hook!r} failed for {metrics.table_name}")
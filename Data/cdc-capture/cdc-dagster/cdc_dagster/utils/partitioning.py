@@ -0,0 +1,113 @@
+import polars as pl
+from dataclasses import dataclass
+from deltalake import DeltaTable
+from typing import List, Optional, Union
+
+PARTITION_TRANSFORMS = ("year", "month", "day", "bucket")
+
+
+@dataclass(frozen=True)
+class DeltaPartitionSpec:
+    """Partitioning of a CDC Delta table on a column derived from a source column.
+
+    - year / month / day: the date parts of a date or datetime column (e.g. `CreatedDate`)
+    - bucket: an integer key modulo `num_buckets` (e.g. `OrderID`)
+
+    The source column may change for an existing row (e.g. an order date that is corrected),
+    the update then moves the row to another partition. Merges therefore restrict the target to
+    the partitions of the changed rows and to the partitions holding their stored version
+    (see `stored_partitions`), never to the partitions of the changes only.
+    """
+
+    column: str
+    transform: str = "month"
+    num_buckets: int = 16
+
+    def __post_init__(self):
+        if self.transform not in PARTITION_TRANSFORMS:
+            raise ValueError(
+                f"Unknown partition transform '{self.transform}', expected one of {list(PARTITION_TRANSFORMS)}"
+            )
+
+    @property
+    def partition_column(self) -> str:
+        """The name of the derived partition column, e.g. `CreatedDate_month`."""
+        return f"{self.column}_{self.transform}"
+
+    def matches(self, partition_columns: List[str]) -> bool:
+        """Whether a Delta table partitioned on `partition_columns` is partitioned by this spec."""
+        return list(partition_columns) == [self.partition_column]
+
+    def expression(self) -> pl.Expr:
+        """The expression computing the partition column, strings and integers only
+        so the partition values can be written as SQL literals in merge predicates."""
+        col = pl.col(self.column)
+
+        if self.transform == "year":
+            expr = col.dt.year()
+        elif self.transform == "month":
+            expr = col.dt.strftime("%Y-%m")
+        elif self.transform == "day":
+            expr = col.dt.strftime("%Y-%m-%d")
+        else:
+            expr = col.cast(pl.Int64).abs() % self.num_buckets
+
+        return expr.alias(self.partition_column)
+
+    def with_partition_column(
+        self, df: Union[pl.DataFrame, pl.LazyFrame]
+    ) -> Union[pl.DataFrame, pl.LazyFrame]:
+        """Add (or recompute) the partition column."""
+        return df.with_columns(self.expression())
+
+    def partition_predicate(self, df: pl.DataFrame, alias: Optional[str] = "t") -> Optional[str]:
+        """Get a predicate restricting the target to the partitions of the rows in `df`,
+        which must hold the partition column. None when `df` is empty.
+        Without alias the column is not qualified."""
+        values = df[self.partition_column].unique()
+        if values.is_empty():
+            return None
+
+        column = f'{alias}."{self.partition_column}"' if alias else f'"{self.partition_column}"'
+        literals = [
+            str(value) if isinstance(value, int) else "'" + value.replace("'", "''") + "'"
+            for value in values.drop_nulls().sort().to_list()
+        ]
+
+        predicates = [f"{column} IN ({', '.join(literals)})"] if literals else []
+        if values.null_count():
+            predicates.append(f"{column} IS NULL")
+
+        return f"({' OR '.join(predicates)})"
+
+    def stored_partitions(
+        self,
+        dt: DeltaTable,
+        keys: Union[pl.DataFrame, pl.LazyFrame],
+        key_bounds: pl.Series,
+    ) -> pl.DataFrame:
+        """Get the partitions holding the stored version of the rows with `keys` (the primary key columns).
+        Only the key and partition columns of the rows within the min/max of `key_bounds` (values of the
+        first key column) are read, so Delta skips the files outside of the key range.
+
+        Returns:
+            pl.DataFrame: The distinct values of the partition column.
+        """
+        keys = keys.lazy()
+        key_columns = keys.collect_schema().names()
+        stored = pl.scan_delta(dt)
+        schema = stored.collect_schema()
+
+        key_column = pl.col(key_columns[0])
+        return (
+            stored.filter((key_column >= key_bounds.min()) & (key_column <= key_bounds.max()))
+            .select(*key_columns, self.partition_column)
+            .join(
+                keys.cast({column: schema[column] for column in key_columns}),
+                on=key_columns,
+                how="semi",
+            )
+            .select(self.partition_column)
+            .unique()
+            .collect(engine="streaming")
+        )
@@ -0,0 +1,189 @@
+import polars as pl
+import re
+from dataclasses import dataclass, field, replace
+from deltalake import DeltaTable, Field
+from typing import Optional
+
+# Polars types of the SQL Server types, as read by the reader backends
+SQL_SERVER_TYPES = {
+    "bit": pl.Boolean,
+    "tinyint": pl.UInt8,
+    "smallint": pl.Int16,
+    "int": pl.Int32,
+    "bigint": pl.Int64,
+    "real": pl.Float32,
+    "float": pl.Float64,
+    "money": pl.Decimal(19, 4),
+    "smallmoney": pl.Decimal(10, 4),
+    "date": pl.Date,
+    "time": pl.Time,
+    "datetime": pl.Datetime("us"),
+    "datetime2": pl.Datetime("us"),
+    "smalldatetime": pl.Datetime("us"),
+    "datetimeoffset": pl.Datetime("us", "UTC"),
+    "char": pl.String,
+    "varchar": pl.String,
+    "nchar": pl.String,
+    "nvarchar": pl.String,
+    "text": pl.String,
+    "ntext": pl.String,
+    "xml": pl.String,
+    "uniqueidentifier": pl.String,
+    "sql_variant": pl.String,
+    "binary": pl.Binary,
+    "varbinary": pl.Binary,
+    "image": pl.Binary,
+    "timestamp": pl.Binary,
+    "rowversion": pl.Binary,
+    "geography": pl.Binary,
+    "geometry": pl.Binary,
+    "hierarchyid": pl.Binary,
+}
+
+INTEGER_BITS = {
+    pl.Int8: 8,
+    pl.Int16: 16,
+    pl.Int32: 32,
+    pl.Int64: 64,
+    pl.UInt8: 8,
+    pl.UInt16: 16,
+    pl.UInt32: 32,
+    pl.UInt64: 64,
+}
+
+
+def sql_type_to_polars(sql_type: str) -> Optional[pl.DataType]:
+    """Get the Polars type of a SQL Server type (e.g. `decimal(18,2)`, `nvarchar(50)`), None when it is unknown."""
+    match = re.fullmatch(r"(decimal|numeric)\((\d+),(\d+)\)", sql_type)
+    if match:
+        return pl.Decimal(int(match.group(2)), int(match.group(3)))
+
+    # The length or fractional seconds precision does not change the Polars type
+    return SQL_SERVER_TYPES.get(sql_type.split("(")[0])
+
+
+def is_widening(current: pl.DataType, target: pl.DataType) -> bool:
+    """Check whether `target` holds every value of `current` without loss, and is a different type."""
+    if current == target:
+        return False
+
+    if current.is_integer() and target.is_integer():
+        # A signed type never fits in an unsigned one, an unsigned one needs an extra bit when signed
+        if current.is_signed_integer() and target.is_unsigned_integer():
+            return False
+        return INTEGER_BITS[target] > INTEGER_BITS[current]
+
+    if current.is_integer() or current == pl.Float32:
+        # Float64 holds integers of up to 53 bits exactly
+        return target == pl.Float64 and INTEGER_BITS.get(current, 32) <= 32
+
+    if isinstance(current, pl.Decimal) and isinstance(target, pl.Decimal):
+        current_precision, target_precision = current.precision or 38, target.precision or 38
+        return (
+            target.scale >= current.scale
+            and target_precision - target.scale >= current_precision - current.scale
+        )
+
+    return current == pl.Date and isinstance(target, pl.Datetime)
+
+
+@dataclass(frozen=True)
+class SchemaChanges:
+    """Changes between the schema of a Delta table and the columns captured for its table."""
+
+    # Captured columns missing from the Delta table, with their type
+    added: dict = field(default_factory=dict)
+    # Delta columns whose captured type is wider, with the wider type
+    widened: dict = field(default_factory=dict)
+    # Delta columns whose captured type is neither the same, wider nor narrower: (Delta type, SQL type)
+    incompatible: dict = field(default_factory=dict)
+    # Rows and bytes of the Delta table rewritten to widen columns, 0 without widening
+    rewritten_rows: int = 0
+    rewritten_bytes: int = 0
+
+
+def get_schema_changes(delta_schema: pl.Schema, captured_columns: dict[str, str]) -> SchemaChanges:
+    """Compare the schema of a Delta table with the captured columns of its table.
+
+    The Delta columns keep the type the reader produced, which may already be wider than the SQL Server
+    type (e.g. `Int64` for an `int` column), so only a captured type that is strictly wider is a widening.
+    Columns that are no longer captured are left in the Delta table.
+
+    Args:
+        delta_schema (pl.Schema): The schema of the Delta table
+        captured_columns (dict): The captured columns and their SQL Server type, see `get_captured_columns`
+    Returns:
+        SchemaChanges: The columns to add and to widen
+    """
+    changes = SchemaChanges()
+
+    for column, sql_type in captured_columns.items():
+        dtype = sql_type_to_polars(sql_type)
+
+        if column not in delta_schema:
+            if dtype is None:
+                raise ValueError(
+                    f"Unsupported SQL Server type '{sql_type}' of the new column '{column}'"
+                )
+            changes.added[column] = dtype
+        elif dtype is None or delta_schema[column] == pl.Null:
+            continue
+        elif is_widening(delta_schema[column], dtype):
+            changes.widened[column] = dtype
+        elif delta_schema[column] != dtype and not is_widening(dtype, delta_schema[column]):
+            changes.incompatible[column] = (delta_schema[column], sql_type)
+
+    return changes
+
+
+def evolve_delta_schema(delta_path: str, captured_columns: dict[str, str]) -> SchemaChanges:
+    """Evolve the schema of a Delta table to the captured columns of its table, without a re-snapshot.
+
+    New columns are added in place (a metadata only commit, existing rows read them as NULL).
+    delta-rs does not support type widening, so widened columns are cast in a full rewrite
+    of the Delta table (keeping its partitioning): every file is read, the table is collected
+    in memory and written again. This happens once per widening and does not read from SQL Server,
+    but costs as much as the size of the table, reported in `rewritten_rows` and `rewritten_bytes`.
+    Incompatible type changes are left to the caller, as they require a full reload.
+
+    Args:
+        delta_path (str): Path of the Delta table
+        captured_columns (dict): The captured columns and their SQL Server type, see `get_captured_columns`
+    Returns:
+        SchemaChanges: The changes that were applied, and the incompatible ones
+    """
+    dt = DeltaTable(delta_path)
+    changes = get_schema_changes(pl.scan_delta(delta_path).collect_schema(), captured_columns)
+
+    if changes.widened:
+        files = pl.from_arrow(dt.get_add_actions(flatten=True))
+        changes = replace(
+            changes,
+            rewritten_rows=int(files["num_records"].sum() or 0),
+            rewritten_bytes=int(files["size_bytes"].sum() or 0),
+        )
+        data = (
+            pl.scan_delta(delta_path)
+            .with_columns(
+                *[pl.col(column).cast(dtype) for column, dtype in changes.widened.items()],
+                *[pl.lit(None, dtype).alias(column) for column, dtype in changes.added.items()],
+            )
+            .collect(engine="streaming")
+        )
+        data.write_delta(
+            dt,
+            mode="overwrite",
+            delta_write_options={
+                "schema_mode": "overwrite",
+                "partition_by": dt.metadata().partition_columns or None,
+            },
+        )
+    elif changes.added:
+        dt.alter.add_columns(
+            [
+                Field.from_pyarrow(field)
+                for field in pl.DataFrame(schema=changes.added).to_arrow().schema
+            ]
+        )
+
+    return changes
@@ -0,0 +1,237 @@
+import math
+import os
+import tempfile
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from deltalake import DeltaTable, write_deltalake
+from typing import Iterable, List, Optional
+
+from cdc_dagster.utils.delta_helpers import collapse_cdc_changes, process_cdc_changes
+from cdc_dagster.utils.key_index import key_range_predicate
+from cdc_dagster.utils.partitioning import DeltaPartitionSpec
+
+# Column holding the hash of the primary key in the spill files
+KEY_HASH_COLUMN = "_key_hash"
+# Spill files are sorted on the key hash, small row groups let a bucket skip most of a file
+SPILL_ROW_GROUP_SIZE = 16_384
+# Memory of a bucket merge relative to its data (the join, the concatenation and the output)
+SPILL_MERGE_OVERHEAD = 3
+
+
+def with_key_hash(df: pl.DataFrame, key_schema: pl.Schema) -> pl.DataFrame:
+    """Add the hash of the primary key, on the key types of the Delta table so both sides hash alike,
+    sorted on it so the spill file can be read per hash range."""
+    return df.with_columns(
+        pl.struct(
+            [pl.col(column).cast(dtype) for column, dtype in key_schema.items()]
+        )
+        .hash(seed=0)
+        .alias(KEY_HASH_COLUMN)
+    ).sort(KEY_HASH_COLUMN)
+
+
+def affected_rows_filter(
+    key_bounds: pl.Series,
+    key_column: str,
+    partitions: Optional[pl.DataFrame],
+    partition_spec: Optional[DeltaPartitionSpec],
+) -> tuple[Optional[str], Optional[pc.Expression]]:
+    """Get the filter on the Delta rows the changes may affect, both as a Delta predicate
+    and as the equivalent Arrow expression. (None, None) when every row may be affected."""
+    predicates, expressions = [], []
+
+    range_predicate = key_range_predicate(key_bounds, key_column, alias=None)
+    if range_predicate:
+        predicates.append(range_predicate)
+        expressions.append(
+            (pc.field(key_column) >= key_bounds.min())
+            & (pc.field(key_column) <= key_bounds.max())
+        )
+
+    if partition_spec and partitions is not None:
+        predicates.append(partition_spec.partition_predicate(partitions, alias=None))
+        values = partitions[partition_spec.partition_column]
+        field = pc.field(partition_spec.partition_column)
+        expression = field.isin(values.drop_nulls().to_list())
+        if values.null_count():
+            expression = expression | field.is_null()
+        expressions.append(expression)
+
+    if not predicates:
+        return None, None
+
+    expression = expressions[0]
+    for other in expressions[1:]:
+        expression = expression & other
+
+    return " AND ".join(predicates), expression
+
+
+def spill_merge_cdc_batches(
+    delta_path: str,
+    cdc_batches: Iterable[pl.DataFrame],
+    indices: List[str],
+    memory_budget_mb: int,
+    partition_spec: Optional[DeltaPartitionSpec] = None,
+    spill_dir: Optional[str] = None,
+) -> Optional[dict]:
+    """Apply CDC batches onto a Delta table out of core, for changes larger than memory.
+
+    1. Every CDC batch is collapsed (see `collapse_cdc_changes`) and spilled to a local file,
+       sorted on the hash of its primary key.
+    2. The Delta rows the changes may affect (the key range of the changes, and their partitions along
+       with the partitions of the stored version of the changed keys) are streamed from Delta and
+       spilled the same way, in chunks of a quarter of the budget.
+    3. The key hash space is split into as many buckets as needed for a bucket to fit the budget,
+       and every bucket is merged on its own (see `process_cdc_changes`) into an output file.
+    4. The output files replace the affected rows in a single Delta commit (an overwrite with
+       the filter as predicate), so readers never see a partially applied change window.
+
+    The CDC batches are read one at a time, so they should be streamed in batches (`batch_size`)
+    that fit the budget. The spill files are removed afterwards.
+
+    Args:
+        delta_path (str): Path of the Delta table
+        cdc_batches (Iterable[pl.DataFrame]): CDC records in LSN order, with `__$operation`
+        indices (List[str]): List of column names comprising the primary key
+        memory_budget_mb (int): The memory a bucket merge should stay within
+        partition_spec (DeltaPartitionSpec, optional): The partitioning of the Delta table
+        spill_dir (str, optional): Directory of the spill files. Defaults to the system temp directory.
+    Returns:
+        dict: The metrics of the merge, None when there were no changes.
+    """
+    budget_bytes = memory_budget_mb * 1024 * 1024
+
+    dt = DeltaTable(delta_path)
+    schema = pl.scan_delta(dt).collect_schema()
+    missing_keys = [pk for pk in indices if pk not in schema]
+    if missing_keys:
+        raise ValueError(f"Missing primary key columns: {missing_keys}")
+    key_schema = pl.Schema({column: schema[column] for column in indices})
+
+    with tempfile.TemporaryDirectory(prefix="cdc_spill_", dir=spill_dir) as spill_path:
+        # 1. The CDC batches, their file order is the LSN order
+        cdc_files, cdc_bytes, num_source_rows = [], 0, 0
+        key_bounds, partitions = [], None
+        for cdc_df in cdc_batches:
+            if cdc_df.is_empty() or "__$operation" not in cdc_df.columns:
+                continue
+
+            changes = collapse_cdc_changes(cdc_df, indices)
+            if partition_spec:
+                changes = partition_spec.with_partition_column(changes)
+            changes = changes.cast(
+                {
+                    column: schema[column]
+                    for column, dtype in changes.schema.items()
+                    if column in schema and dtype != schema[column]
+                }
+            )
+
+            key_bounds.append(changes[indices[0]].min())
+            key_bounds.append(changes[indices[0]].max())
+            if partition_spec:
+                batch_partitions = changes.select(partition_spec.partition_column).unique()
+                partitions = (
+                    batch_partitions
+                    if partitions is None
+                    else pl.concat([partitions, batch_partitions]).unique()
+                )
+
+            path = os.path.join(spill_path, f"cdc_{len(cdc_files):06d}.parquet")
+            with_key_hash(changes, key_schema).write_parquet(
+                path, row_group_size=SPILL_ROW_GROUP_SIZE
+            )
+            cdc_files.append(path)
+            cdc_bytes += changes.estimated_size()
+            num_source_rows += len(changes)
+
+        if not cdc_files:
+            return None
+
+        # 2. The affected Delta rows, streamed in chunks. With a partition spec, these are the rows
+        # in the partitions of the changes and in the partitions holding the stored version of the
+        # changed keys, an update of the partition source column moves a row to another partition
+        key_bounds = pl.Series(key_bounds, dtype=schema[indices[0]])
+        if partition_spec:
+            partitions = pl.concat(
+                [
+                    partitions,
+                    partition_spec.stored_partitions(
+                        dt, pl.scan_parquet(cdc_files).select(indices), key_bounds
+                    ),
+                ],
+                how="vertical_relaxed",
+            ).unique()
+        predicate, expression = affected_rows_filter(
+            key_bounds,
+            indices[0],
+            partitions,
+            partition_spec,
+        )
+
+        delta_files, delta_bytes, num_target_rows = [], 0, 0
+        chunk, chunk_bytes = [], 0
+
+        def spill_chunk():
+            nonlocal delta_bytes, num_target_rows, chunk, chunk_bytes
+            rows = pl.from_arrow(pa.Table.from_batches(chunk)).cast(schema)
+
+            path = os.path.join(spill_path, f"delta_{len(delta_files):06d}.parquet")
+            with_key_hash(rows, key_schema).write_parquet(
+                path, row_group_size=SPILL_ROW_GROUP_SIZE
+            )
+            delta_files.append(path)
+            delta_bytes += chunk_bytes
+            num_target_rows += len(rows)
+            chunk, chunk_bytes = [], 0
+
+        for batch in dt.to_pyarrow_dataset().to_batches(filter=expression):
+            if batch.num_rows:
+                chunk.append(batch)
+                chunk_bytes += batch.nbytes
+            if chunk_bytes >= budget_bytes // 4:
+                spill_chunk()
+        if chunk:
+            spill_chunk()
+
+        # 3. Merge bucket by bucket, a bucket is a range of the key hash
+        num_buckets = max(
+            math.ceil((cdc_bytes + delta_bytes) * SPILL_MERGE_OVERHEAD / budget_bytes), 1
+        )
+        bounds = [bucket * 2**64 // num_buckets for bucket in range(num_buckets)]
+
+        output_files = []
+        for bucket, lower in enumerate(bounds):
+            in_bucket = pl.col(KEY_HASH_COLUMN) >= lower
+            if bucket + 1 < num_buckets:
+                in_bucket = in_bucket & (pl.col(KEY_HASH_COLUMN) < bounds[bucket + 1])
+
+            current = (
+                pl.scan_parquet(delta_files).filter(in_bucket).drop(KEY_HASH_COLUMN)
+                if delta_files
+                else pl.LazyFrame(schema=schema)
+            )
+            changes = pl.scan_parquet(cdc_files).filter(in_bucket).drop(KEY_HASH_COLUMN)
+
+            path = os.path.join(spill_path, f"output_{bucket:06d}.parquet")
+            process_cdc_changes(current, changes, indices).sink_parquet(path)
+            output_files.append(path)
+
+        # 4. A single commit replacing the affected rows, or appending when there were none
+        write_deltalake(
+            dt,
+            ds.dataset(output_files, format="parquet").scanner().to_reader(),
+            mode="overwrite" if num_target_rows else "append",
+            predicate=predicate if num_target_rows else None,
+            partition_by=dt.metadata().partition_columns or None,
+        )
+
+    return {
+        "num_source_rows": num_source_rows,
+        "num_target_rows_read": num_target_rows,
+        "num_spill_buckets": num_buckets,
+        "spilled_bytes": cdc_bytes + delta_bytes,
+    }
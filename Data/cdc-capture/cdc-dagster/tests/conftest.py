@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import Callable
+
+import polars as pl
+import pytest
+
+CDC_SCHEMA = {
+    "__$start_lsn": pl.Binary,
+    "__$operation": pl.Int32,
+    "id": pl.Int64,
+    "name": pl.String,
+    "created": pl.Datetime("us"),
+}
+
+
+def lsn(i: int) -> bytes:
+    return i.to_bytes(10, "big")
+
+
+@pytest.fixture
+def current() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["a", "b", "c"],
+            "created": [datetime(2025, 1, 5), datetime(2025, 2, 5), datetime(2025, 3, 5)],
+        },
+        schema={key: CDC_SCHEMA[key] for key in ["id", "name", "created"]},
+    )
+
+
+@pytest.fixture
+def cdc_changes() -> Callable[..., pl.DataFrame]:
+    """Build CDC changes as read from SQL Server, from (start LSN, operation, id, name) tuples
+    in the server order (`__$start_lsn, __$seqval`)."""
+
+    def build(*changes: tuple) -> pl.DataFrame:
+        return pl.DataFrame(
+            [
+                (lsn(start_lsn), operation, key, name, datetime(2025, key, 5))
+                for start_lsn, operation, key, name in changes
+            ],
+            schema=CDC_SCHEMA,
+            orient="row",
+        )
+
+    return build
+
+
+@pytest.fixture
+def delta_path(tmp_path, current) -> str:
+    path = str(tmp_path / "delta")
+    current.write_delta(path)
+    return path
@@ -0,0 +1,80 @@
+import pytest
+from deltalake import DeltaTable
+
+from cdc_dagster.utils.checkpoints import CheckpointStore, has_data_commit_since
+
+
+@pytest.fixture
+def store(tmp_path) -> CheckpointStore:
+    return CheckpointStore(str(tmp_path / "checkpoints.sqlite"))
+
+
+def test_commit(store, delta_path) -> None:
+    # When
+    store.commit("t_delta", "0x01", delta_path)
+    # Then
+    assert store.get_lsn("t_delta", delta_path) == "0x01"
+    assert store.get("t_delta").delta_version == 0
+    assert store.get("other_delta") is None
+
+
+def test_staged_lsn_counts_once_the_write_landed(store, delta_path, current) -> None:
+    # Given
+    store.commit("t_delta", "0x01", delta_path)
+    store.stage("t_delta", "0x02", delta_path)
+    # Then: the write did not land yet, reading changes nothing
+    assert store.get_lsn("t_delta", delta_path) == "0x01"
+    assert store.get_lsn("t_delta", delta_path) == "0x01"
+    assert store.get("t_delta").pending_lsn == "0x02"
+    # When
+    current.write_delta(delta_path, mode="append")
+    # Then
+    assert store.get_lsn("t_delta", delta_path) == "0x02"
+    assert store.get("t_delta").lsn == "0x01"
+
+
+def test_resolve_commits_a_landed_staged_lsn(store, delta_path, current) -> None:
+    # Given
+    store.commit("t_delta", "0x01", delta_path)
+    store.stage("t_delta", "0x02", delta_path)
+    current.write_delta(delta_path, mode="append")
+    # When
+    lsn = store.resolve("t_delta", delta_path)
+    # Then
+    assert lsn == "0x02"
+    assert store.get("t_delta").lsn == "0x02"
+    assert store.get("t_delta").pending_lsn is None
+
+
+def test_resolve_keeps_a_staged_lsn_that_did_not_land(store, delta_path) -> None:
+    # Given
+    store.commit("t_delta", "0x01", delta_path)
+    store.stage("t_delta", "0x02", delta_path)
+    # When
+    lsn = store.resolve("t_delta", delta_path)
+    # Then
+    assert lsn == "0x01"
+    assert store.get("t_delta").pending_lsn == "0x02"
+
+
+def test_staged_full_load(store, tmp_path, current) -> None:
+    # Given: the IO Manager creates the table after the asset returned
+    delta_path = str(tmp_path / "new")
+    store.stage("t_delta", "0x05", delta_path)
+    # Then
+    assert store.get_lsn("t_delta", delta_path) is None
+    # When
+    current.write_delta(delta_path)
+    # Then
+    assert store.get_lsn("t_delta", delta_path) == "0x05"
+
+
+def test_maintenance_is_not_a_data_commit(delta_path, current) -> None:
+    # Given
+    current.write_delta(delta_path, mode="append")
+    # When
+    DeltaTable(delta_path).optimize.compact()
+    # Then
+    assert DeltaTable(delta_path).history(1)[0]["operation"] == "OPTIMIZE"
+    assert not has_data_commit_since(delta_path, 1)
+    assert has_data_commit_since(delta_path, 0)
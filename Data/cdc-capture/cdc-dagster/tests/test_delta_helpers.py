@@ -0,0 +1,130 @@
+import polars as pl
+from deltalake import DeltaTable
+
+from cdc_dagster.utils.delta_helpers import (
+    collapse_cdc_changes,
+    merge_cdc_changes,
+    process_cdc_changes,
+)
+
+INDICES = ["id"]
+
+
+def rows(df: pl.DataFrame) -> list:
+    return df.sort("id").select("id", "name").rows()
+
+
+def test_collapse_keeps_last_change_per_key(cdc_changes) -> None:
+    # Given
+    changes = cdc_changes(
+        (10, 2, 4, "d"),
+        (11, 3, 4, "d"),
+        (11, 4, 4, "d2"),
+        (12, 1, 2, "b"),
+    )
+    # When
+    collapsed = collapse_cdc_changes(changes, INDICES)
+    # Then
+    assert collapsed.columns == ["_cdc_operation", "id", "name", "created"]
+    assert collapsed.sort("id").select("id", "_cdc_operation", "name").rows() == [
+        (2, 1, "b"),
+        (4, 4, "d2"),
+    ]
+
+
+def test_collapse_delete_then_reinsert(cdc_changes) -> None:
+    # Given
+    changes = cdc_changes((10, 2, 4, "d"), (11, 1, 4, "d"), (12, 2, 4, "d3"))
+    # When
+    collapsed = collapse_cdc_changes(changes, INDICES)
+    # Then
+    assert collapsed.select("id", "_cdc_operation", "name").rows() == [(4, 2, "d3")]
+
+
+def test_collapse_insert_then_delete(cdc_changes) -> None:
+    # Given
+    changes = cdc_changes((10, 2, 4, "d"), (11, 1, 4, "d"))
+    # When
+    collapsed = collapse_cdc_changes(changes, INDICES)
+    # Then
+    assert collapsed.select("id", "_cdc_operation").rows() == [(4, 1)]
+
+
+def test_collapse_same_lsn_keeps_server_order(cdc_changes) -> None:
+    # Given: a delete and a re-insert within one transaction, in `__$seqval` order
+    changes = cdc_changes((10, 1, 1, "a"), (10, 2, 1, "a2"), (10, 4, 1, "a3"))
+    # When
+    collapsed = collapse_cdc_changes(changes, INDICES)
+    # Then
+    assert collapsed.select("id", "_cdc_operation", "name").rows() == [(1, 4, "a3")]
+
+
+def test_collapse_sorts_on_lsn(cdc_changes) -> None:
+    # Given: changes not read in LSN order
+    changes = cdc_changes((12, 4, 1, "a3"), (11, 4, 1, "a2"))
+    # When
+    collapsed = collapse_cdc_changes(changes, INDICES)
+    # Then
+    assert collapsed.select("id", "name").rows() == [(1, "a3")]
+
+
+def test_collapse_across_batches(cdc_changes) -> None:
+    # Given: the batches are collapsed on their own, then over their concatenation in LSN order
+    first = collapse_cdc_changes(cdc_changes((10, 2, 4, "d"), (11, 4, 1, "a2")), INDICES)
+    second = collapse_cdc_changes(cdc_changes((12, 1, 4, "d"), (13, 2, 4, "d3")), INDICES)
+    third = collapse_cdc_changes(cdc_changes((14, 1, 1, "a2")), INDICES)
+    # When
+    collapsed = collapse_cdc_changes(pl.concat([first, second, third]), INDICES)
+    # Then
+    assert collapsed.sort("id").select("id", "_cdc_operation", "name").rows() == [
+        (1, 1, "a2"),
+        (4, 2, "d3"),
+    ]
+
+
+def test_process_cdc_changes(current, cdc_changes) -> None:
+    # Given
+    changes = cdc_changes(
+        (10, 4, 1, "a2"),
+        (11, 1, 2, "b"),
+        (12, 2, 4, "d"),
+        (13, 1, 3, "c"),
+        (14, 2, 3, "c2"),
+    )
+    # When
+    result = process_cdc_changes(current.lazy(), changes, INDICES).collect()
+    # Then
+    assert rows(result) == [(1, "a2"), (3, "c2"), (4, "d")]
+
+
+def test_process_cdc_changes_keeps_new_columns(current, cdc_changes) -> None:
+    # Given
+    changes = cdc_changes((10, 4, 1, "a2")).with_columns(score=pl.lit(1.5))
+    # When
+    result = process_cdc_changes(current, changes, INDICES).collect().sort("id")
+    # Then
+    assert result.columns == ["id", "name", "created", "score"]
+    assert result["score"].to_list() == [1.5, None, None]
+
+
+def test_merge_cdc_changes(delta_path, cdc_changes) -> None:
+    # Given
+    changes = cdc_changes((10, 4, 1, "a2"), (11, 1, 2, "b"), (12, 2, 4, "d"))
+    # When
+    metrics = merge_cdc_changes(delta_path, changes, INDICES)
+    # Then
+    assert metrics["num_target_rows_updated"] == 1
+    assert metrics["num_target_rows_deleted"] == 1
+    assert metrics["num_target_rows_inserted"] == 1
+    assert rows(pl.read_delta(delta_path)) == [(1, "a2"), (3, "c"), (4, "d")]
+
+
+def test_merge_cdc_changes_appends_new_keys(delta_path, cdc_changes) -> None:
+    # Given: keys outside of every file, a delete of a key that never existed
+    changes = cdc_changes((10, 2, 5, "e"), (11, 2, 6, "f"), (12, 1, 6, "f"), (13, 1, 7, "g"))
+    # When
+    metrics = merge_cdc_changes(delta_path, changes, INDICES)
+    # Then
+    assert metrics["num_target_rows_inserted"] == 1
+    assert DeltaTable(delta_path).history(1)[0]["operation"] == "WRITE"
+    assert rows(pl.read_delta(delta_path)) == [(1, "a"), (2, "b"), (3, "c"), (5, "e")]
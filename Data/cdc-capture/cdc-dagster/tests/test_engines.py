@@ -0,0 +1,136 @@
+import logging
+from datetime import datetime
+
+import polars as pl
+import pytest
+from deltalake import DeltaTable
+
+from cdc_dagster.assets.delta_assets import (
+    apply_cdc_batches,
+    merge_cdc_batches,
+    resolve_partition_spec,
+    write_delta,
+)
+from cdc_dagster.utils.partitioning import DeltaPartitionSpec
+from cdc_dagster.utils.spill import spill_merge_cdc_batches
+
+INDICES = ["id"]
+
+
+def apply_lazy(delta_path, cdc_batches, partition_spec=None):
+    new_data, _ = apply_cdc_batches(
+        pl.scan_delta(delta_path), cdc_batches, INDICES, partition_spec
+    )
+    write_delta(new_data, delta_path, "overwrite", partition_spec)
+
+
+def apply_merge(delta_path, cdc_batches, partition_spec=None):
+    merge_cdc_batches(delta_path, cdc_batches, INDICES, partition_spec)
+
+
+def apply_spill(delta_path, cdc_batches, partition_spec=None):
+    # A tiny budget, so the changes are merged in several buckets
+    spill_merge_cdc_batches(delta_path, cdc_batches, INDICES, 1, partition_spec)
+
+
+ENGINES = [apply_lazy, apply_merge, apply_spill]
+
+
+def rows(delta_path) -> list:
+    return pl.read_delta(delta_path).sort("id").select("id", "name").rows()
+
+
+@pytest.fixture
+def cdc_batches(cdc_changes) -> list:
+    """Batches in LSN order, with keys changed across batches and within a single LSN."""
+    return [
+        cdc_changes((10, 4, 1, "a2"), (11, 2, 4, "d"), (11, 4, 4, "d2")),
+        cdc_changes(),
+        cdc_changes((12, 1, 4, "d2"), (13, 1, 2, "b"), (13, 2, 2, "b2")),
+        cdc_changes((14, 2, 4, "d3"), (15, 1, 3, "c"), (16, 4, 1, "a3")),
+    ]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine(engine, delta_path, cdc_batches) -> None:
+    # When
+    engine(delta_path, iter(cdc_batches))
+    # Then
+    assert rows(delta_path) == [(1, "a3"), (2, "b2"), (4, "d3")]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_is_idempotent(engine, delta_path, cdc_batches) -> None:
+    # Given: a run that failed before its checkpoint is replayed
+    engine(delta_path, iter(cdc_batches))
+    # When
+    engine(delta_path, iter(cdc_batches))
+    # Then
+    assert rows(delta_path) == [(1, "a3"), (2, "b2"), (4, "d3")]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_partitioned(engine, tmp_path, current, cdc_batches) -> None:
+    # Given
+    partition_spec = DeltaPartitionSpec("created", "month")
+    delta_path = str(tmp_path / "partitioned")
+    write_delta(
+        partition_spec.with_partition_column(current), delta_path, "overwrite", partition_spec
+    )
+    # When
+    engine(delta_path, iter(cdc_batches), partition_spec)
+    # Then
+    assert DeltaTable(delta_path).metadata().partition_columns == ["created_month"]
+    assert rows(delta_path) == [(1, "a3"), (2, "b2"), (4, "d3")]
+    assert pl.read_delta(delta_path).sort("id")["created_month"].to_list() == [
+        "2025-01",
+        "2025-02",
+        "2025-04",
+    ]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_moves_a_row_to_another_partition(engine, tmp_path, current, cdc_changes) -> None:
+    # Given
+    partition_spec = DeltaPartitionSpec("created", "month")
+    delta_path = str(tmp_path / "partitioned")
+    write_delta(
+        partition_spec.with_partition_column(current), delta_path, "overwrite", partition_spec
+    )
+    # An update of the partition source column
+    cdc_batches = [cdc_changes((10, 4, 1, "a2")).with_columns(created=datetime(2025, 6, 5))]
+    # When
+    engine(delta_path, iter(cdc_batches), partition_spec)
+    # Then: the row left its former partition
+    assert pl.read_delta(delta_path).sort("id").select("id", "name", "created_month").rows() == [
+        (1, "a2", "2025-06"),
+        (2, "b", "2025-02"),
+        (3, "c", "2025-03"),
+    ]
+
+
+def test_apply_cdc_batches_without_changes(current, cdc_changes) -> None:
+    # When
+    new_data, has_changes = apply_cdc_batches(current.lazy(), [cdc_changes()], INDICES)
+    # Then
+    assert not has_changes
+    assert new_data.equals(current)
+
+
+def test_resolve_partition_spec(tmp_path, delta_path, current) -> None:
+    # Given
+    partition_spec = DeltaPartitionSpec("created", "month")
+    partitioned_path = str(tmp_path / "partitioned")
+    write_delta(
+        partition_spec.with_partition_column(current),
+        partitioned_path,
+        "overwrite",
+        partition_spec,
+    )
+    log = logging.getLogger(__name__)
+    # Then
+    assert resolve_partition_spec(log, partition_spec, "T", partitioned_path) == partition_spec
+    assert resolve_partition_spec(log, partition_spec, "T", str(tmp_path / "new")) == partition_spec
+    # An existing table without the partitioning is written without the spec
+    assert resolve_partition_spec(log, partition_spec, "T", delta_path) is None
+    assert resolve_partition_spec(log, None, "T", delta_path) is None
@@ -0,0 +1,34 @@
+import polars as pl
+from deltalake import DeltaTable
+
+from cdc_dagster.utils.key_index import (
+    build_key_index,
+    get_candidate_files,
+    key_range_predicate,
+)
+
+
+def test_candidate_files(tmp_path) -> None:
+    # Given: one file per key range
+    delta_path = str(tmp_path / "delta")
+    pl.DataFrame({"id": [1, 2, 3]}).write_delta(delta_path)
+    pl.DataFrame({"id": [10, 20]}).write_delta(delta_path, mode="append")
+    index = build_key_index(DeltaTable(delta_path), "id")
+    # Then
+    assert index["version"] == 1
+    assert len(index["files"]) == 2
+    assert len(get_candidate_files(index, pl.Series([2]))) == 1
+    assert len(get_candidate_files(index, pl.Series([2, 15]))) == 2
+    assert get_candidate_files(index, pl.Series([5, 30])) == []
+    assert get_candidate_files(index, pl.Series([None], dtype=pl.Int64)) == []
+
+
+def test_key_range_predicate() -> None:
+    # Then
+    assert key_range_predicate(pl.Series([3, 1, 2]), "id") == 't."id" >= 1 AND t."id" <= 3'
+    assert (
+        key_range_predicate(pl.Series(["b", "o'c"]), "code", alias=None)
+        == "\"code\" >= 'b' AND \"code\" <= 'o''c'"
+    )
+    assert key_range_predicate(pl.Series([1.5]), "id") is None
+    assert key_range_predicate(pl.Series([], dtype=pl.Int64), "id") is None
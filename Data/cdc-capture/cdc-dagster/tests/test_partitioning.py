@@ -0,0 +1,49 @@
+from datetime import date
+
+import polars as pl
+import pytest
+
+from cdc_dagster.utils.partitioning import DeltaPartitionSpec
+
+
+def test_partition_column() -> None:
+    # Given
+    df = pl.DataFrame({"id": [-5, 17], "created": [date(2025, 1, 31), None]})
+    # Then
+    assert DeltaPartitionSpec("created", "month").with_partition_column(df)[
+        "created_month"
+    ].to_list() == ["2025-01", None]
+    assert DeltaPartitionSpec("created", "year").with_partition_column(df)[
+        "created_year"
+    ].to_list() == [2025, None]
+    assert DeltaPartitionSpec("id", "bucket", 4).with_partition_column(df)[
+        "id_bucket"
+    ].to_list() == [1, 1]
+
+
+def test_partition_predicate() -> None:
+    # Given
+    partition_spec = DeltaPartitionSpec("created", "month")
+    df = partition_spec.with_partition_column(
+        pl.DataFrame({"created": [date(2025, 2, 1), date(2025, 1, 1), None]})
+    )
+    # Then
+    assert (
+        partition_spec.partition_predicate(df)
+        == "(t.\"created_month\" IN ('2025-01', '2025-02') OR t.\"created_month\" IS NULL)"
+    )
+    assert partition_spec.partition_predicate(df.head(0)) is None
+
+
+def test_matches() -> None:
+    # Given
+    partition_spec = DeltaPartitionSpec("created", "month")
+    # Then
+    assert partition_spec.matches(["created_month"])
+    assert not partition_spec.matches([])
+    assert not partition_spec.matches(["created_year"])
+
+
+def test_unknown_transform() -> None:
+    with pytest.raises(ValueError):
+        DeltaPartitionSpec("created", "week")
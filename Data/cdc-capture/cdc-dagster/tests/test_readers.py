@@ -0,0 +1,21 @@
+import pytest
+
+from cdc_dagster.resources.readers import SQLAlchemyReader, SQLServerReader, create_reader
+
+
+def test_reader_missing_a_method() -> None:
+    # Given
+    class BatchOnlyReader(SQLServerReader):
+        def iter_batches(self, query, parameters=None, batch_size=10000):
+            yield from []
+
+    # Then: the reader fails when it is built, not in the middle of a run
+    with pytest.raises(TypeError):
+        BatchOnlyReader(None)
+
+
+def test_create_reader() -> None:
+    # Then
+    assert isinstance(create_reader("sqlalchemy", None), SQLAlchemyReader)
+    with pytest.raises(ValueError):
+        create_reader("bcp", None)
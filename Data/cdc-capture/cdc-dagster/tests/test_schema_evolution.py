@@ -0,0 +1,27 @@
+import polars as pl
+
+from cdc_dagster.utils.schema_evolution import evolve_delta_schema
+
+
+def test_added_column_is_not_a_rewrite(delta_path) -> None:
+    # When
+    changes = evolve_delta_schema(
+        delta_path, {"id": "bigint", "name": "nvarchar(50)", "score": "int"}
+    )
+    # Then
+    assert changes.added == {"score": pl.Int32}
+    assert changes.rewritten_rows == 0
+    assert pl.read_delta(delta_path)["score"].to_list() == [None, None, None]
+
+
+def test_widened_column_reports_the_rewrite(tmp_path) -> None:
+    # Given
+    delta_path = str(tmp_path / "delta")
+    pl.DataFrame({"id": [1, 2]}, schema={"id": pl.Int32}).write_delta(delta_path)
+    # When
+    changes = evolve_delta_schema(delta_path, {"id": "bigint"})
+    # Then
+    assert changes.widened == {"id": pl.Int64}
+    assert changes.rewritten_rows == 2
+    assert changes.rewritten_bytes > 0
+    assert pl.read_delta(delta_path).schema["id"] == pl.Int64
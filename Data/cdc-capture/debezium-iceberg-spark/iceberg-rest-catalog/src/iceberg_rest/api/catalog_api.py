@@ -1,11 +1,15 @@
+import base64
+import binascii
+import hashlib
 from fastapi import APIRouter, Depends
 from typing import Any, Dict, Optional, Union
 
-from fastapi import Body, Path, Query
+from fastapi import Body, Header, Path, Query, Response
 from pydantic import BaseModel, Field, StrictStr
 
 from iceberg_rest.catalog import get_catalog
 from iceberg_rest.exception import IcebergHTTPException
+from iceberg_rest.settings import settings
 from pyiceberg.table import TableIdentifier
 from pyiceberg.table.metadata import TableMetadata
 from pyiceberg.exceptions import (
@@ -107,16 +111,43 @@ def list_namespaces(
         description="An optional namespace, underneath which to list namespaces. If not provided or empty, all top-level namespaces should be listed. If parent is a multipart namespace, the parts must be separated by the unit separator (&#x60;0x1F&#x60;) byte.",
         alias="parent",
     ),
+    page_token: Optional[str] = Query(
+        None,
+        description="An opaque token which allows clients to make use of pagination for list APIs (e.g. ListTables). Clients may initiate the first paginated request by sending an empty query parameter `pageToken` to the server. Servers that support pagination should identify the `pageToken` parameter and return a `next-page-token` in the response if there are more results available.  After the initial request, the value of `next-page-token` from each response must be used as the `pageToken` parameter value for the next request. The server must return `null` value for the `next-page-token` in the last response. Servers that support pagination must return all results in a single response with the value of `next-page-token` set to `null` if the query parameter `pageToken` is not set in the request. Servers that do not support pagination should ignore the `pageToken` parameter and return all results in a single response. The `next-page-token` must be omitted from the response. Clients must interpret either `null` or missing response value of `next-page-token` as the end of the listing results.",
+        alias="pageToken",
+    ),
+    page_size: Optional[int] = Query(
+        None,
+        ge=1,
+        description="For servers that support pagination, this signals an upper bound of the number of results that a client will receive. For servers that do not support pagination, clients may receive results larger than the indicated `pageSize`.",
+        alias="pageSize",
+    ),
     catalog: Catalog = Depends(get_catalog),
 ) -> ListNamespacesResponse:
     """List all namespaces at a certain level, optionally starting from a given parent namespace. If table accounting.tax.paid.info exists, using &#39;SELECT NAMESPACE IN accounting&#39; would translate into &#x60;GET /namespaces?parent&#x3D;accounting&#x60; and must return a namespace, [\&quot;accounting\&quot;, \&quot;tax\&quot;] only. Using &#39;SELECT NAMESPACE IN accounting.tax&#39; would translate into &#x60;GET /namespaces?parent&#x3D;accounting%1Ftax&#x60; and must return a namespace, [\&quot;accounting\&quot;, \&quot;tax\&quot;, \&quot;paid\&quot;]. If &#x60;parent&#x60; is not provided, all top-level namespaces should be listed."""
-    try:
-        namespaces = catalog.list_namespaces(parent)
-    except NoSuchNamespaceError:
-        raise IcebergHTTPException(
-            status_code=404, detail=f"Namespace does not exist: {parent}"
-        )
-    return ListNamespacesResponse(namespaces=namespaces)
+    if page_token is None and page_size is None:
+        next_page_token = None
+        try:
+            namespaces = catalog.list_namespaces(parent)
+        except NoSuchNamespaceError:
+            raise IcebergHTTPException(
+                status_code=404, detail=f"Namespace does not exist: {parent}"
+            )
+    else:
+        try:
+            namespaces, after = catalog.list_namespaces_page(
+                parent or (),
+                page_size=page_size or settings.CATALOG_LIST_PAGE_SIZE,
+                after=_decode_page_token(page_token),
+            )
+        except NoSuchNamespaceError:
+            raise IcebergHTTPException(
+                status_code=404, detail=f"Namespace does not exist: {parent}"
+            )
+        next_page_token = _encode_page_token(after)
+    return ListNamespacesResponse(
+        namespaces=namespaces, next_page_token=next_page_token
+    )
 
 
 # /v1/{prefix}/namespaces/{namespace}
@@ -245,11 +276,29 @@ def list_tables(
         ...,
         description="A namespace identifier as a single string. Multipart namespace parts should be separated by the unit separator (&#x60;0x1F&#x60;) byte.",
     ),
+    page_token: Optional[str] = Query(
+        None,
+        description="An opaque token which allows clients to make use of pagination for list APIs (e.g. ListTables). Clients may initiate the first paginated request by sending an empty query parameter `pageToken` to the server. Servers that support pagination should identify the `pageToken` parameter and return a `next-page-token` in the response if there are more results available.  After the initial request, the value of `next-page-token` from each response must be used as the `pageToken` parameter value for the next request. The server must return `null` value for the `next-page-token` in the last response. Servers that support pagination must return all results in a single response with the value of `next-page-token` set to `null` if the query parameter `pageToken` is not set in the request. Servers that do not support pagination should ignore the `pageToken` parameter and return all results in a single response. The `next-page-token` must be omitted from the response. Clients must interpret either `null` or missing response value of `next-page-token` as the end of the listing results.",
+        alias="pageToken",
+    ),
+    page_size: Optional[int] = Query(
+        None,
+        ge=1,
+        description="For servers that support pagination, this signals an upper bound of the number of results that a client will receive. For servers that do not support pagination, clients may receive results larger than the indicated `pageSize`.",
+        alias="pageSize",
+    ),
     catalog: Catalog = Depends(get_catalog),
 ) -> ListTablesResponse:
     """Return all table identifiers under this namespace"""
     try:
-        identifiers = catalog.list_tables(namespace=namespace)
+        if page_token is None and page_size is None:
+            identifiers, after = catalog.list_tables(namespace=namespace), None
+        else:
+            identifiers, after = catalog.list_tables_page(
+                namespace=namespace,
+                page_size=page_size or settings.CATALOG_LIST_PAGE_SIZE,
+                after=_decode_page_token(page_token),
+            )
     except NoSuchNamespaceError:
         raise IcebergHTTPException(
             status_code=404, detail=f"Namespace does not exist: {namespace}"
@@ -258,7 +307,28 @@ def list_tables(
         TableIdentifier(namespace=[identifier[0]], name=identifier[1])
         for identifier in identifiers
     ]
-    return ListTablesResponse(identifiers=table_identifiers)
+    return ListTablesResponse(
+        identifiers=table_identifiers, next_page_token=_encode_page_token(after)
+    )
+
+
+def _encode_page_token(after: Optional[str]) -> Optional[str]:
+    """Page token of the page starting after the key `after`, None after the last page."""
+    if after is None:
+        return None
+    return base64.urlsafe_b64encode(after.encode()).decode()
+
+
+def _decode_page_token(page_token: Optional[str]) -> Optional[str]:
+    """Key a page starts after, None for the first page (no or an empty page token)."""
+    if not page_token:
+        return None
+    try:
+        return base64.b64decode(page_token, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise IcebergHTTPException(
+            status_code=400, detail=f"Invalid page token: {page_token}"
+        )
 
 
 class LoadTableResult(BaseModel):
@@ -274,6 +344,17 @@ class LoadTableResult(BaseModel):
     config: Optional[Dict[str, StrictStr]] = None
 
 
+def _metadata_etag(metadata_location: str) -> str:
+    """Strong ETag of a table version, a metadata file is never rewritten in place."""
+    return f'"{hashlib.sha256(metadata_location.encode()).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header with an ETag, as required for GET."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
 @router.post(
     "/v1/namespaces/{namespace}/tables",
     tags=["Catalog API"],
@@ -404,23 +485,41 @@ def register_table(
     summary="Load a table from the catalog",
     response_model_by_alias=True,
     response_model_exclude_none=True,
+    responses={304: {"description": "Not Modified"}},
 )
 def load_table(
+    response: Response,
     namespace: str = Path(
         ...,
         description="A namespace identifier as a single string. Multipart namespace parts should be separated by the unit separator (&#x60;0x1F&#x60;) byte.",
     ),
     table: str = Path(..., description="A table name"),
+    if_none_match: Optional[str] = Header(
+        None,
+        description="An optional header which allows the server to return 304 (Not Modified) if the metadata is current. The content is the value of the ETag received in a CreateTableResponse or LoadTableResponse.",
+        alias="If-None-Match",
+    ),
     catalog: Catalog = Depends(get_catalog),
 ) -> LoadTableResult:
     """Load a table from the catalog.  The response contains both configuration and table metadata. The configuration, if non-empty is used as additional configuration for the table that overrides catalog configuration. For example, this configuration may change the FileIO implementation to be used for the table.  The response also contains the table&#39;s full metadata, matching the table metadata JSON file.  The catalog configuration may contain credentials that should be used for subsequent requests for the table. The configuration key \&quot;token\&quot; is used to pass an access token to be used as a bearer token for table requests. Otherwise, a token may be passed using a RFC 8693 token type as a configuration key. For example, \&quot;urn:ietf:params:oauth:token-type:jwt&#x3D;&lt;JWT-token&gt;\&quot;."""
+    identifier = (namespace, table)
+    if if_none_match:
+        # The client may already have the current version, answer from the metadata location alone
+        metadata_location = catalog.get_metadata_location(identifier)
+        if metadata_location is None:
+            raise IcebergHTTPException(
+                status_code=404, detail=f"Table does not exist: {identifier}"
+            )
+        etag = _metadata_etag(metadata_location)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
     try:
-        identifier = (namespace, table)
         tbl = catalog.load_table(identifier=identifier)
     except NoSuchTableError:
         raise IcebergHTTPException(
             status_code=404, detail=f"Table does not exist: {identifier}"
         )
+    response.headers["ETag"] = _metadata_etag(tbl.metadata_location)
     return LoadTableResult(
         metadata_location=tbl.metadata_location,
         metadata=tbl.metadata,
@@ -600,6 +699,17 @@ def list_views(
         ...,
         description="A namespace identifier as a single string. Multipart namespace parts should be separated by the unit separator (&#x60;0x1F&#x60;) byte.",
     ),
+    page_token: Optional[str] = Query(
+        None,
+        description="An opaque token which allows clients to make use of pagination for list APIs (e.g. ListTables). Clients may initiate the first paginated request by sending an empty query parameter `pageToken` to the server. Servers that support pagination should identify the `pageToken` parameter and return a `next-page-token` in the response if there are more results available.  After the initial request, the value of `next-page-token` from each response must be used as the `pageToken` parameter value for the next request. The server must return `null` value for the `next-page-token` in the last response. Servers that support pagination must return all results in a single response with the value of `next-page-token` set to `null` if the query parameter `pageToken` is not set in the request. Servers that do not support pagination should ignore the `pageToken` parameter and return all results in a single response. The `next-page-token` must be omitted from the response. Clients must interpret either `null` or missing response value of `next-page-token` as the end of the listing results.",
+        alias="pageToken",
+    ),
+    page_size: Optional[int] = Query(
+        None,
+        ge=1,
+        description="For servers that support pagination, this signals an upper bound of the number of results that a client will receive. For servers that do not support pagination, clients may receive results larger than the indicated `pageSize`.",
+        alias="pageSize",
+    ),
 ) -> ListTablesResponse:
     # (TODO): implement this!
     """Return all view identifiers under this namespace"""
@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from pyiceberg.table.metadata import TableMetadata
+
+
+class MetadataCache:
+    """LRU cache of parsed table metadata, keyed by metadata location.
+
+    A metadata file is never rewritten in place, every commit writes a new one,
+    so an entry stays valid for as long as the catalog points at its location.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, TableMetadata] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, metadata_location: str) -> Optional[TableMetadata]:
+        with self._lock:
+            metadata = self._entries.get(metadata_location)
+            if metadata is not None:
+                self._entries.move_to_end(metadata_location)
+            return metadata
+
+    def put(self, metadata_location: str, metadata: TableMetadata) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[metadata_location] = metadata
+            self._entries.move_to_end(metadata_location)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, metadata_location: Optional[str]) -> None:
+        if metadata_location is None:
+            return
+        with self._lock:
+            self._entries.pop(metadata_location, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
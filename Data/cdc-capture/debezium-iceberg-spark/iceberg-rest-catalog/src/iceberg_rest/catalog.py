@@ -1,5 +1,34 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from iceberg_rest.cache import MetadataCache
 from iceberg_rest.settings import settings
-from pyiceberg.catalog.sql import SqlCatalog
+from pyiceberg.catalog import Catalog as PyIcebergCatalog
+from pyiceberg.catalog.sql import IcebergNamespaceProperties, IcebergTables, SqlCatalog
+from pyiceberg.exceptions import NoSuchNamespaceError
+from pyiceberg.table import CommitTableResponse, Table
+from pyiceberg.table.update import TableRequirement, TableUpdate
+from pyiceberg.typedef import Identifier
+from sqlalchemy import ColumnElement, Select, create_engine, func, make_url, select, union
+from sqlalchemy.orm import Session
+
+
+# Namespace levels are separated by this character in the namespace sort key, it sorts
+# before any character of a namespace name so a namespace is directly followed by its children
+NAMESPACE_SORT_SEPARATOR = "\x01"
+
+# Collations comparing strings by code point, as Python does. The default collations of Postgres
+# (glibc, ICU) and MySQL ignore control characters, which breaks the order of the sort keys.
+# SQLite compares by code point already.
+BINARY_COLLATIONS = {"postgresql": "C", "mysql": "utf8mb4_bin"}
+
+
+def _namespace_sort_key(namespace: str) -> str:
+    return namespace.replace(".", NAMESPACE_SORT_SEPARATOR)
+
+
+def _after_namespace(namespace: Identifier) -> str:
+    """Sort key after a namespace and all of its descendants."""
+    return _namespace_sort_key(".".join(namespace)) + chr(ord(NAMESPACE_SORT_SEPARATOR) + 1)
 
 
 class Catalog:
@@ -11,9 +40,221 @@ class Catalog:
         return cls.instance
 
 
+class CachingSqlCatalog(SqlCatalog):
+    """SqlCatalog that keeps the parsed table metadata in memory.
+
+    Loading a table still reads its current metadata location from the database,
+    only reading and parsing the metadata file is skipped when it is cached.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        metadata_cache: MetadataCache,
+        engine_options: Optional[Dict[str, Any]] = None,
+        **properties: str,
+    ):
+        self.metadata_cache = metadata_cache
+        super().__init__(name, **properties)
+        if engine_options:
+            # SqlCatalog only sets pre-ping on its engine, rebuild it with the tuned connection pool
+            self.engine.dispose()
+            self.engine = create_engine(self.engine.url, echo=self.engine.echo, **engine_options)
+
+    def _convert_orm_to_iceberg(self, orm_table: IcebergTables) -> Table:
+        metadata_location = orm_table.metadata_location
+        metadata = self.metadata_cache.get(metadata_location) if metadata_location else None
+        if metadata is None:
+            table = super()._convert_orm_to_iceberg(orm_table)
+            self.metadata_cache.put(table.metadata_location, table.metadata)
+            return table
+
+        return Table(
+            identifier=PyIcebergCatalog.identifier_to_tuple(orm_table.table_namespace)
+            + (orm_table.table_name,),
+            metadata=metadata,
+            metadata_location=metadata_location,
+            io=self._load_file_io(metadata.properties, metadata_location),
+            catalog=self,
+        )
+
+    def get_metadata_location(self, identifier: Union[str, Identifier]) -> Optional[str]:
+        """Current metadata location of a table, None when the table does not exist."""
+        namespace = PyIcebergCatalog.namespace_to_string(
+            PyIcebergCatalog.namespace_from(identifier)
+        )
+        with Session(self.engine) as session:
+            return session.scalar(
+                select(IcebergTables.metadata_location).where(
+                    IcebergTables.catalog_name == self.name,
+                    IcebergTables.table_namespace == namespace,
+                    IcebergTables.table_name == PyIcebergCatalog.table_name_from(identifier),
+                )
+            )
+
+    def commit_table(
+        self,
+        table: Table,
+        requirements: Tuple[TableRequirement, ...],
+        updates: Tuple[TableUpdate, ...],
+    ) -> CommitTableResponse:
+        previous_location = self.get_metadata_location(table.name())
+        response = super().commit_table(table, requirements, updates)
+        if response.metadata_location != previous_location:
+            self.metadata_cache.invalidate(previous_location)
+        # The committed metadata is what the next load of the table returns
+        self.metadata_cache.put(response.metadata_location, response.metadata)
+        return response
+
+    def drop_table(self, identifier: Union[str, Identifier]) -> None:
+        metadata_location = self.get_metadata_location(identifier)
+        super().drop_table(identifier)
+        self.metadata_cache.invalidate(metadata_location)
+
+    def rename_table(
+        self, from_identifier: Union[str, Identifier], to_identifier: Union[str, Identifier]
+    ) -> Table:
+        metadata_location = self.get_metadata_location(from_identifier)
+        table = super().rename_table(from_identifier, to_identifier)
+        if table.metadata_location != metadata_location:
+            self.metadata_cache.invalidate(metadata_location)
+        return table
+
+    def list_tables_page(
+        self, namespace: Union[str, Identifier], page_size: int, after: Optional[str] = None
+    ) -> Tuple[List[Identifier], Optional[str]]:
+        """List a page of the tables of a namespace, in table name order.
+
+        Args:
+            namespace (str | Identifier): Namespace identifier to search.
+            page_size (int): Maximum number of tables to return.
+            after (str, optional): Table name the page starts after, None for the first page.
+
+        Returns:
+            Tuple[List[Identifier], Optional[str]]: The table identifiers, and the table name
+                the next page starts after, None on the last page.
+        """
+        if not self._namespace_exists(namespace):
+            raise NoSuchNamespaceError(f"Namespace does not exist: {namespace}")
+
+        namespace_str = PyIcebergCatalog.namespace_to_string(namespace)
+        stmt = (
+            select(IcebergTables.table_name)
+            .where(
+                IcebergTables.catalog_name == self.name,
+                IcebergTables.table_namespace == namespace_str,
+            )
+            .order_by(IcebergTables.table_name)
+            .limit(page_size + 1)
+        )
+        if after is not None:
+            stmt = stmt.where(IcebergTables.table_name > after)
+        with Session(self.engine) as session:
+            table_names = list(session.scalars(stmt))
+
+        identifiers = [
+            PyIcebergCatalog.identifier_to_tuple(namespace_str) + (table_name,)
+            for table_name in table_names[:page_size]
+        ]
+        return identifiers, table_names[page_size - 1] if len(table_names) > page_size else None
+
+    def list_namespaces_page(
+        self, namespace: Union[str, Identifier], page_size: int, after: Optional[str] = None
+    ) -> Tuple[List[Identifier], Optional[str]]:
+        """List a page of the namespaces under a namespace, in namespace sort key order.
+
+        The namespaces are stored as strings of all their levels, on table rows and
+        namespace property rows, so the children of `namespace` are the distinct prefixes
+        of the stored namespaces one level below it. In sort key order the descendants of
+        a namespace directly follow it, so the children come in order and the descendants
+        of a child are skipped by starting the next query after them.
+
+        Args:
+            namespace (str | Identifier): Namespace identifier to search, empty for the top level.
+            page_size (int): Maximum number of namespaces to return.
+            after (str, optional): Sort key the page starts after, None for the first page.
+
+        Returns:
+            Tuple[List[Identifier], Optional[str]]: The namespace identifiers, and the sort key
+                the next page starts after, None on the last page.
+        """
+        if namespace and not self._namespace_exists(namespace):
+            raise NoSuchNamespaceError(f"Namespace does not exist: {namespace}")
+
+        parent = PyIcebergCatalog.identifier_to_tuple(namespace) if namespace else ()
+
+        def stored_namespaces(column: ColumnElement[str], catalog_name: ColumnElement[str]) -> Select:
+            stmt = select(column.label("namespace")).where(catalog_name == self.name)
+            if parent:
+                # The descendants of the parent sort between `<parent>.` and `<parent>/`,
+                # a range of the primary key of the table
+                prefix = PyIcebergCatalog.namespace_to_string(parent)
+                stored = self._binary_collation(column)
+                stmt = stmt.where(stored > prefix + ".", stored < prefix + "/")
+            return stmt
+
+        namespaces = union(
+            stored_namespaces(IcebergTables.table_namespace, IcebergTables.catalog_name),
+            stored_namespaces(
+                IcebergNamespaceProperties.namespace, IcebergNamespaceProperties.catalog_name
+            ),
+        ).subquery()
+        sort_key = self._binary_collation(
+            func.replace(namespaces.c.namespace, ".", NAMESPACE_SORT_SEPARATOR)
+        )
+
+        stmt = select(namespaces.c.namespace).order_by(sort_key)
+
+        level = len(parent) + 1
+        children: List[Identifier] = []
+        with Session(self.engine) as session:
+            while len(children) <= page_size:
+                page_stmt = stmt.limit(page_size + 1 - len(children))
+                if after is not None:
+                    page_stmt = page_stmt.where(sort_key > after)
+                stored = list(session.scalars(page_stmt))
+                if not stored:
+                    break
+
+                for stored_namespace in stored:
+                    child = PyIcebergCatalog.identifier_to_tuple(stored_namespace)[:level]
+                    if not children or children[-1] != child:
+                        children.append(child)
+                # Skip the descendants of the last child that are left
+                after = _after_namespace(children[-1])
+
+        if len(children) > page_size:
+            return children[:page_size], _after_namespace(children[page_size - 1])
+        return children, None
+
+    def _binary_collation(self, expression: ColumnElement[str]) -> ColumnElement[str]:
+        """Compare and sort `expression` by code point on the backend of the catalog."""
+        collation = BINARY_COLLATIONS.get(self.engine.dialect.name)
+        return expression.collate(collation) if collation else expression
+
+    def destroy_tables(self) -> None:
+        super().destroy_tables()
+        self.metadata_cache.clear()
+
+
+def _engine_options() -> Dict[str, Any]:
+    if make_url(settings.CATALOG_JDBC_URI).get_backend_name() == "sqlite":
+        # SQLite serializes its writers, the default SQLAlchemy pool suits it
+        return {}
+    return {
+        "pool_size": settings.CATALOG_JDBC_POOL_SIZE,
+        "max_overflow": settings.CATALOG_JDBC_MAX_OVERFLOW,
+        "pool_timeout": settings.CATALOG_JDBC_POOL_TIMEOUT,
+        "pool_recycle": settings.CATALOG_JDBC_POOL_RECYCLE,
+        "pool_pre_ping": settings.CATALOG_JDBC_POOL_PRE_PING,
+    }
+
+
 def _create_catalog():
-    catalog = SqlCatalog(
+    catalog = CachingSqlCatalog(
         settings.CATALOG_NAME,
+        metadata_cache=MetadataCache(settings.CATALOG_METADATA_CACHE_SIZE),
+        engine_options=_engine_options(),
         **{
             "uri": settings.CATALOG_JDBC_URI,
             "warehouse": settings.CATALOG_WAREHOUSE,
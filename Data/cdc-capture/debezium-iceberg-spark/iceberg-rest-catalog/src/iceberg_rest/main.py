@@ -1,11 +1,24 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
+from anyio import to_thread
 from fastapi import FastAPI
 from iceberg_rest.api.catalog_api import router as CatalogApiRouter
 from iceberg_rest.exception import IcebergHTTPException, iceberg_http_exception_handler
+from iceberg_rest.settings import settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The routes are sync and run on the AnyIO worker threads, size them for the connection pool
+    to_thread.current_default_thread_limiter().total_tokens = (
+        settings.CATALOG_THREADPOOL_SIZE
+    )
+    yield
 
 
 def create_app():
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.include_router(CatalogApiRouter)
     app.add_exception_handler(IcebergHTTPException, iceberg_http_exception_handler)
     return app
@@ -14,4 +27,10 @@ def create_app():
 app = create_app()
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Workers need the app as an import string, every worker process creates its own catalog
+    uvicorn.run(
+        "iceberg_rest.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=settings.CATALOG_WORKERS,
+    )
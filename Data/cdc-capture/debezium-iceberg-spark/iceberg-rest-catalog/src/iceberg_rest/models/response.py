@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 
 from pyiceberg.table import TableIdentifier
 from pyiceberg.table.metadata import TableMetadata
@@ -24,7 +24,13 @@ class ListNamespacesResponse(BaseModel):
     ListNamespacesResponse
     """  # noqa: E501
 
-    # next_page_token: Optional[StrictStr] = Field(default=None, description="An opaque token which allows clients to make use of pagination for a list API (e.g. ListTables). Clients will initiate the first paginated request by sending an empty `pageToken` e.g. `GET /tables?pageToken` or `GET /tables?pageToken=` signaling to the service that the response should be paginated. Servers that support pagination will recognize `pageToken` and return a `next-page-token` in response if there are more results available. After the initial request, it is expected that the value of `next-page-token` from the last response is used in the subsequent request. Servers that do not support pagination will ignore `next-page-token` and return all results.", alias="next-page-token")
+    model_config = ConfigDict(populate_by_name=True)
+
+    next_page_token: Optional[StrictStr] = Field(
+        default=None,
+        description="An opaque token which allows clients to make use of pagination for a list API (e.g. ListTables). Clients will initiate the first paginated request by sending an empty `pageToken` e.g. `GET /tables?pageToken` or `GET /tables?pageToken=` signaling to the service that the response should be paginated. Servers that support pagination will recognize `pageToken` and return a `next-page-token` in response if there are more results available. After the initial request, it is expected that the value of `next-page-token` from the last response is used in the subsequent request. Servers that do not support pagination will ignore `next-page-token` and return all results.",
+        alias="next-page-token",
+    )
     namespaces: Optional[List[List[StrictStr]]] = None
 
 
@@ -62,6 +68,8 @@ class ListTablesResponse(BaseModel):
     ListTablesResponse
     """  # noqa: E501
 
+    model_config = ConfigDict(populate_by_name=True)
+
     next_page_token: Optional[StrictStr] = Field(
         default=None,
         description="An opaque token which allows clients to make use of pagination for a list API (e.g. ListTables). Clients will initiate the first paginated request by sending an empty `pageToken` e.g. `GET /tables?pageToken` or `GET /tables?pageToken=` signaling to the service that the response should be paginated. Servers that support pagination will recognize `pageToken` and return a `next-page-token` in response if there are more results available. After the initial request, it is expected that the value of `next-page-token` from the last response is used in the subsequent request. Servers that do not support pagination will ignore `next-page-token` and return all results.",
@@ -24,6 +24,28 @@ class Settings(BaseSettings):
     CATALOG_JDBC_USER: str = Field(default="user")
     CATALOG_JDBC_PASSWORD: str = Field(default="password")
 
+    # Connection pool settings, per worker process (not applied to SQLite)
+    CATALOG_JDBC_POOL_SIZE: int = Field(default=10, ge=1)
+    CATALOG_JDBC_MAX_OVERFLOW: int = Field(default=20, ge=0)
+    CATALOG_JDBC_POOL_TIMEOUT: float = Field(default=30.0, gt=0)
+    # Seconds after which a connection is replaced, -1 keeps connections forever
+    CATALOG_JDBC_POOL_RECYCLE: int = Field(default=1800, ge=-1)
+    CATALOG_JDBC_POOL_PRE_PING: bool = Field(default=True)
+
+    # Concurrency settings
+    # Number of server processes, each with its own connection pool and metadata cache
+    CATALOG_WORKERS: int = Field(default=1, ge=1)
+    # Threads serving the requests of a worker, the routes run the blocking catalog calls on them
+    CATALOG_THREADPOOL_SIZE: int = Field(default=40, ge=1)
+
+    # Cache settings
+    # Number of parsed table metadata files kept in memory, 0 disables the cache
+    CATALOG_METADATA_CACHE_SIZE: int = Field(default=256, ge=0)
+
+    # Pagination settings
+    # Page size of the list routes when the client asks for pages without a page size
+    CATALOG_LIST_PAGE_SIZE: int = Field(default=1000, ge=1)
+
     # S3 settings
     AWS_ACCESS_KEY_ID: str = Field(default="admin")
     AWS_SECRET_ACCESS_KEY: str = Field(default="password")
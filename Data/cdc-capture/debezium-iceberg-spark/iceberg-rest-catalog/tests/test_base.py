@@ -256,6 +256,31 @@ def test_load_table_from_self_identifier(catalog: Catalog) -> None:
     assert table == given_table
 
 
+def test_load_table_not_modified(catalog: Catalog) -> None:
+    # Given
+    given_catalog_has_a_table(catalog)
+    url = f"{REST_ENDPOINT}v1/namespaces/{TEST_TABLE_NAMESPACE[0]}/tables/{TEST_TABLE_NAME}"
+    etag = requests.get(url).headers["ETag"]
+    # When
+    response = requests.get(url, headers={"If-None-Match": etag})
+    # Then
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_load_table_modified(catalog: Catalog) -> None:
+    # Given
+    given_catalog_has_a_table(catalog)
+    url = f"{REST_ENDPOINT}v1/namespaces/{TEST_TABLE_NAMESPACE[0]}/tables/{TEST_TABLE_NAME}"
+    # When
+    response = requests.get(url, headers={"If-None-Match": '"stale"'})
+    # Then
+    assert response.status_code == 200
+    assert response.headers["ETag"] != '"stale"'
+    assert response.json()["metadata"]
+
+
 def test_table_raises_error_on_table_not_found(catalog: Catalog) -> None:
     with pytest.raises(NoSuchTableError, match=NO_SUCH_TABLE_ERROR):
         catalog.load_table(TEST_TABLE_IDENTIFIER)
@@ -400,6 +425,22 @@ def test_list_namespaces(catalog: Catalog) -> None:
     assert TEST_TABLE_NAMESPACE in namespaces
 
 
+def test_list_namespaces_paginated(catalog: Catalog) -> None:
+    # Given
+    namespaces = ["a", "a.b", "a.c", "a-b", "b", "c"]
+    for namespace in namespaces:
+        catalog.create_namespace(namespace)
+    url = f"{REST_ENDPOINT}v1/namespaces"
+    # When
+    pages, page_token = [], ""
+    while page_token is not None:
+        response = requests.get(url, params={"pageToken": page_token, "pageSize": 2})
+        pages.append(response.json()["namespaces"])
+        page_token = response.json().get("next-page-token")
+    # Then
+    assert pages == [[["a"], ["a-b"]], [["b"], ["c"]]]
+
+
 def test_drop_namespace(catalog: Catalog) -> None:
     # Given
     catalog.create_namespace(TEST_TABLE_NAMESPACE, TEST_TABLE_PROPERTIES)
@@ -449,6 +490,25 @@ def test_list_tables_under_a_namespace(catalog: Catalog) -> None:
     assert new_namespace_tables == []
 
 
+def test_list_tables_paginated(catalog: Catalog) -> None:
+    # Given
+    catalog.create_namespace(TEST_TABLE_NAMESPACE)
+    table_names = [f"{TEST_TABLE_NAME}_{i}" for i in range(5)]
+    for table_name in table_names:
+        catalog.create_table(
+            identifier=(TEST_TABLE_NAMESPACE[0], table_name), schema=TEST_TABLE_SCHEMA
+        )
+    url = f"{REST_ENDPOINT}v1/namespaces/{TEST_TABLE_NAMESPACE[0]}/tables"
+    # When
+    pages, page_token = [], ""
+    while page_token is not None:
+        response = requests.get(url, params={"pageToken": page_token, "pageSize": 2})
+        pages.append([identifier["name"] for identifier in response.json()["identifiers"]])
+        page_token = response.json().get("next-page-token")
+    # Then
+    assert pages == [table_names[0:2], table_names[2:4], table_names[4:]]
+
+
 def test_update_namespace_metadata(catalog: Catalog) -> None:
     # Given
     catalog.create_namespace(TEST_TABLE_NAMESPACE, TEST_TABLE_PROPERTIES)
@@ -0,0 +1,51 @@
+from iceberg_rest.cache import MetadataCache
+
+METADATA_LOCATION_1 = "file:///tmp/warehouse/default/my_table/metadata/00000.metadata.json"
+METADATA_LOCATION_2 = "file:///tmp/warehouse/default/my_table/metadata/00001.metadata.json"
+METADATA_LOCATION_3 = "file:///tmp/warehouse/default/my_table/metadata/00002.metadata.json"
+
+
+def test_metadata_cache_get() -> None:
+    # Given
+    cache = MetadataCache(maxsize=2)
+    metadata = object()
+    # When
+    cache.put(METADATA_LOCATION_1, metadata)
+    # Then
+    assert cache.get(METADATA_LOCATION_1) is metadata
+    assert cache.get(METADATA_LOCATION_2) is None
+
+
+def test_metadata_cache_evicts_least_recently_used() -> None:
+    # Given
+    cache = MetadataCache(maxsize=2)
+    cache.put(METADATA_LOCATION_1, object())
+    cache.put(METADATA_LOCATION_2, object())
+    # When
+    cache.get(METADATA_LOCATION_1)
+    cache.put(METADATA_LOCATION_3, object())
+    # Then
+    assert len(cache) == 2
+    assert cache.get(METADATA_LOCATION_1) is not None
+    assert cache.get(METADATA_LOCATION_2) is None
+    assert cache.get(METADATA_LOCATION_3) is not None
+
+
+def test_metadata_cache_invalidate() -> None:
+    # Given
+    cache = MetadataCache(maxsize=2)
+    cache.put(METADATA_LOCATION_1, object())
+    # When
+    cache.invalidate(METADATA_LOCATION_1)
+    cache.invalidate(None)
+    # Then
+    assert cache.get(METADATA_LOCATION_1) is None
+
+
+def test_metadata_cache_disabled() -> None:
+    # Given
+    cache = MetadataCache(maxsize=0)
+    # When
+    cache.put(METADATA_LOCATION_1, object())
+    # Then
+    assert len(cache) == 0
@@ -0,0 +1,91 @@
+import os
+from pathlib import PosixPath
+from typing import Generator, List, Optional
+
+import pytest
+from iceberg_rest.cache import MetadataCache
+from iceberg_rest.catalog import CachingSqlCatalog
+from pyiceberg.catalog.sql import IcebergTables
+from pyiceberg.typedef import Identifier
+from sqlalchemy.orm import Session
+
+# Postgres sorts with the collation of the database (e.g. en_US.UTF-8), set to also run the tests on it
+POSTGRES_URI = os.environ.get("TEST_CATALOG_POSTGRES_URI")
+
+NAMESPACES = [("a",), ("a-x",), ("b",), ("b", "c"), ("b", "c", "d"), ("b", "e"), ("b_z",), ("c",)]
+# Namespaces only holding tables, without properties
+TABLE_NAMESPACES = ["a.q", "z.y", "b.f"]
+
+
+@pytest.fixture(
+    params=[
+        "sqlite",
+        pytest.param(
+            "postgres",
+            marks=pytest.mark.skipif(
+                POSTGRES_URI is None, reason="TEST_CATALOG_POSTGRES_URI is not set"
+            ),
+        ),
+    ]
+)
+def catalog(request: pytest.FixtureRequest, tmp_path: PosixPath) -> Generator[CachingSqlCatalog, None, None]:
+    uri = f"sqlite:///{tmp_path}/catalog.db" if request.param == "sqlite" else POSTGRES_URI
+    catalog = CachingSqlCatalog(
+        "test_pagination", metadata_cache=MetadataCache(0), uri=uri, warehouse=f"file://{tmp_path}"
+    )
+    catalog.create_tables()
+    for namespace in NAMESPACES:
+        catalog.create_namespace(namespace)
+    with Session(catalog.engine) as session:
+        for table_namespace in TABLE_NAMESPACES:
+            session.add(
+                IcebergTables(
+                    catalog_name=catalog.name,
+                    table_namespace=table_namespace,
+                    table_name="t",
+                    metadata_location=None,
+                    previous_metadata_location=None,
+                )
+            )
+        session.commit()
+    yield catalog
+    catalog.destroy_tables()
+
+
+def list_all_pages(catalog: CachingSqlCatalog, namespace: Identifier, page_size: int) -> List[List[Identifier]]:
+    pages = []
+    after: Optional[str] = None
+    while True:
+        page, after = catalog.list_namespaces_page(namespace, page_size, after)
+        pages.append(page)
+        if after is None:
+            return pages
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 100])
+def test_list_namespaces_page(catalog: CachingSqlCatalog, page_size: int) -> None:
+    # When
+    pages = list_all_pages(catalog, (), page_size)
+    # Then
+    assert [namespace for page in pages for namespace in page] == [
+        ("a",),
+        ("a-x",),
+        ("b",),
+        ("b_z",),
+        ("c",),
+        ("z",),
+    ]
+    assert all(len(page) <= page_size for page in pages)
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 100])
+def test_list_namespaces_page_children(catalog: CachingSqlCatalog, page_size: int) -> None:
+    # When
+    pages = list_all_pages(catalog, ("b",), page_size)
+    # Then
+    assert [namespace for page in pages for namespace in page] == [
+        ("b", "c"),
+        ("b", "e"),
+        ("b", "f"),
+    ]
+    assert list_all_pages(catalog, ("b", "c", "d"), page_size) == [[]]